@@ -9,15 +9,67 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-# flake8: noqa: F403
+# The package public names are resolved on first access (PEP 562) in order
+# to keep `import holidays` cheap: neither the holidays machinery nor the
+# entity lazy loaders are set up until they are actually needed.
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from holidays.constants import *
-from holidays.holiday_base import *
 from holidays.registry import EntityLoader
-from holidays.utils import *
+
+if TYPE_CHECKING:
+    # The public names are visible to type checkers as they used to be.
+    from holidays.constants import *  # noqa: F401, F403
+    from holidays.holiday_base import *  # noqa: F401, F403
+    from holidays.utils import *  # noqa: F401, F403
 
 __version__ = "0.33"
 
+# Modules whose public names are re-exported by the package.
+_EXPORTING_MODULES = ("holidays.constants", "holidays.holiday_base", "holidays.utils")
+
+
+def _get_public_names(module: Any) -> List[str]:
+    """Return names exported by `from module import *`."""
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith("_")]
+
+    return list(names)
+
+
+def __getattr__(name: str) -> Any:
+    scope = globals()
+    value: Any
+
+    entity_path = EntityLoader.get_entity_paths().get(name)
+    if entity_path is not None:
+        value = scope[name] = EntityLoader(entity_path)
+        return value
+
+    if name == "__all__":
+        value = scope[name] = sorted(
+            {
+                public_name
+                for module_name in _EXPORTING_MODULES
+                for public_name in _get_public_names(importlib.import_module(module_name))
+            }.union(EntityLoader.get_entity_paths(), ("EntityLoader",))
+        )
+        return value
+
+    for module_name in _EXPORTING_MODULES:
+        module = importlib.import_module(module_name)
+        if name in _get_public_names(module):
+            value = scope[name] = getattr(module, name)
+            return value
+
+    # Submodules imported as a side effect of the above are set as attributes.
+    if name in scope:
+        return scope[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-EntityLoader.load("countries", globals())
-EntityLoader.load("financial", globals())
+def __dir__() -> List[str]:
+    return sorted(set(globals()).union(__getattr__("__all__")))
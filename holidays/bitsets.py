@@ -0,0 +1,279 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""Calendar algebra over date bitsets.
+
+A :class:`DateBitset` is a set of dates within a range of years stored as a
+single integer: every year takes 366 bits, bit ``n`` of a year is set if its
+``n``-th (0-based) day is in the set (the last bit of non-leap years is never
+set). Unions, intersections, differences and counts of dates are computed for
+all the years at once, which makes combining many calendars cheap, e.g. the
+days any of 40 markets is closed or the business days common to all of them.
+"""
+
+__all__ = ("DateBitset",)
+
+from calendar import isleap
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator
+
+from holidays.holiday_base import DateLike, _get_date
+
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
+
+YEAR_BITS = 366
+
+# `int.bit_count()` is available since Python 3.10.
+_popcount: Any = getattr(int, "bit_count", lambda bits: bin(bits).count("1"))
+
+
+@lru_cache(maxsize=None)
+def _get_days_bits(year: int) -> int:
+    """Return the bitset of all the days of the year."""
+    return (1 << (366 if isleap(year) else 365)) - 1
+
+
+@lru_cache(maxsize=None)
+def _get_range_bits(start_year: int, end_year: int) -> int:
+    """Return the bitset of all the days of the years range."""
+    bits = 0
+    for year in range(end_year, start_year - 1, -1):
+        bits = (bits << YEAR_BITS) | _get_days_bits(year)
+
+    return bits
+
+
+@lru_cache(maxsize=None)
+def _get_weekend_bits(weekend: frozenset, year: int) -> int:
+    """Return the bitset of the weekend days of the year."""
+    weekday = date(year, 1, 1).weekday()
+    week_bits = sum(1 << day for day in range(7) if (weekday + day) % 7 in weekend)
+    # Multiplying by a number having every 7th bit set repeats the week bits.
+    return week_bits * sum(1 << (week * 7) for week in range(53)) & _get_days_bits(year)
+
+
+class DateBitset:
+    """
+    A set of dates of a range of years (both included) stored as a bitset.
+
+    Bitsets support the ``|`` (union), ``&`` (intersection), ``-``
+    (difference), ``^`` (symmetric difference) and ``~`` (complement within
+    the years range) operators, membership tests, iteration in date order and
+    ``len()``. Operands must cover the same years range.
+
+    Example:
+
+    >>> from holidays import country_holidays
+    >>> from holidays.bitsets import DateBitset
+    >>> calendars = [country_holidays(code) for code in ("DE", "GB", "US")]
+    >>> any_holidays = DateBitset.union(
+    ...     *(DateBitset.from_holidays(h, 2020, 2029) for h in calendars))
+    >>> all_business_days = DateBitset.intersection(
+    ...     *(DateBitset.business_days(h, 2020, 2029) for h in calendars))
+    >>> all_business_days.count(date(2024, 1, 1), date(2024, 12, 31))
+    243
+    """
+
+    __slots__ = ("bits", "end_year", "start_year")
+
+    def __init__(self, start_year: int, end_year: int, bits: int = 0) -> None:
+        """
+        :param start_year:
+            The first year of the range.
+
+        :param end_year:
+            The last year of the range.
+
+        :param bits:
+            The dates bitset, see the module documentation for its layout.
+        """
+        if start_year > end_year:
+            raise ValueError("Start year must be less than or equal to end year.")
+
+        self.start_year = start_year
+        self.end_year = end_year
+        self.bits = bits & _get_range_bits(start_year, end_year)
+
+    def __and__(self, other: "DateBitset") -> "DateBitset":
+        self._check_range(other)
+        return DateBitset(self.start_year, self.end_year, self.bits & other.bits)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        dt = _get_date(key)
+        if not self.start_year <= dt.year <= self.end_year:
+            return False
+
+        return bool(self.bits >> self._get_position(dt) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateBitset):
+            return NotImplemented
+
+        return (self.start_year, self.end_year, self.bits) == (
+            other.start_year,
+            other.end_year,
+            other.bits,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.start_year, self.end_year, self.bits))
+
+    def __invert__(self) -> "DateBitset":
+        return DateBitset(
+            self.start_year,
+            self.end_year,
+            self.bits ^ _get_range_bits(self.start_year, self.end_year),
+        )
+
+    def __iter__(self) -> Iterator[date]:
+        bits = self.bits
+        while bits:
+            position = (bits & -bits).bit_length() - 1
+            bits &= bits - 1
+            year, day = divmod(position, YEAR_BITS)
+            yield date.fromordinal(date(self.start_year + year, 1, 1).toordinal() + day)
+
+    def __len__(self) -> int:
+        return _popcount(self.bits)
+
+    def __or__(self, other: "DateBitset") -> "DateBitset":
+        self._check_range(other)
+        return DateBitset(self.start_year, self.end_year, self.bits | other.bits)
+
+    def __repr__(self) -> str:
+        return f"DateBitset({self.start_year}, {self.end_year}, {len(self)} dates)"
+
+    def __sub__(self, other: "DateBitset") -> "DateBitset":
+        self._check_range(other)
+        return DateBitset(self.start_year, self.end_year, self.bits & ~other.bits)
+
+    def __xor__(self, other: "DateBitset") -> "DateBitset":
+        self._check_range(other)
+        return DateBitset(self.start_year, self.end_year, self.bits ^ other.bits)
+
+    def _check_range(self, other: "DateBitset") -> None:
+        if not isinstance(other, DateBitset):
+            raise TypeError(f"Unsupported operand type: '{type(other).__name__}'.")
+        if (self.start_year, self.end_year) != (other.start_year, other.end_year):
+            raise ValueError("Bitsets must cover the same years range.")
+
+    def _get_position(self, dt: date) -> int:
+        return (dt.year - self.start_year) * YEAR_BITS + (
+            dt.toordinal() - date(dt.year, 1, 1).toordinal()
+        )
+
+    @classmethod
+    def business_days(
+        cls, holidays: "HolidayBase", start_year: int, end_year: int
+    ) -> "DateBitset":
+        """Return the bitset of the holidays object business days (neither
+        weekend nor holiday) of the years range. The weekend days of each year
+        are the ones the holidays object has for that year."""
+        bitset = cls.from_holidays(holidays, start_year, end_year)
+        weekend_bits = 0
+        for year in range(end_year, start_year - 1, -1):
+            weekend_bits = (weekend_bits << YEAR_BITS) | _get_weekend_bits(
+                holidays._get_weekend(year), year
+            )
+
+        return ~(bitset | cls(start_year, end_year, weekend_bits))
+
+    def count(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of dates within the dates range (both included).
+
+        The range is clipped to the bitset years range.
+        """
+        dt_start = max(_get_date(start), date(self.start_year, 1, 1))
+        dt_end = min(_get_date(end), date(self.end_year, 12, 31))
+        if dt_start > dt_end:
+            return 0
+
+        bits = self.bits >> self._get_position(dt_start)
+        length = self._get_position(dt_end) - self._get_position(dt_start) + 1
+        return _popcount(bits & ((1 << length) - 1))
+
+    def count_by_year(self) -> Dict[int, int]:
+        """Return the number of dates of each year of the range."""
+        mask = (1 << YEAR_BITS) - 1
+        bits = self.bits
+        counts = {}
+        for year in range(self.start_year, self.end_year + 1):
+            counts[year] = _popcount(bits & mask)
+            bits >>= YEAR_BITS
+
+        return counts
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[DateLike], start_year: int, end_year: int) -> "DateBitset":
+        """Return the bitset of the dates within the years range, other dates
+        are ignored."""
+        bitset = cls(start_year, end_year)
+        bits = 0
+        for key in dates:
+            dt = _get_date(key)
+            if start_year <= dt.year <= end_year:
+                bits |= 1 << bitset._get_position(dt)
+        bitset.bits = bits
+
+        return bitset
+
+    @classmethod
+    def from_holidays(
+        cls, holidays: "HolidayBase", start_year: int, end_year: int
+    ) -> "DateBitset":
+        """Return the bitset of the holidays object dates within the years
+        range.
+
+        The years bitsets are cached by the holidays object until it's
+        modified; objects with ``expand=True`` calculate missing years.
+        """
+        bitset = cls(start_year, end_year)
+        bits = 0
+        for year in range(end_year, start_year - 1, -1):
+            bits = (bits << YEAR_BITS) | holidays._get_year_bits(year)
+        bitset.bits = bits
+
+        return bitset
+
+    @classmethod
+    def from_weekend(cls, weekend: Iterable[int], start_year: int, end_year: int) -> "DateBitset":
+        """Return the bitset of the weekend days (week days numbers as in
+        :attr:`HolidayBase.weekend`) of the years range."""
+        weekend = frozenset(weekend)
+        bits = 0
+        for year in range(end_year, start_year - 1, -1):
+            bits = (bits << YEAR_BITS) | _get_weekend_bits(weekend, year)
+
+        return cls(start_year, end_year, bits)
+
+    @staticmethod
+    def intersection(bitset: "DateBitset", *bitsets: "DateBitset") -> "DateBitset":
+        """Return the bitset of the dates present in all the bitsets."""
+        for other in bitsets:
+            bitset &= other
+
+        return bitset
+
+    @staticmethod
+    def union(bitset: "DateBitset", *bitsets: "DateBitset") -> "DateBitset":
+        """Return the bitset of the dates present in any of the bitsets."""
+        for other in bitsets:
+            bitset |= other
+
+        return bitset
@@ -46,6 +46,9 @@ class Sweden(HolidayBase, ChristianHolidays, InternationalHolidays):
         InternationalHolidays.__init__(self)
         super().__init__(*args, **kwargs)
 
+    def _get_population_cache_key(self, year):
+        return super()._get_population_cache_key(year) + (self.include_sundays,)
+
     def _populate(self, year):
         super()._populate(year)
 
@@ -9,18 +9,45 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-__all__ = ("DateLike", "HolidayBase", "HolidaySum")
+__all__ = ("DateLike", "FrozenHolidays", "HolidayBase", "HolidaySum")
 
 import copy
+import copyreg
+import heapq
+import itertools
+import os
 import re
+import sys
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right
 from calendar import isleap
-from datetime import date, datetime, timedelta, timezone
-from gettext import NullTranslations, gettext, translation
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta, timezone
+from functools import lru_cache
+from gettext import NullTranslations, find, gettext, translation
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union, cast
-
-from dateutil.parser import parse
+from threading import Lock, RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    ValuesView,
+    cast,
+)
 
 from holidays.calendars import gregorian
 from holidays.calendars.gregorian import (
@@ -47,6 +74,743 @@ SubstitutedHoliday = Union[
 
 gettext = gettext
 
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
+ParseInfo = namedtuple("ParseInfo", ("hits", "misses", "maxsize", "currsize", "slow_parses"))
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+# Holidays populated for a year along with the object attributes set while
+# populating them (e.g. a weekend changed by year).
+_PopulatedYear = Tuple[Tuple[Tuple[date, str], ...], Tuple[Tuple[str, Any], ...]]
+
+
+class _PopulationCache:
+    """A process-wide LRU cache of the holidays populated for a year."""
+
+    def __init__(self) -> None:
+        self.data: "OrderedDict[Tuple[Any, ...], _PopulatedYear]" = OrderedDict()
+        self.hits = 0
+        self.lock = Lock()
+        self.maxsize = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[_PopulatedYear]:
+        with self.lock:
+            value = self.data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.data.move_to_end(key)
+
+            return value
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def resize(self, maxsize: int) -> None:
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.data) > maxsize:
+                self.data.popitem(last=False)
+
+    def set(self, key: Tuple[Any, ...], value: _PopulatedYear) -> None:
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+
+_population_cache = _PopulationCache()
+
+# Process-wide source of holidays modification numbers: a modification
+# number is never reused, so an index built before a concurrent modification
+# is never taken for an up to date one.
+_modifications = itertools.count(1)
+
+# Attributes of the detached copies populating holidays for the cache, they
+# aren't copied back to the object.
+_DETACHED_ATTRIBUTES = frozenset(
+    (
+        "expand",
+        "years",
+        "_modification",
+        "_pending_years",
+        "_sorted_dates",
+        "_storage",
+        "_years_lru",
+    )
+)
+
+
+def _join_names(value: str, name: str) -> str:
+    """Return the value with the holiday name(s) added, names are sorted
+    alphabetically. Unlike :meth:`_NameTable.add_name` nothing is interned."""
+    names = set(value.split(HOLIDAY_NAME_DELIMITER))
+    names.update(name.split(HOLIDAY_NAME_DELIMITER))
+    return HOLIDAY_NAME_DELIMITER.join(sorted(names))
+
+
+class _NameTable:
+    """Holiday names interned per entity class and translation, shared by all
+    the objects, so that each distinct (translated) name is stored only once.
+    Only names produced by the entities are interned, names set by users are
+    not (the table never shrinks).
+
+    Names of dates with multiple holidays are kept as tuples of name ids
+    along with their joined name, so that adding a name to a date doesn't
+    require splitting and joining strings again.
+    """
+
+    __slots__ = ("_joined_ids", "_name_ids", "_translations", "ids", "lock", "names")
+
+    def __init__(self) -> None:
+        self._joined_ids: Dict[Tuple[int, ...], int] = {}
+        self._name_ids: Dict[int, Tuple[int, ...]] = {}
+        self._translations: Dict[str, str] = {}
+        self.ids: Dict[str, int] = {}
+        self.lock = Lock()
+        self.names: List[str] = []
+
+    def _get_name_ids(self, name_id: int) -> Tuple[int, ...]:
+        """Return the sorted ids of the holiday names joined into the name."""
+        try:
+            return self._name_ids[name_id]
+        except KeyError:
+            name_ids = tuple(
+                self.get_id(name)
+                for name in sorted(set(self.names[name_id].split(HOLIDAY_NAME_DELIMITER)))
+            )
+            self._name_ids[name_id] = name_ids
+            return name_ids
+
+    def add_name(self, value: str, name: str) -> str:
+        """Return the value with the holiday name(s) added, names are sorted
+        alphabetically."""
+        value_ids = self._get_name_ids(self.get_id(value))
+        names = self.names
+        name_ids = tuple(
+            sorted(
+                set(value_ids).union(self._get_name_ids(self.get_id(name))),
+                key=names.__getitem__,
+            )
+        )
+        try:
+            return names[self._joined_ids[name_ids]]
+        except KeyError:
+            joined_id = self.get_id(
+                HOLIDAY_NAME_DELIMITER.join(names[joined_id] for joined_id in name_ids)
+            )
+            self._joined_ids[name_ids] = joined_id
+            self._name_ids.setdefault(joined_id, name_ids)
+            return names[joined_id]
+
+    def get_names(self, value: str) -> Tuple[str, ...]:
+        """Return the sorted holiday names joined into the value, only values
+        set by users (not interned) are split."""
+        try:
+            name_ids = self._get_name_ids(self.ids[value])
+        except KeyError:
+            return tuple(sorted(set(value.split(HOLIDAY_NAME_DELIMITER))))
+
+        names = self.names
+        return tuple(names[name_id] for name_id in name_ids)
+
+    def get_id(self, name: str) -> int:
+        try:
+            return self.ids[name]
+        except KeyError:
+            with self.lock:
+                if name not in self.ids:
+                    # The name must be available before its id is.
+                    self.names.append(name)
+                    self.ids[name] = len(self.names) - 1
+
+                return self.ids[name]
+
+    def intern(self, name: str) -> str:
+        """Return the shared copy of the name."""
+        return self.names[self.get_id(name)]
+
+    def translate(self, name: str, tr: Callable[[str], str]) -> str:
+        """Return the shared copy of the name translated with the entity's
+        translation method."""
+        try:
+            return self._translations[name]
+        except KeyError:
+            translated = self.intern(tr(name))
+            self._translations[name] = translated
+            return translated
+
+
+_name_tables: Dict[Tuple[type, Tuple[str, ...]], _NameTable] = {}
+
+_LOCALE_DIR = str(Path(__file__).with_name("locale"))
+
+_translations: Dict[
+    Tuple[str, Optional[str], Tuple[str, ...]], Tuple[NullTranslations, Tuple[str, ...]]
+] = {}
+
+
+def _get_translation(
+    domain: str, language: Optional[str] = None
+) -> Tuple[NullTranslations, Tuple[str, ...]]:
+    """Return the translation of the entity holiday names into the language
+    along with the translation files used.
+
+    The translations are cached per process, so that the locale directory is
+    only looked up once. If the language is not given, the translation is
+    chosen by the environment variables the same way :func:`gettext.find`
+    does (they're a part of the cache key).
+    """
+    environment_languages: Tuple[str, ...] = ()
+    if language is None:
+        for variable in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"):
+            value = os.environ.get(variable)
+            if value:
+                environment_languages = tuple(value.split(":"))
+                break
+
+    key = (domain, language, environment_languages)
+    try:
+        return _translations[key]
+    except KeyError:
+        languages = [language] if language is not None else None
+        translator = translation(
+            domain, fallback=language is None, languages=languages, localedir=_LOCALE_DIR
+        )
+        return _translations.setdefault(
+            key, (translator, tuple(find(domain, _LOCALE_DIR, languages, all=True)))
+        )
+
+
+class _CompactDates(Sequence[date]):
+    """A read-only sorted dates sequence backed by an array of ordinals."""
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(self, ordinals: "array[int]") -> None:
+        self._ordinals = ordinals
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [date.fromordinal(ordinal) for ordinal in self._ordinals[index]]
+
+        return date.fromordinal(self._ordinals[index])
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+
+class _CompactStorage:
+    """Holidays storage for ``compact=True`` objects.
+
+    Dates are kept as a sorted array of ordinals along with an array of their
+    name ids in the entity :class:`_NameTable`; :class:`datetime.date`
+    objects are only created when requested. Names not interned by the table
+    (e.g. set by users) are kept by the storage itself, their ids are
+    negative: ``~n`` is the id of the ``n``-th one. The data is replaced
+    rather than modified in place, so that lookups never see it half updated.
+    """
+
+    __slots__ = ("_data", "_name_table")
+
+    def __init__(
+        self, name_table: _NameTable, ordinals: Iterable[int] = (), names: Iterable[str] = ()
+    ) -> None:
+        self._name_table = name_table
+        local_names: Tuple[str, ...] = ()
+        name_ids = array("i")
+        for name in names:
+            name_id, local_names = self._get_name_id(name, local_names)
+            name_ids.append(name_id)
+        self._data = (array("i", ordinals), name_ids, local_names)
+
+    def __contains__(self, dt: date) -> bool:
+        ordinals = self._data[0]
+        ordinal = dt.toordinal()
+        idx = bisect_left(ordinals, ordinal)
+        return idx < len(ordinals) and ordinals[idx] == ordinal
+
+    def __delitem__(self, dt: date) -> None:
+        ordinals, name_ids, local_names = self._data
+        idx = self._get_index(ordinals, dt)
+        self._data = (
+            ordinals[:idx] + ordinals[idx + 1 :],
+            name_ids[:idx] + name_ids[idx + 1 :],
+            local_names,
+        )
+
+    def __getitem__(self, dt: date) -> str:
+        ordinals, name_ids, local_names = self._data
+        return self._get_name(name_ids[self._get_index(ordinals, dt)], local_names)
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._data[0])
+
+    def __len__(self) -> int:
+        return len(self._data[0])
+
+    def __setitem__(self, dt: date, name: str) -> None:
+        ordinals, name_ids, local_names = self._data
+        ordinal = dt.toordinal()
+        name_id, local_names = self._get_name_id(name, local_names)
+        idx = bisect_left(ordinals, ordinal)
+        if idx < len(ordinals) and ordinals[idx] == ordinal:
+            name_ids = array("i", name_ids)
+            name_ids[idx] = name_id
+            self._data = (ordinals, name_ids, local_names)
+        else:
+            self._data = (
+                ordinals[:idx] + array("i", (ordinal,)) + ordinals[idx:],
+                name_ids[:idx] + array("i", (name_id,)) + name_ids[idx:],
+                local_names,
+            )
+
+    @staticmethod
+    def _get_index(ordinals: "array[int]", dt: date) -> int:
+        ordinal = dt.toordinal()
+        idx = bisect_left(ordinals, ordinal)
+        if idx == len(ordinals) or ordinals[idx] != ordinal:
+            raise KeyError(dt)
+
+        return idx
+
+    def _get_name(self, name_id: int, local_names: Tuple[str, ...]) -> str:
+        return self._name_table.names[name_id] if name_id >= 0 else local_names[~name_id]
+
+    def _get_name_id(self, name: str, local_names: Tuple[str, ...]) -> Tuple[int, Tuple[str, ...]]:
+        """Return the name id along with the storage names (extended with the
+        name unless it's interned or already kept)."""
+        name_id = self._name_table.ids.get(name)
+        if name_id is not None:
+            return name_id, local_names
+
+        if name in local_names:
+            return ~local_names.index(name), local_names
+
+        return ~len(local_names), local_names + (name,)
+
+    def clear(self) -> None:
+        self._data = (array("i"), array("i"), ())
+
+    def export(self) -> Tuple["array[int]", Tuple[str, ...]]:
+        """Return the date ordinals and names (name ids are only valid within
+        the process)."""
+        ordinals, name_ids, local_names = self._data
+        return ordinals, tuple(self._get_name(name_id, local_names) for name_id in name_ids)
+
+    def get(self, dt: date, default: Any = None) -> Any:
+        ordinals, name_ids, local_names = self._data
+        ordinal = dt.toordinal()
+        idx = bisect_left(ordinals, ordinal)
+        if idx < len(ordinals) and ordinals[idx] == ordinal:
+            return self._get_name(name_ids[idx], local_names)
+
+        return default
+
+    def items(self) -> Iterator[Tuple[date, str]]:
+        ordinals, name_ids, local_names = self._data
+        for ordinal, name_id in zip(ordinals, name_ids):
+            yield date.fromordinal(ordinal), self._get_name(name_id, local_names)
+
+    def sorted_dates(self) -> _CompactDates:
+        return _CompactDates(self._data[0])
+
+    def values(self) -> Iterator[str]:
+        ordinals, name_ids, local_names = self._data
+        return (self._get_name(name_id, local_names) for name_id in name_ids)
+
+
+class _SumStorage:
+    """Holidays storage for ``HolidaySum(copy=False)`` objects.
+
+    Holidays are looked up in the operands (in the years they have
+    calculated) and names of the same date are merged on demand, so nothing
+    is copied into the sum. Holidays set or removed on the sum object itself
+    are kept as changes on top of the operands (``None`` for removed ones).
+    """
+
+    __slots__ = ("_changes", "_name_table", "_operands", "_sorted_dates")
+
+    def __init__(
+        self,
+        name_table: _NameTable,
+        operands: List["HolidayBase"],
+        changes: Optional[Dict[date, Optional[str]]] = None,
+    ) -> None:
+        self._changes: Dict[date, Optional[str]] = dict(changes or {})
+        self._name_table = name_table
+        self._operands = operands
+        self._sorted_dates: Optional[
+            Tuple[Dict[date, Optional[str]], Tuple[Sequence[date], ...], List[date]]
+        ] = None
+
+    def __contains__(self, dt: date) -> bool:
+        return self.get(dt) is not None
+
+    def __delitem__(self, dt: date) -> None:
+        if dt not in self:
+            raise KeyError(dt)
+
+        self._set_change(dt, None)
+
+    def __getitem__(self, dt: date) -> str:
+        name = self.get(dt)
+        if name is None:
+            raise KeyError(dt)
+
+        return name
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(self.sorted_dates())
+
+    def __len__(self) -> int:
+        return len(self.sorted_dates())
+
+    def __setitem__(self, dt: date, name: str) -> None:
+        self._set_change(dt, name)
+
+    def _set_change(self, dt: date, name: Optional[str]) -> None:
+        changes = dict(self._changes)
+        changes[dt] = name
+        self._changes = changes
+
+    def clear(self) -> None:
+        changes: Dict[date, Optional[str]] = dict.fromkeys(self._changes)
+        for operand in self._operands:
+            changes.update(dict.fromkeys(operand._get_sorted_dates()))
+        self._changes = changes
+
+    def discard_year_changes(self, year: int) -> None:
+        """Forget the changes made to the year's holidays (e.g. when it's
+        calculated again after removal)."""
+        if any(dt.year == year for dt in self._changes):
+            self._changes = {dt: name for dt, name in self._changes.items() if dt.year != year}
+
+    def export(self) -> Tuple[Dict[date, Optional[str]]]:
+        """Return the changes made to the operands' holidays."""
+        return (dict(self._changes),)
+
+    def get(self, dt: date, default: Any = None) -> Any:
+        changes = self._changes
+        if dt in changes:
+            name = changes[dt]
+            return default if name is None else name
+
+        value = None
+        is_interned = True
+        for operand in self._operands:
+            name = operand._get_holiday_name(dt)
+            if name is None:
+                continue
+
+            # Names set by users aren't interned, neither are ones joined with
+            # them.
+            is_interned = is_interned and name in operand._name_table.ids
+            if value is None:
+                value = name
+            elif is_interned:
+                value = self._name_table.add_name(value, name)
+            else:
+                value = _join_names(value, name)
+
+        return default if value is None else value
+
+    def items(self) -> Iterator[Tuple[date, str]]:
+        for dt in self.sorted_dates():
+            yield dt, self[dt]
+
+    def sorted_dates(self) -> List[date]:
+        """Return the dates of all operands and changes merged in ascending
+        order. The result is cached until the sum or any operand changes."""
+        # Changes are replaced rather than updated, the cached dates are valid
+        # as long as both the changes and the operands' dates are the same.
+        changes = self._changes
+        operands_dates = tuple(operand._get_sorted_dates() for operand in self._operands)
+        cached = self._sorted_dates
+        if (
+            cached is not None
+            and cached[0] is changes
+            and all(
+                dates is cached_dates for dates, cached_dates in zip(operands_dates, cached[1])
+            )
+        ):
+            return cached[2]
+
+        sorted_dates: List[date] = []
+        for dt in heapq.merge(*operands_dates):
+            if not sorted_dates or sorted_dates[-1] != dt:
+                sorted_dates.append(dt)
+        if changes:
+            dates = set(sorted_dates)
+            for dt, name in changes.items():
+                if name is None:
+                    dates.discard(dt)
+                else:
+                    dates.add(dt)
+            sorted_dates = sorted(dates)
+
+        self._sorted_dates = (changes, operands_dates, sorted_dates)
+        return sorted_dates
+
+    def values(self) -> Iterator[str]:
+        for dt in self.sorted_dates():
+            yield self[dt]
+
+
+_Storage = Union[_CompactStorage, _SumStorage]
+
+
+class _StorageItemsView(ItemsView[date, str]):
+    _mapping: "HolidayBase"
+
+    def __iter__(self) -> Iterator[Tuple[date, str]]:
+        return cast(_Storage, self._mapping._storage).items()
+
+
+class _StorageKeysView(KeysView[date]):
+    _mapping: "HolidayBase"
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(cast(_Storage, self._mapping._storage))
+
+
+class _StorageValuesView(ValuesView[str]):
+    _mapping: "HolidayBase"
+
+    def __iter__(self) -> Iterator[str]:
+        return cast(_Storage, self._mapping._storage).values()
+
+
+class _DateParser:
+    """Date strings parser with an LRU cache of recently parsed strings.
+
+    Strict ISO 8601 (``YYYY-MM-DD`` optionally followed by time) and compact
+    ``YYYYMMDD`` formats are parsed directly, :func:`dateutil.parser.parse`
+    is only used for other formats.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.parse = lru_cache(maxsize=maxsize)(self._parse)
+        self.slow_parses = 0
+
+    def _parse(self, key: str) -> date:
+        try:
+            if len(key) == 8 and key.isascii() and key.isdigit():
+                return date(int(key[:4]), int(key[4:6]), int(key[6:]))
+
+            if len(key) >= 10 and key[4] == "-" and key[7] == "-":
+                if len(key) == 10:
+                    return date.fromisoformat(key)
+                if key[10] in "Tt ":
+                    return datetime.fromisoformat(
+                        f"{key[:-1]}+00:00" if key[-1] in "Zz" else key
+                    ).date()
+        except ValueError:
+            pass
+
+        # dateutil's parser is slow to import, load it only when needed.
+        from dateutil.parser import parse
+
+        self.slow_parses += 1
+        try:
+            return parse(key).date()
+        except (OverflowError, ValueError):
+            raise ValueError(f"Cannot parse date from string '{key}'")
+
+    def info(self) -> ParseInfo:
+        return ParseInfo(*self.parse.cache_info(), self.slow_parses)
+
+
+_date_parser = _DateParser()
+
+
+def _import_numpy(purpose: str) -> Any:
+    """Import NumPy on first use: it's an optional dependency which is
+    expensive to import, so the package doesn't import it eagerly."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"NumPy is required for {purpose}.")
+
+    return numpy
+
+
+def _get_date(key: DateLike) -> date:
+    """Convert a date expressed in one of the :data:`DateLike` types to
+    :class:`datetime.date`."""
+
+    # Try to catch `date` and `str` type keys first.
+    # Using type() here to skip date subclasses.
+    # Key is `date`.
+    if type(key) is date:
+        return key
+
+    # Key is `str` instance.
+    if isinstance(key, str):
+        return _date_parser.parse(key)
+
+    # Key is `datetime` instance.
+    if isinstance(key, datetime):
+        return key.date()
+
+    # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
+    if isinstance(key, date):
+        return key
+
+    # Key is `int` POSIX timestamp, no need for `datetime` conversion.
+    if type(key) is int:
+        return date.fromordinal(_EPOCH_ORDINAL + key // 86400)
+
+    # Key is `float` or `int` instance.
+    if isinstance(key, (float, int)):
+        return datetime.fromtimestamp(key, timezone.utc).date()
+
+    # Key is not supported.
+    raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+
+def _count_workdays(week_workdays: Tuple[int, ...], ordinal: int) -> int:
+    """Return the number of workdays preceding the date ordinal (since the
+    ordinal 1, a Monday) given the workdays preceding each day of the week
+    (see :func:`_get_week_workdays`)."""
+    weeks, weekday = divmod(ordinal - 1, 7)
+    return weeks * week_workdays[-1] + week_workdays[weekday]
+
+
+def _get_week_workdays(weekend: FrozenSet[int]) -> Tuple[int, ...]:
+    """Return the numbers of workdays preceding each day of the week (from
+    Monday), the last item is the number of workdays in the week."""
+    if len(weekend) > 6:
+        raise ValueError("At least one day of the week must not be a weekend day.")
+
+    week_workdays = [0]
+    for weekday in range(7):
+        week_workdays.append(week_workdays[-1] + (weekday not in weekend))
+
+    return tuple(week_workdays)
+
+
+def _iter_weekdays(year: int, weekdays: Iterable[int]) -> Iterator[date]:
+    """Iterate over the dates of the year falling on the week days."""
+    start = date(year, 1, 1)
+    for weekday in weekdays:
+        dt = start + timedelta(days=(weekday - start.weekday()) % 7)
+        while dt.year == year:
+            yield dt
+            dt += timedelta(days=7)
+
+
+# _add_holiday_* syntactic sugar patterns.
+# <month> <day> (e.g., _add_holiday_jun_15()).
+_ADD_HOLIDAY_MONTH_DAY_RE = re.compile(r"_add_holiday_(\w{3})_(\d{1,2})")
+# <last/nth> <weekday> of <month> (e.g., _add_holiday_last_mon_of_aug() or
+# _add_holiday_3rd_fri_of_aug()).
+_ADD_HOLIDAY_NTH_WEEKDAY_OF_MONTH_RE = re.compile(
+    r"_add_holiday_(last|\d\w{2})_(\w{3})_of_(\w{3})"
+)
+# <n> day(s) <past/prior> <last/<nth> <weekday> of <month> (e.g.,
+# _add_holiday_1_day_past_1st_fri_of_aug() or
+# _add_holiday_5_days_prior_last_fri_of_aug()).
+_ADD_HOLIDAY_NTH_WEEKDAY_OF_MONTH_WITH_DELTA_RE = re.compile(
+    r"_add_holiday_(\d{1,2})_days?_(past|prior)_(last|\d\w{2})_(\w{3})_of_(\w{3})"
+)
+# <nth> <weekday> <before/from> <month> <day> (e.g.,
+# _add_holiday_1st_mon_before_jun_15() or _add_holiday_1st_mon_from_jun_15()).
+_ADD_HOLIDAY_NTH_WEEKDAY_FROM_RE = re.compile(
+    r"_add_holiday_(\d{1,2})\w{2}_(\w+)_(before|from)_(\w{3})_(\d{1,2})"
+)
+
+
+def _get_add_holiday_method(name: str) -> Optional[Callable[..., Optional[date]]]:
+    """Build the _add_holiday_* syntactic sugar method for the name.
+
+    :return:
+        A function to be used as a :class:`HolidayBase` method, None if the
+        name doesn't match any of supported patterns.
+    """
+
+    def get_number(number: str) -> int:
+        return -1 if number == "last" else +int(re.sub(r"\D", "", number))
+
+    month_day = _ADD_HOLIDAY_MONTH_DAY_RE.match(name)
+    if month_day:
+        month, day = month_day.groups()
+        month_day_args = (getattr(gregorian, month.upper()), int(day))
+
+        def add_holiday(self, name: str) -> Optional[date]:
+            return self._add_holiday(name, date(self._year, *month_day_args))
+
+        return add_holiday
+
+    nth_weekday_of_month = _ADD_HOLIDAY_NTH_WEEKDAY_OF_MONTH_RE.match(name)
+    if nth_weekday_of_month:
+        number, weekday, month = nth_weekday_of_month.groups()
+        nth_weekday_args = (
+            get_number(number),
+            getattr(gregorian, weekday.upper()),
+            getattr(gregorian, month.upper()),
+        )
+
+        def add_holiday(self, name: str) -> Optional[date]:
+            return self._add_holiday(
+                name, _get_nth_weekday_of_month(*nth_weekday_args, self._year)
+            )
+
+        return add_holiday
+
+    nth_weekday_of_month_with_delta = _ADD_HOLIDAY_NTH_WEEKDAY_OF_MONTH_WITH_DELTA_RE.match(name)
+    if nth_weekday_of_month_with_delta:
+        (
+            days,
+            delta_direction,
+            number,
+            weekday,
+            month,
+        ) = nth_weekday_of_month_with_delta.groups()
+        delta = timedelta(days=+int(days) if delta_direction == "past" else -int(days))
+        nth_weekday_args = (
+            get_number(number),
+            getattr(gregorian, weekday.upper()),
+            getattr(gregorian, month.upper()),
+        )
+
+        def add_holiday(self, name: str) -> Optional[date]:
+            return self._add_holiday(
+                name, _get_nth_weekday_of_month(*nth_weekday_args, self._year) + delta
+            )
+
+        return add_holiday
+
+    nth_weekday_from = _ADD_HOLIDAY_NTH_WEEKDAY_FROM_RE.match(name)
+    if nth_weekday_from:
+        number, weekday, date_direction, month, day = nth_weekday_from.groups()
+        nth_weekday_from_args = (
+            -int(number) if date_direction == "before" else +int(number),
+            getattr(gregorian, weekday.upper()),
+        )
+        month_day_args = (getattr(gregorian, month.upper()), int(day))
+
+        def add_holiday(self, name: str) -> Optional[date]:
+            return self._add_holiday(
+                name,
+                _get_nth_weekday_from(*nth_weekday_from_args, date(self._year, *month_day_args)),
+            )
+
+        return add_holiday
+
+    return None
+
 
 class HolidayBase(Dict[date, str]):
     """
@@ -215,6 +979,12 @@ class HolidayBase(Dict[date, str]):
     is requested."""
     observed: bool
     """Whether dates when public holiday are observed are included."""
+    max_years: Optional[int] = None
+    """The maximum number of years kept calculated."""
+    min_year: int = MINYEAR
+    """The first year that can be calculated (expanded) automatically."""
+    max_year: int = MAXYEAR
+    """The last year that can be calculated (expanded) automatically."""
     subdiv: Optional[str] = None
     """The subdiv requested."""
     special_holidays: Dict[int, SpecialHoliday] = {}
@@ -235,6 +1005,37 @@ class HolidayBase(Dict[date, str]):
     """All holiday categories supported by this entity."""
     supported_languages: Tuple[str, ...] = ()
     """All languages supported by this entity."""
+    _modification: int = 0
+    """The number of the last holidays modification."""
+    _sorted_dates: Optional[Tuple[int, Sequence[date]]] = None
+    """Sorted holiday dates index along with the number of the modification
+    it was built after (built on demand)."""
+    _sorted_days: Optional[Tuple[Sequence[date], Any]] = None
+    """NumPy day numbers of :attr:`_sorted_dates` (built on demand)."""
+    _business_day_counts: Optional[Tuple[Sequence[date], Dict[int, List[int]]]] = None
+    """Per year cumulative business day counts (built on demand)."""
+    _year_bits: Optional[Tuple[Sequence[date], Dict[int, int]]] = None
+    """Per year holiday bitsets (built on demand)."""
+    _storage: Optional[_Storage] = None
+    """Holidays storage replacing the dictionary one (for ``compact=True``
+    objects and sums not copying their operands)."""
+    _year_weekends: Dict[int, FrozenSet[int]] = {}
+    """Weekend days of the calculated years whose population set the weekend
+    (replaced on update, never modified in place)."""
+    _name_table: _NameTable
+    """Interned holiday names of the entity and translation used."""
+    _name_table_key: Tuple[type, Tuple[str, ...]]
+    """The entity class and the translation files used."""
+    _pending_years: Set[int] = set()
+    """Requested years not calculated yet (for ``lazy=True``)."""
+    _years_lru: Optional["OrderedDict[int, None]"] = None
+    """Calculated years in least recently used order (for ``max_years``)."""
+    _eviction_deferred = 0
+    """Whether removing the least recently used years is deferred."""
+    _expanding_years: Set[int]
+    """Years being calculated (expanded) at the moment."""
+    _expansion_lock: RLock
+    """The lock serializing years calculation (expansion)."""
 
     def __init__(
         self,
@@ -246,6 +1047,11 @@ class HolidayBase(Dict[date, str]):
         state: Optional[str] = None,  # Deprecated.
         language: Optional[str] = None,
         categories: Optional[Tuple[str]] = None,
+        lazy: bool = False,
+        max_years: Optional[int] = None,
+        min_year: int = MINYEAR,
+        max_year: int = MAXYEAR,
+        compact: bool = False,
     ) -> None:
         """
         :param years:
@@ -279,18 +1085,51 @@ class HolidayBase(Dict[date, str]):
         :param categories:
             Requested holiday categories.
 
+        :param lazy:
+            Whether holidays of the **years** are calculated on demand (when
+            a date from that year is requested or all the holidays are
+            accessed, e.g. iterated over) instead of at instantiation.
+
+        :param max_years:
+            The maximum number of years kept calculated. Holidays of the least
+            recently used years are removed when exceeded (such years are
+            calculated again when requested if **expand** is True).
+
+        :param min_year:
+            The first year calculated (expanded) automatically; holidays of
+            earlier years are not calculated unless requested in **years**.
+
+        :param max_year:
+            The last year calculated (expanded) automatically; holidays of
+            later years are not calculated unless requested in **years**.
+
+        :param compact:
+            Whether holidays are stored as arrays of date ordinals and
+            interned name ids instead of a dictionary, reducing the memory
+            used per object at the cost of slower lookups. The dictionary API
+            is kept the same.
+
         :return:
             A :class:`HolidayBase` object matching the **country**.
         """
         super().__init__()
 
+        self._init_expansion_lock()
+
+        if max_years is not None and max_years < 1:
+            raise ValueError("The maximum number of years must be positive.")
+
         self.expand = expand
+        self.max_year = max_year
+        self.max_years = max_years
+        self.min_year = min_year
         self.language = language.lower() if language else None
         self.observed = observed
         self.subdiv = subdiv or prov or state
         self.categories = set(categories) if categories else {PUBLIC}
 
         self.tr = gettext  # Default translation method.
+        translation_files: Tuple[str, ...] = ()
 
         if prov or state:
             warnings.warn(
@@ -327,21 +1166,29 @@ class HolidayBase(Dict[date, str]):
 
             name: Optional[str] = getattr(self, "country", getattr(self, "market", None))
             if name:
-                translator: NullTranslations = translation(
-                    name,
-                    fallback=language not in self.supported_languages,
-                    languages=[language] if language in self.supported_languages else None,
-                    localedir=str(Path(__file__).with_name("locale")),
+                translator, translation_files = _get_translation(
+                    name, language if language in self.supported_languages else None
                 )
                 self.tr = translator.gettext
 
+        self._name_table_key = (type(self), translation_files)
+        self._name_table = _name_tables.setdefault(self._name_table_key, _NameTable())
+        self._storage = self._create_storage() if compact else None
+
         if isinstance(years, int):
             self.years = {years}
         else:
             self.years = set(years) if years is not None else set()
 
-        for year in self.years:
-            self._populate(year)
+        if max_years is not None:
+            self._years_lru = OrderedDict()
+
+        if lazy:
+            self._pending_years = set(self.years)
+        else:
+            for year in sorted(self.years) if max_years is not None else self.years:
+                self._populate_year(year)
+                self._use_year(year)
 
     def __add__(self, other: Union[int, "HolidayBase", "HolidaySum"]) -> "HolidayBase":
         """Add another dictionary of public holidays creating a
@@ -381,8 +1228,18 @@ class HolidayBase(Dict[date, str]):
         if not isinstance(key, (date, datetime, float, int, str)):
             raise TypeError(f"Cannot convert type '{type(key)}' to date.")
 
+        if self._storage is not None:
+            return self.__keytransform__(key) in self._storage
+
         return dict.__contains__(cast("Mapping[Any, Any]", self), self.__keytransform__(key))
 
+    def __delitem__(self, key: date) -> None:
+        if self._storage is not None:
+            del self._storage[key]
+        else:
+            dict.__delitem__(self, key)
+        self._modification = next(_modifications)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -391,6 +1248,11 @@ class HolidayBase(Dict[date, str]):
             if getattr(self, attribute_name, None) != getattr(other, attribute_name, None):
                 return False
 
+        self._populate_pending_years()
+        other._populate_pending_years()
+        if self._storage is not None or other._storage is not None:
+            return dict(self.items()) == dict(other.items())
+
         return dict.__eq__(cast("Mapping[Any, Any]", self), other)
 
     def __getattr__(self, name):
@@ -403,75 +1265,25 @@ class HolidayBase(Dict[date, str]):
             if name[: len(add_holiday_prefix)] != add_holiday_prefix:
                 raise e
 
-            # Handle <month> <day> patterns (e.g., _add_holiday_jun_15()).
-            month_day = re.match(r"_add_holiday_(\w{3})_(\d{1,2})", name)
-            if month_day:
-                month, day = month_day.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    date(self._year, getattr(gregorian, month.upper()), int(day)),
-                )
-
-            # Handle <last/nth> <weekday> of <month> patterns (e.g.,
-            # _add_holiday_last_mon_of_aug() or _add_holiday_3rd_fri_of_aug()).
-            nth_weekday_of_month = re.match(
-                r"_add_holiday_(last|\d\w{2})_(\w{3})_of_(\w{3})", name
-            )
-            if nth_weekday_of_month:
-                number, weekday, month = nth_weekday_of_month.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_of_month(
-                        -1 if number == "last" else +int(re.sub(r"\D", "", number)),
-                        getattr(gregorian, weekday.upper()),
-                        getattr(gregorian, month.upper()),
-                        self._year,
-                    ),
-                )
+            add_holiday = _get_add_holiday_method(name)
+            if add_holiday is None:
+                raise e  # No match.
 
-            # Handle <n> day(s) <past/prior> <last/<nth> <weekday> of <month> patterns (e.g.,
-            # _add_holiday_1_day_past_1st_fri_of_aug() or
-            # _add_holiday_5_days_prior_last_fri_of_aug()).
-            nth_weekday_of_month_with_delta = re.match(
-                r"_add_holiday_(\d{1,2})_days?_(past|prior)_(last|\d\w{2})_(\w{3})_of_(\w{3})",
-                name,
-            )
-            if nth_weekday_of_month_with_delta:
-                (
-                    days,
-                    delta_direction,
-                    number,
-                    weekday,
-                    month,
-                ) = nth_weekday_of_month_with_delta.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_of_month(
-                        -1 if number == "last" else +int(re.sub(r"\D", "", number)),
-                        getattr(gregorian, weekday.upper()),
-                        getattr(gregorian, month.upper()),
-                        self._year,
-                    )
-                    + timedelta(days=+int(days) if delta_direction == "past" else -int(days)),
-                )
+            # Make it a regular method of the class, so that the name is
+            # resolved without getting here next time.
+            setattr(type(self), name, add_holiday)
+            return add_holiday.__get__(self)
 
-            # Handle <nth> <weekday> <before/from> <month> <day> patterns (e.g.,
-            # _add_holiday_1st_mon_before_jun_15() or _add_holiday_1st_mon_from_jun_15()).
-            nth_weekday_from = re.match(
-                r"_add_holiday_(\d{1,2})\w{2}_(\w+)_(before|from)_(\w{3})_(\d{1,2})", name
-            )
-            if nth_weekday_from:
-                number, weekday, date_direction, month, day = nth_weekday_from.groups()
-                return lambda name: self._add_holiday(
-                    name,
-                    _get_nth_weekday_from(
-                        -int(number) if date_direction == "before" else +int(number),
-                        getattr(gregorian, weekday.upper()),
-                        date(self._year, getattr(gregorian, month.upper()), int(day)),
-                    ),
-                )
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Locks can't be pickled (nor shared between copies), the name table
+        # is shared by the entity objects within the process.
+        for attribute_name in ("_expanding_years", "_expansion_lock", "_name_table"):
+            state.pop(attribute_name, None)
+        if self._storage is not None:
+            state["_storage"] = self._storage.export()
 
-            raise e  # No match.
+        return state
 
     def __getitem__(self, key: DateLike) -> Any:
         if isinstance(key, slice):
@@ -497,14 +1309,32 @@ class HolidayBase(Dict[date, str]):
             if date_diff.days < 0 <= step or date_diff.days >= 0 > step:
                 step *= -1
 
-            days_in_range = []
-            for delta_days in range(0, date_diff.days, step):
-                day = start + timedelta(days=delta_days)
-                if day in self:
-                    days_in_range.append(day)
+            if date_diff.days == 0:
+                return []
+
+            # The last date of the range that matches the step.
+            end = start + timedelta(days=(abs(date_diff.days) - 1) // abs(step) * step)
+            range_start, range_end = (start, end) if step > 0 else (end, start)
+
+            with self._defer_eviction():
+                if self.expand or self._pending_years:
+                    for year in range(range_start.year, range_end.year + 1):
+                        self._expand_year(year)
+
+                dates = self._get_sorted_dates()
+                days_in_range = list(
+                    dates[bisect_left(dates, range_start) : bisect_right(dates, range_end)]
+                )
+            if abs(step) > 1:
+                days_in_range = [dt for dt in days_in_range if (dt - start).days % step == 0]
+            if step < 0:
+                days_in_range.reverse()
 
             return days_in_range
 
+        if self._storage is not None:
+            return self._storage[self.__keytransform__(key)]
+
         return dict.__getitem__(self, self.__keytransform__(key))
 
     def __keytransform__(self, key: DateLike) -> date:
@@ -518,39 +1348,17 @@ class HolidayBase(Dict[date, str]):
 
         to :class:`datetime.date`, which is how it's stored by the class."""
 
-        # Try to catch `date` and `str` type keys first.
         # Using type() here to skip date subclasses.
-        # Key is `date`.
-        if type(key) is date:
-            dt = key
+        dt = key if type(key) is date else _get_date(key)
 
-        # Key is `str` instance.
-        elif isinstance(key, str):
+        # Automatically expand for `expand=True` and `lazy=True` cases.
+        if (self.expand and dt.year not in self.years) or dt.year in self._pending_years:
+            self._expand_year(dt.year)
+        elif self._years_lru is not None and dt.year in self._years_lru:
             try:
-                dt = parse(key).date()
-            except (OverflowError, ValueError):
-                raise ValueError(f"Cannot parse date from string '{key}'")
-
-        # Key is `datetime` instance.
-        elif isinstance(key, datetime):
-            dt = key.date()
-
-        # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
-        elif isinstance(key, date):
-            dt = key
-
-        # Key is `float` or `int` instance.
-        elif isinstance(key, (float, int)):
-            dt = datetime.fromtimestamp(key, timezone.utc).date()
-
-        # Key is not supported.
-        else:
-            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
-
-        # Automatically expand for `expand=True` cases.
-        if self.expand and dt.year not in self.years:
-            self.years.add(dt.year)
-            self._populate(dt.year)
+                self._years_lru.move_to_end(dt.year)
+            except KeyError:  # Evicted by another thread meanwhile.
+                pass
 
         return dt
 
@@ -562,16 +1370,46 @@ class HolidayBase(Dict[date, str]):
             if getattr(self, attribute_name, None) != getattr(other, attribute_name, None):
                 return True
 
+        self._populate_pending_years()
+        other._populate_pending_years()
+        if self._storage is not None or other._storage is not None:
+            return dict(self.items()) != dict(other.items())
+
         return dict.__ne__(self, other)
 
+    def __iter__(self) -> Iterator[date]:
+        self._populate_pending_years()
+        if self._storage is not None:
+            return iter(self._storage)
+
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._populate_pending_years()
+        if self._storage is not None:
+            return len(self._storage)
+
+        return dict.__len__(self)
+
     def __radd__(self, other: Any) -> "HolidayBase":
         return self.__add__(other)
 
     def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        if self._storage is not None:
+            # Holidays are a part of the state, the dictionary itself is empty.
+            return (
+                copyreg.__newobj__,  # type: ignore[attr-defined]
+                (type(self),),
+                self.__getstate__(),
+            )
+
         return super().__reduce__()
 
     def __repr__(self) -> str:
         if self:
+            if self._storage is not None:
+                return repr(dict(self._storage.items()))
+
             return super().__repr__()
 
         parts = []
@@ -588,23 +1426,37 @@ class HolidayBase(Dict[date, str]):
 
         return "".join(parts)
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_expansion_lock()
+        # Modification numbers of another process may be reused by this one.
+        self._modification = next(_modifications)
+        if "_name_table_key" not in state:
+            # Pickled by a version not interning holiday names.
+            self._name_table_key = (type(self), ())
+        self._name_table = _name_tables.setdefault(self._name_table_key, _NameTable())
+        if state.get("_storage") is not None:
+            self._storage = self._create_storage(*state["_storage"])
+
     def __setattr__(self, key: str, value: Any) -> None:
         dict.__setattr__(self, key, value)
 
-        if self and key in {"categories", "observed"}:
+        if key in {"categories", "observed"} and (dict.__len__(self) or self._storage):
             self.clear()
-            for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+            # Re-populate holidays for each calculated year.
+            for year in self.years - self._pending_years:
+                self._populate_year(year)
 
     def __setitem__(self, key: DateLike, value: str) -> None:
-        if key in self:
+        dt = self.__keytransform__(key)
+        current_value = self._get_holiday_name(dt)
+        if current_value is not None:
             # If there are multiple holidays on the same date
             # order their names alphabetically.
-            holiday_names = set(self[key].split(HOLIDAY_NAME_DELIMITER))
-            holiday_names.add(value)
-            value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
+            value = _join_names(current_value, value)
 
-        dict.__setitem__(self, self.__keytransform__(key), value)
+        # Names set by users aren't interned, see _add_holiday_name().
+        self._set_holiday_name(dt, value)
 
     def __str__(self) -> str:
         if self:
@@ -629,6 +1481,222 @@ class HolidayBase(Dict[date, str]):
             "years",
         )
 
+    def _create_storage(self, *args) -> _Storage:
+        """Create the holidays storage replacing the dictionary one. The
+        arguments are ones exported by the storage (when unpickled)."""
+        return _CompactStorage(self._name_table, *args)
+
+    def _expand_year(self, year: int, force: bool = False) -> None:
+        """Populate holidays for the year unless it's already calculated.
+
+        The year is marked as calculated only after all its holidays are
+        added, so that lookups from other threads wait for the expansion to
+        finish instead of seeing partially populated holidays.
+
+        :param force:
+            Whether to calculate the year even if it isn't expanded
+            automatically (e.g. for ``expand=False`` or beyond
+            :attr:`max_year`).
+        """
+        with self._expansion_lock:
+            if year in self._expanding_years:
+                return None
+
+            if year in self._pending_years:
+                is_pending = True
+            elif year not in self.years and (
+                force or (self.expand and self.min_year <= year <= self.max_year)
+            ):
+                is_pending = False
+            else:
+                return None
+
+            self._expanding_years.add(year)
+            try:
+                self._populate_year(year)
+            finally:
+                self._expanding_years.discard(year)
+
+            if is_pending:
+                self._pending_years.discard(year)
+            else:
+                self.years.add(year)
+            self._use_year(year)
+
+    @contextmanager
+    def _defer_eviction(self) -> Iterator[None]:
+        """Keep all the years calculated within the context, the least
+        recently used years beyond :attr:`max_years` are removed on exit."""
+        with self._expansion_lock:
+            self._eviction_deferred += 1
+            try:
+                yield None
+            finally:
+                self._eviction_deferred -= 1
+                self._evict_unused_years()
+
+    def _evict_unused_years(self) -> None:
+        """Remove the least recently used years beyond :attr:`max_years`
+        unless deferred."""
+        if self._years_lru is None or self._eviction_deferred:
+            return None
+
+        while len(self._years_lru) > cast(int, self.max_years):
+            self._evict_year(next(iter(self._years_lru)))
+
+    def _evict_year(self, year: int) -> None:
+        """Remove holidays of the year and the year itself from the
+        calculated ones."""
+        with self._expansion_lock:
+            self.years.discard(year)
+            if self._years_lru is not None:
+                self._years_lru.pop(year, None)
+
+            sorted_dates = self._get_sorted_dates()
+            for dt in sorted_dates[
+                bisect_left(sorted_dates, date(year, 1, 1)) : bisect_right(
+                    sorted_dates, date(year, 12, 31)
+                )
+            ]:
+                del self[dt]
+
+    def _get_business_day_counts(self, year: int) -> List[int]:
+        """Return cumulative business day counts for a year.
+
+        The item at index `n` is the number of business days (neither weekend
+        nor holiday) of the year preceding its `n`-th (0-based) day, the last
+        item is the total number of business days in the year.
+        """
+        self._expand_year(year)
+
+        sorted_dates = self._get_sorted_dates()
+        business_day_counts = self._business_day_counts
+        if business_day_counts is None or business_day_counts[0] is not sorted_dates:
+            business_day_counts = self._business_day_counts = (sorted_dates, {})
+
+        year_counts = business_day_counts[1]
+        if year not in year_counts:
+            start = date(year, 1, 1)
+            holidays = {
+                (dt - start).days
+                for dt in sorted_dates[
+                    bisect_left(sorted_dates, start) : bisect_right(
+                        sorted_dates, date(year, 12, 31)
+                    )
+                ]
+            }
+            weekday = start.weekday()
+            weekend = self._get_weekend(year)
+
+            count = 0
+            counts = [count]
+            for day in range(366 if isleap(year) else 365):
+                if (weekday + day) % 7 not in weekend and day not in holidays:
+                    count += 1
+                counts.append(count)
+
+            year_counts[year] = counts
+
+        return year_counts[year]
+
+    def _get_holiday_name(self, dt: date) -> Optional[str]:
+        """Return the holiday name of the date or None, no years are
+        calculated."""
+        if self._storage is not None:
+            return self._storage.get(dt)
+
+        return dict.get(self, dt)
+
+    def _get_population_cache_key(self, year: int) -> Optional[Tuple[Any, ...]]:
+        """Return the population cache key for the year. It must include all
+        the parameters affecting the populated holidays. Entities with extra
+        parameters should extend it, `None` disables caching."""
+        return (
+            type(self),
+            year,
+            self.subdiv,
+            frozenset(self.categories or ()),
+            self.observed,
+            self.language,
+            # The translation used may depend on the environment.
+            self._name_table_key[1],
+        )
+
+    def _get_year_bits(self, year: int) -> int:
+        """Return the year holidays as a bitset: bit `n` is set if the `n`-th
+        (0-based) day of the year is a holiday."""
+        self._expand_year(year)
+
+        sorted_dates = self._get_sorted_dates()
+        cached_year_bits = self._year_bits
+        if cached_year_bits is None or cached_year_bits[0] is not sorted_dates:
+            cached_year_bits = self._year_bits = (sorted_dates, {})
+
+        year_bits = cached_year_bits[1]
+        if year not in year_bits:
+            start = date(year, 1, 1).toordinal()
+            bits = 0
+            for dt in sorted_dates[
+                bisect_left(sorted_dates, date(year, 1, 1)) : bisect_right(
+                    sorted_dates, date(year, 12, 31)
+                )
+            ]:
+                bits |= 1 << (dt.toordinal() - start)
+
+            year_bits[year] = bits
+
+        return year_bits[year]
+
+    def _get_weekend(self, year: int) -> FrozenSet[int]:
+        """Return the weekend days of the year: ones set while populating the
+        year (the weekend may change over the years), :attr:`weekend`
+        otherwise."""
+        weekend = self._year_weekends.get(year)
+        return frozenset(self.weekend) if weekend is None else weekend
+
+    def _get_weekmask(self, weekend: Optional[Iterable[int]] = None) -> List[int]:
+        """Return the NumPy compatible weekmask: 1 for workdays, 0 for weekend
+        days (:attr:`weekend` by default) starting from Monday."""
+        weekend = set(self.weekend if weekend is None else weekend)
+        return [0 if weekday in weekend else 1 for weekday in range(7)]
+
+    def _get_sorted_dates(self) -> Sequence[date]:
+        """Return the holiday dates in ascending order.
+
+        The index is built lazily and rebuilt after holidays are modified.
+        """
+        # The modification number is read before building the index: if the
+        # holidays are modified meanwhile the index isn't used again.
+        modification = self._modification
+        sorted_dates = self._sorted_dates
+        if sorted_dates is None or sorted_dates[0] != modification:
+            sorted_dates = self._sorted_dates = (
+                modification,
+                self._storage.sorted_dates()
+                if self._storage is not None
+                else sorted(dict.keys(self)),
+            )
+
+        return sorted_dates[1]
+
+    def _get_sorted_days(self):
+        """Return the holiday dates as a sorted NumPy array of day numbers
+        (days since 1970-01-01)."""
+        np = _import_numpy("holiday day numbers calculation")
+        sorted_dates = self._get_sorted_dates()
+        sorted_days = self._sorted_days
+        if sorted_days is None or sorted_days[0] is not sorted_dates:
+            sorted_days = self._sorted_days = (
+                sorted_dates,
+                np.array(sorted_dates, dtype="datetime64[D]").astype(np.int64),
+            )
+
+        return sorted_days[1]
+
+    def _init_expansion_lock(self) -> None:
+        self._expanding_years = set()
+        self._expansion_lock = RLock()
+
     def _is_leap_year(self) -> bool:
         """
         Returns True if the year is leap. Returns False otherwise.
@@ -646,9 +1714,37 @@ class HolidayBase(Dict[date, str]):
         if dt.year != self._year:
             return None
 
-        self[dt] = self.tr(name)
+        self._add_holiday_name(dt, self._name_table.translate(name, self.tr))
         return dt
 
+    def _add_holiday_name(self, dt: date, name: str) -> None:
+        """Add the holiday name produced by the entity (interned in its name
+        table) to the date."""
+        current_value = self._get_holiday_name(dt)
+        if current_value is None:
+            value = name
+        elif current_value in self._name_table.ids:
+            value = self._name_table.add_name(current_value, name)
+        else:
+            # Names set by users aren't interned, neither are ones joined
+            # with them.
+            value = _join_names(current_value, name)
+
+        self._set_holiday_name(dt, value)
+
+    def _add_populated_holidays(self, year: int, holidays: Iterable[Tuple[date, str]]) -> None:
+        """Add holidays populated for the year elsewhere (e.g. cached ones).
+        Names of the dates already present are merged."""
+        storage = self._storage
+        for dt, name in holidays:
+            if storage is not None and dt.year == year and dt not in storage:
+                storage[dt] = name
+            elif storage is None and dt.year == year and not dict.__contains__(self, dt):
+                dict.__setitem__(self, dt, name)
+            else:
+                self._add_holiday_name(dt, name)
+        self._modification = next(_modifications)
+
     def _add_subdiv_category_holidays(self, category: str = None):
         """Populate subdivision holidays by category."""
         if self.subdiv is not None:
@@ -750,6 +1846,67 @@ class HolidayBase(Dict[date, str]):
         # Populate substituted holidays.
         self._add_substituted_holidays()
 
+    def _populate_detached(self, year: int) -> Tuple[Tuple[date, str], ...]:
+        """Return holidays populated for a given year. A detached shallow copy
+        is populated so that the result doesn't depend on the object's
+        current content."""
+        return self._populate_detached_year(year)[0]
+
+    def _populate_detached_year(self, year: int) -> _PopulatedYear:
+        """Return holidays populated for a given year by a detached shallow
+        copy along with the attributes the population has set on it."""
+        holidays = type(self).__new__(type(self))
+        holidays.__dict__.update(self.__dict__)
+        holidays.__dict__.update(
+            {
+                "expand": False,
+                "years": {year},
+                "_storage": None,
+                "_pending_years": set(),
+                "_sorted_dates": None,
+                "_years_lru": None,
+            },
+        )
+        holidays._populate(year)
+
+        attributes = tuple(
+            (name, value)
+            for name, value in holidays.__dict__.items()
+            if name not in _DETACHED_ATTRIBUTES
+            and (name not in self.__dict__ or self.__dict__[name] is not value)
+        )
+        return tuple(dict.items(holidays)), attributes
+
+    def _populate_year(self, year: int) -> None:
+        """Populate holidays for a given year. If the population cache is
+        enabled the holidays are copied from there when available, and so are
+        the attributes set by :meth:`_populate` (e.g. ``weekend``)."""
+        weekend = self.weekend
+        key = self._get_population_cache_key(year) if _population_cache.maxsize else None
+        if key is None:
+            self._populate(year)
+            is_weekend_set = self.weekend is not weekend
+        else:
+            populated_year = _population_cache.get(key)
+            if populated_year is None:
+                populated_year = self._populate_detached_year(year)
+                _population_cache.set(key, populated_year)
+
+            year_holidays, attributes = populated_year
+            self._add_populated_holidays(year, year_holidays)
+            for name, value in attributes:
+                dict.__setattr__(self, name, value)
+            is_weekend_set = any(name == "weekend" for name, _ in attributes)
+
+        if is_weekend_set:
+            self._year_weekends = {**self._year_weekends, year: frozenset(self.weekend)}
+
+    def _populate_pending_years(self) -> None:
+        """Populate holidays for all the years requested with ``lazy=True``
+        and not calculated yet."""
+        for year in sorted(self._pending_years):
+            self._expand_year(year)
+
     def _populate_categories(self):
         for category in self.categories:
             # Populate items from the special holidays list for all categories.
@@ -767,14 +1924,271 @@ class HolidayBase(Dict[date, str]):
             # Populate subdivision holidays for all categories.
             self._add_subdiv_category_holidays(category)
 
+    def _set_holiday_name(self, dt: date, name: str) -> None:
+        """Set the date holiday name, replacing the current one."""
+        if self._storage is not None:
+            self._storage[dt] = name
+        else:
+            dict.__setitem__(self, dt, name)
+        self._modification = next(_modifications)
+
+    def _use_year(self, year: int) -> None:
+        """Mark the calculated year as the most recently used one, removing
+        the least recently used years beyond :attr:`max_years`."""
+        if self._years_lru is None:
+            return None
+
+        self._years_lru[year] = None
+        self._years_lru.move_to_end(year)
+        self._evict_unused_years()
+
+    def add_business_days(self, key: DateLike, n: int) -> date:
+        """Return the date shifted by a number of business days. A business
+        day is a day that is neither a weekend day nor a holiday.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :param n:
+            The number of business days to add. Negative values shift the
+            date backwards.
+
+        :return:
+            The n-th business day after (before for negative n) the date, or
+            the date itself if n is 0.
+        """
+        dt = self.__keytransform__(key)
+        if n == 0:
+            return dt
+
+        year = dt.year
+        counts = self._get_business_day_counts(year)
+        day = (dt - date(year, 1, 1)).days
+        if n > 0:
+            target = counts[day + 1] + n
+            while target > counts[-1]:
+                target -= counts[-1]
+                year += 1
+                counts = self._get_business_day_counts(year)
+            day = bisect_left(counts, target) - 1
+        else:
+            target = counts[day] + n
+            while target < 0:
+                year -= 1
+                counts = self._get_business_day_counts(year)
+                target += counts[-1]
+            day = bisect_right(counts, target) - 1
+
+        return date(year, 1, 1) + timedelta(days=day)
+
     def append(self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]) -> None:
         """Alias for :meth:`update` to mimic list type."""
         return self.update(*args)
 
+    def busday_offset(self, dates: Any, offsets: Any, roll: str = "raise") -> Any:
+        """Apply business day offsets to dates in a vectorized way. This is a
+        :func:`numpy.busday_offset` wrapper using the object's weekend and
+        holidays. All the years required are calculated (expanded)
+        automatically. Requires NumPy.
+
+        :param dates:
+            An array of dates to process (anything convertible to NumPy's
+            ``datetime64[D]`` array).
+
+        :param offsets:
+            An array of business day offsets (broadcast with dates).
+
+        :param roll:
+            How to treat dates that don't fall on a business day, see
+            :func:`numpy.busday_offset` for supported values.
+
+        :return:
+            An array of ``datetime64[D]`` dates.
+        """
+        np = _import_numpy("business day offsets calculation")
+
+        days = np.asarray(dates, dtype="datetime64[D]")
+        days_valid = days[~np.isnat(days)]
+        if days_valid.size == 0:
+            return np.busday_offset(  # type: ignore[call-overload]
+                days, offsets, roll=roll, weekmask=self._get_weekmask()
+            )
+
+        start_year, end_year = (
+            int(dt.astype("datetime64[Y]").astype(np.int64)) + 1970
+            for dt in (days_valid.min(), days_valid.max())
+        )
+        # Initial guess for the number of extra years the offsets may span.
+        offsets_max = int(np.abs(offsets).max()) if np.size(offsets) else 0
+        extra_years = offsets_max // 250 + 1
+        while True:
+            calendar_start = max(start_year - extra_years, MINYEAR)
+            calendar_end = min(end_year + extra_years, MAXYEAR)
+            result = np.busday_offset(  # type: ignore[call-overload]
+                days,
+                offsets,
+                roll=roll,
+                busdaycal=self.to_busdaycalendar(calendar_start, calendar_end),
+            )
+            if not self.expand or (calendar_start == MINYEAR and calendar_end == MAXYEAR):
+                return result
+
+            # Make sure all results are within the calculated years.
+            result_valid = result[~np.isnat(result)]
+            if result_valid.size == 0 or (
+                result_valid.min() >= np.datetime64(date(calendar_start, 1, 1))
+                and result_valid.max() <= np.datetime64(date(calendar_end, 12, 31))
+            ):
+                return result
+
+            extra_years *= 2
+
+    def business_days_between(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of business days from the start date (inclusive)
+        up to the end date (exclusive). The result is negative if the end
+        date precedes the start date.
+
+        :param start:
+            The start date expressed in one of the types accepted by
+            :meth:`get`.
+
+        :param end:
+            The end date expressed in one of the types accepted by
+            :meth:`get`.
+        """
+        dt_start = self.__keytransform__(start)
+        dt_end = self.__keytransform__(end)
+        if dt_start > dt_end:
+            return -self.business_days_between(dt_end, dt_start)
+
+        count = -self._get_business_day_counts(dt_start.year)[
+            (dt_start - date(dt_start.year, 1, 1)).days
+        ]
+        for year in range(dt_start.year, dt_end.year):
+            count += self._get_business_day_counts(year)[-1]
+
+        return (
+            count
+            + self._get_business_day_counts(dt_end.year)[(dt_end - date(dt_end.year, 1, 1)).days]
+        )
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the process-wide population cache and its statistics."""
+        _population_cache.clear()
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return the process-wide population cache statistics.
+
+        :return:
+            A named tuple of hits, misses, maxsize and currsize.
+        """
+        return _population_cache.info()
+
+    def clear(self) -> None:
+        """Remove all holidays from the object."""
+        if self._storage is not None:
+            self._storage.clear()
+        dict.clear(self)
+        self._modification = next(_modifications)
+
+    def contains_many(self, keys: Iterable[DateLike]) -> Any:
+        """Check multiple dates at once.
+
+        :param keys:
+            Either a NumPy array of dates (any ``datetime64`` unit is accepted
+            and truncated to days, integer and float arrays are POSIX
+            timestamps) or an iterable of dates expressed in one of the
+            following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :return:
+            A boolean NumPy array for NumPy array input, a list of booleans
+            otherwise. All the years required are calculated (expanded) at
+            once before the check.
+        """
+        # NumPy arrays can't exist unless NumPy has already been imported.
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(keys, np.ndarray):
+            # Numbers are POSIX timestamps (not days) like for single dates.
+            if keys.dtype.kind in "iu":
+                days = (keys.astype(np.int64) // 86400).astype("datetime64[D]")
+            elif keys.dtype.kind == "f":
+                days = np.floor(keys / 86400).astype("datetime64[D]")
+            else:
+                days = keys.astype("datetime64[D]")
+            with self._defer_eviction():
+                if self.expand or self._pending_years:
+                    years = np.unique(
+                        days[~np.isnat(days)].astype("datetime64[Y]").astype(np.int64)
+                    )
+                    for year in years.tolist():
+                        if MINYEAR <= year + 1970 <= MAXYEAR:
+                            self._expand_year(year + 1970)
+
+                return np.isin(days.astype(np.int64), self._get_sorted_days())
+
+        if self._storage is not None:
+            storage = self._storage
+            return [self.__keytransform__(key) in storage for key in keys]
+
+        return [
+            dict.__contains__(cast("Mapping[Any, Any]", self), self.__keytransform__(key))
+            for key in keys
+        ]
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
 
+    def freeze(self) -> "FrozenHolidays":
+        """Return an immutable and hashable snapshot of the object. Only the
+        years calculated (including ones requested with ``lazy=True``) are
+        included.
+
+        :return:
+            A :class:`FrozenHolidays` object.
+        """
+        holidays = sorted(self.items())
+        weekend = frozenset(self.weekend)
+
+        def freeze_value(value: Any) -> Any:
+            return tuple(value) if isinstance(value, list) else value
+
+        return FrozenHolidays(
+            (dt.toordinal() for dt, _ in holidays),
+            (name for _, name in holidays),
+            weekend,
+            self.years,
+            observed=self.observed,
+            categories=self.categories or (),
+            country=freeze_value(getattr(self, "country", None)),
+            market=freeze_value(getattr(self, "market", None)),
+            subdiv=freeze_value(self.subdiv),
+            language=self.language,
+            year_weekends={
+                year: year_weekend
+                for year, year_weekend in (
+                    (year, self._get_weekend(year)) for year in sorted(self.years)
+                )
+                if year_weekend != weekend
+            },
+        )
+
     def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """Return the holiday name for a date if date is a holiday, else
         default. If default is not given, it defaults to None, so that this
@@ -794,6 +2208,9 @@ class HolidayBase(Dict[date, str]):
         :param default:
             The default value to return if no value is found.
         """
+        if self._storage is not None:
+            return self._storage.get(self.__keytransform__(key), default)
+
         return dict.get(self, self.__keytransform__(key), default)
 
     def get_list(self, key: DateLike) -> List[str]:
@@ -866,6 +2283,114 @@ class HolidayBase(Dict[date, str]):
 
         raise AttributeError(f"Unknown lookup type: {lookup}")
 
+    def items(self) -> ItemsView[date, str]:  # type: ignore[override]
+        """Return a view of the holidays (date, name) pairs."""
+        self._populate_pending_years()
+        if self._storage is not None:
+            return _StorageItemsView(self)
+
+        return dict.items(self)
+
+    def iter_range(
+        self, start: DateLike, end: DateLike, evict: bool = False
+    ) -> Iterator[Tuple[date, str]]:
+        """Iterate over the holidays from the start date (inclusive) to the end
+        date (exclusive) in date order. The years are calculated (expanded)
+        one at a time as the iteration goes.
+
+        :param start:
+            The first date of the range expressed in one of the following
+            types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        :param end:
+            The date the range ends before, expressed in the same types.
+
+        :param evict:
+            Whether to remove the holidays of the years calculated by the
+            iteration once they're passed, so that memory usage doesn't grow
+            with the range length.
+
+        :return:
+            An iterator of (date, holiday name) tuples.
+        """
+        calculated_years = self.years - self._pending_years
+        pending_years = set(self._pending_years)
+
+        def evict_years(last_year: int) -> None:
+            for year in sorted(self.years - self._pending_years - calculated_years):
+                if year <= last_year:
+                    self._evict_year(year)
+                    if year in pending_years:
+                        self.years.add(year)
+                        self._pending_years.add(year)
+
+        start_dt = self.__keytransform__(start)
+        end_dt = self.__keytransform__(end)
+        if end_dt <= start_dt:
+            return None
+
+        last_dt = end_dt - timedelta(days=1)
+        try:
+            for year in range(start_dt.year, last_dt.year + 1):
+                with self._defer_eviction():
+                    # Holidays of a year may be added by the next year calculation.
+                    for expand_year in (year, year + 1) if year < last_dt.year else (year,):
+                        self._expand_year(expand_year)
+
+                    sorted_dates = self._get_sorted_dates()
+                    year_holidays = [
+                        (
+                            dt,
+                            self._storage[dt]
+                            if self._storage is not None
+                            else dict.__getitem__(self, dt),
+                        )
+                        for dt in sorted_dates[
+                            bisect_left(sorted_dates, max(start_dt, date(year, 1, 1))) : (
+                                bisect_right(sorted_dates, min(last_dt, date(year, 12, 31)))
+                            )
+                        ]
+                    ]
+
+                yield from year_holidays
+
+                if evict:
+                    evict_years(year)
+        finally:
+            if evict:
+                evict_years(MAXYEAR)
+
+    def keys(self) -> KeysView[date]:  # type: ignore[override]
+        """Return a view of the holidays dates."""
+        self._populate_pending_years()
+        if self._storage is not None:
+            return _StorageKeysView(self)
+
+        return dict.keys(self)
+
+    def next_business_day(self, key: DateLike) -> date:
+        """Return the first business day after the date.
+
+        :param key:
+            The date expressed in one of the types accepted by :meth:`get`.
+        """
+        return self.add_business_days(key, +1)
+
+    @staticmethod
+    def parse_info() -> ParseInfo:
+        """Return date strings parsing statistics: the parsed strings cache
+        hits, misses, maximum and current size along with the number of
+        strings parsed with :func:`dateutil.parser.parse` (i.e. not in a
+        strict ISO 8601 or ``YYYYMMDD`` format)."""
+        return _date_parser.info()
+
     def pop(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
         """If date is a holiday, remove it and return its date, else return
         default.
@@ -889,6 +2414,17 @@ class HolidayBase(Dict[date, str]):
         :raise:
             KeyError if date is not a holiday and default is not given.
         """
+        self._modification = next(_modifications)
+
+        if self._storage is not None:
+            dt = self.__keytransform__(key)
+            if default is not None and dt not in self._storage:
+                return default
+
+            value = self._storage[dt]
+            del self._storage[dt]
+            return value
+
         if default is None:
             return dict.pop(self, self.__keytransform__(key))
 
@@ -936,6 +2472,83 @@ class HolidayBase(Dict[date, str]):
 
         return popped
 
+    def previous_business_day(self, key: DateLike) -> date:
+        """Return the last business day before the date.
+
+        :param key:
+            The date expressed in one of the types accepted by :meth:`get`.
+        """
+        return self.add_business_days(key, -1)
+
+    @staticmethod
+    def set_cache_size(maxsize: int) -> None:
+        """Set the process-wide population cache size. The cache is disabled
+        by default.
+
+        When enabled, the holidays populated for a year are stored per
+        entity, year, subdivision, categories, observed and language
+        combination, and objects created later with the same parameters
+        copy them instead of running the population code again. Objects
+        modifications (e.g. :meth:`update` or :meth:`pop`) never affect the
+        cached data.
+
+        :param maxsize:
+            The maximum number of cached entity years, 0 disables the cache.
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size must not be negative.")
+
+        _population_cache.resize(maxsize)
+
+    def to_busdaycalendar(self, start_year: int, end_year: int) -> Any:
+        """Return a :class:`numpy.busdaycalendar` with the object's weekend
+        and holidays. Requires NumPy.
+
+        The weekmask has the weekend days common to all the years, the other
+        weekend days of years with a different weekend are added as holidays.
+
+        :param start_year:
+            The first year of holidays to include.
+
+        :param end_year:
+            The last year of holidays to include (inclusive).
+        """
+        np = _import_numpy("business day calendar creation")
+
+        with self._defer_eviction():
+            if self.expand or self._pending_years:
+                for year in range(start_year, end_year + 1):
+                    self._expand_year(year)
+
+            sorted_dates = self._get_sorted_dates()
+            holidays = np.array(
+                sorted_dates[
+                    bisect_left(sorted_dates, date(start_year, 1, 1)) : bisect_right(
+                        sorted_dates, date(end_year, 12, 31)
+                    )
+                ],
+                dtype="datetime64[D]",
+            )
+
+            year_weekends = {
+                year: self._get_weekend(year) for year in range(start_year, end_year + 1)
+            }
+            weekend = (
+                frozenset.intersection(*year_weekends.values())
+                if year_weekends
+                else frozenset(self.weekend)
+            )
+            extra_days = [
+                dt
+                for year, year_weekend in year_weekends.items()
+                if year_weekend != weekend
+                for dt in _iter_weekdays(year, year_weekend - weekend)
+            ]
+            if extra_days:
+                holidays = np.union1d(holidays, np.array(extra_days, dtype="datetime64[D]"))
+
+            return np.busdaycalendar(weekmask=self._get_weekmask(weekend), holidays=holidays)
+
     def update(  # type: ignore[override]
         self, *args: Union[Dict[DateLike, str], List[DateLike], DateLike]
     ) -> None:
@@ -966,6 +2579,14 @@ class HolidayBase(Dict[date, str]):
             else:
                 self[arg] = "Holiday"
 
+    def values(self) -> ValuesView[str]:  # type: ignore[override]
+        """Return a view of the holidays names."""
+        self._populate_pending_years()
+        if self._storage is not None:
+            return _StorageValuesView(self)
+
+        return dict.values(self)
+
 
 class HolidaySum(HolidayBase):
     """
@@ -975,6 +2596,11 @@ class HolidaySum(HolidayBase):
     :attr:`country` and :attr:`subdiv` attributes are added
     together and could become :class:`list` s. Holiday names, when different,
     are merged. All years are calculated (expanded) for all operands.
+
+    The operands' holidays are either copied into the sum object or looked up
+    in the operands and merged on demand (``copy=False``), which avoids
+    holding every holiday twice and re-merging all of them whenever a year
+    is calculated.
     """
 
     country: Union[str, List[str]]  # type: ignore[assignment]
@@ -985,11 +2611,16 @@ class HolidaySum(HolidayBase):
     """Subdivisions included in the addition."""
     holidays: List[HolidayBase]
     """The original HolidayBase objects included in the addition."""
+    weekend: Set[int]
+    """Weekend days of all the operands combined."""
     years: Set[int]
     """The years calculated."""
 
     def __init__(
-        self, h1: Union[HolidayBase, "HolidaySum"], h2: Union[HolidayBase, "HolidaySum"]
+        self,
+        h1: Union[HolidayBase, "HolidaySum"],
+        h2: Union[HolidayBase, "HolidaySum"],
+        copy: Optional[bool] = None,
     ) -> None:
         """
         :param h1:
@@ -998,6 +2629,14 @@ class HolidaySum(HolidayBase):
         :param h2:
             The other HolidayBase object to add.
 
+        :param copy:
+            Whether the operands' holidays are copied into the sum object.
+            Otherwise the sum keeps references to the operands and lookups
+            are answered from them, calculating only the years requested in
+            each operand; the operands shouldn't be modified then. By default
+            holidays are copied unless one of the operands is a sum which
+            doesn't copy them.
+
         Example:
 
         >>> from holidays import country_holidays
@@ -1026,18 +2665,24 @@ country_holidays('CA') + country_holidays('MX')
                 self.holidays.append(operand)
 
         kwargs: Dict[str, Any] = {}
+        if copy is None:
+            copy = not any(
+                isinstance(operand, HolidaySum) and operand._storage is not None
+                for operand in (h1, h2)
+            )
+        kwargs["compact"] = not copy
         # Join years, expand and observed.
         kwargs["years"] = h1.years | h2.years
         kwargs["expand"] = h1.expand or h2.expand
         kwargs["observed"] = h1.observed or h2.observed
+        # A day is a weekend day if it's a weekend day for any of the operands.
+        self.weekend = h1.weekend | h2.weekend
         # Join country and subdivisions data.
-        # TODO: this way makes no sense: joining Italy Catania (IT, CA) with
-        # USA Mississippi (US, MS) and USA Michigan (US, MI) yields
-        # country=["IT", "US"] and subdiv=["CA", "MS", "MI"], which could very
-        # well be California and Messina and Milano, or Catania, Mississippi
-        # and Milano, or ... you get the picture.
-        # Same goes when countries and markets are being mixed (working, yet
-        # still nonsensical).
+        # Note that the joined lists are ambiguous: joining Italy Catania
+        # (IT, CA) with USA Mississippi (US, MS) and USA Michigan (US, MI)
+        # yields country=["IT", "US"] and subdiv=["CA", "MS", "MI"]. They're
+        # kept for backward compatibility, the operands in `self.holidays`
+        # (see also `get_sources()`) keep their own country and subdivision.
         for attr in ("country", "market", "subdiv"):
             if (
                 getattr(h1, attr, None)
@@ -1065,7 +2710,409 @@ country_holidays('CA') + country_holidays('MX')
 
         HolidayBase.__init__(self, **kwargs)
 
+    def _create_storage(self, *args) -> _Storage:
+        return _SumStorage(self._name_table, self.holidays, *args)
+
+    def _get_population_cache_key(self, year: int) -> Optional[Tuple[Any, ...]]:
+        # Operands use the population cache on their own.
+        return None
+
+    def _get_sorted_dates(self) -> Sequence[date]:
+        if self._storage is not None:
+            # Cached by the storage as the operands may change on their own.
+            return self._storage.sorted_dates()
+
+        return super()._get_sorted_dates()
+
+    def _get_weekend(self, year: int) -> FrozenSet[int]:
+        # A day is a weekend day if it's a weekend day for any of the operands
+        # that year.
+        return frozenset().union(*(operand._get_weekend(year) for operand in self.holidays))
+
     def _populate(self, year):
         for operand in self.holidays:
-            operand._populate(year)
-            self.update(cast("Dict[DateLike, str]", operand))
+            operand._expand_year(year, force=True)
+
+        if self._storage is not None:
+            cast(_SumStorage, self._storage).discard_year_changes(year)
+        else:
+            for operand in self.holidays:
+                self.update(cast("Dict[DateLike, str]", operand))
+
+    def get_sources(self, key: DateLike) -> List[Tuple[int, str]]:
+        """Return the holiday names of the date along with the index of the
+        operand (in :attr:`holidays`) each one comes from, ordered by operand.
+
+        A name coming from several operands is returned for each of them,
+        names added to the sum object directly are not returned.
+
+        :param key:
+            The date expressed in one of the following types:
+
+            * :class:`datetime.date`,
+            * :class:`datetime.datetime`,
+            * a :class:`str` of any format recognized by
+              :func:`dateutil.parser.parse`,
+            * or a :class:`float` or :class:`int` representing a POSIX
+              timestamp.
+
+        Example:
+
+        >>> from holidays import country_holidays
+        >>> holidays = country_holidays('US') + country_holidays('CA')
+        >>> holidays.get_sources('2020-07-01')
+        [(1, 'Canada Day')]
+        >>> holidays.holidays[1].country
+        'CA'
+        """
+        dt = self.__keytransform__(key)
+        value = self._get_holiday_name(dt)
+        if not value:
+            return []
+
+        # Interned values are split once per distinct (joined) name by the
+        # name tables, only values set by users are split on each call.
+        names = set(self._name_table.get_names(value))
+        sources: List[Tuple[int, str]] = []
+        for idx, operand in enumerate(self.holidays):
+            operand_value = operand._get_holiday_name(dt)
+            if operand_value:
+                sources.extend(
+                    (idx, name)
+                    for name in operand._name_table.get_names(operand_value)
+                    if name in names
+                )
+
+        return sources
+
+
+class FrozenHolidays(Mapping[date, str]):
+    """
+    An immutable and hashable snapshot of a :class:`HolidayBase` object
+    created by :meth:`HolidayBase.freeze`.
+
+    Holidays are stored as a sorted array of date ordinals along with a tuple
+    of their names. Only the years calculated before freezing are included,
+    dates of other years are never holidays (like for ``expand=False``).
+
+    Example:
+
+    >>> from holidays import country_holidays
+    >>> us_holidays = country_holidays('US', years=range(2020, 2030)).freeze()
+    >>> '2024-12-25' in us_holidays
+    True
+    >>> us_holidays.next_business_day('2024-12-24')
+    datetime.date(2024, 12, 26)
+    """
+
+    __slots__ = (
+        "_hash",
+        "_ordinals",
+        "_workday_holidays",
+        "_week_workdays",
+        "_weekend_deltas",
+        "_weekend_starts",
+        "_weekend_workdays",
+        "categories",
+        "country",
+        "language",
+        "market",
+        "names",
+        "observed",
+        "subdiv",
+        "weekend",
+        "year_weekends",
+        "years",
+    )
+
+    categories: FrozenSet[str]
+    """Requested holiday categories."""
+    country: Optional[Union[str, Tuple[str, ...]]]
+    """The country's ISO 3166-1 alpha-2 code(s)."""
+    language: Optional[str]
+    """The language holiday names are translated into."""
+    market: Optional[Union[str, Tuple[str, ...]]]
+    """The market's ISO 3166-1 alpha-2 code(s)."""
+    names: Tuple[str, ...]
+    """Holiday names in the holiday dates order."""
+    observed: bool
+    """Whether dates when public holiday are observed are included."""
+    subdiv: Optional[Union[str, Tuple[str, ...]]]
+    """The subdiv(s) requested."""
+    weekend: FrozenSet[int]
+    """Weekend days."""
+    year_weekends: Tuple[Tuple[int, FrozenSet[int]], ...]
+    """Weekend days of the years whose weekend differs from :attr:`weekend`,
+    ordered by year."""
+    years: FrozenSet[int]
+    """The years calculated."""
+    _hash: Optional[int]
+    _ordinals: "array[int]"
+    _week_workdays: Tuple[int, ...]
+    _weekend_deltas: Tuple[int, ...]
+    _weekend_starts: Tuple[int, ...]
+    _weekend_workdays: Tuple[Tuple[int, Tuple[int, ...]], ...]
+    _workday_holidays: "array[int]"
+
+    def __init__(
+        self,
+        ordinals: Iterable[int],
+        names: Iterable[str],
+        weekend: Iterable[int],
+        years: Iterable[int],
+        observed: bool = True,
+        categories: Iterable[str] = (),
+        country: Optional[Union[str, Tuple[str, ...]]] = None,
+        market: Optional[Union[str, Tuple[str, ...]]] = None,
+        subdiv: Optional[Union[str, Tuple[str, ...]]] = None,
+        language: Optional[str] = None,
+        year_weekends: Optional[Mapping[int, Iterable[int]]] = None,
+    ) -> None:
+        """
+        :param ordinals:
+            Sorted holiday date ordinals.
+
+        :param names:
+            Holiday names in the same order.
+
+        :param year_weekends:
+            Weekend days of the years whose weekend differs from the
+            ``weekend`` one.
+
+        See :meth:`HolidayBase.freeze` for creating the object.
+        """
+        set_attribute = super().__setattr__
+        set_attribute("_ordinals", array("i", ordinals))
+        set_attribute("names", tuple(names))
+        set_attribute("weekend", frozenset(weekend))
+        set_attribute(
+            "year_weekends",
+            tuple(
+                (year, frozenset(year_weekend))
+                for year, year_weekend in sorted((year_weekends or {}).items())
+            ),
+        )
+        set_attribute("years", frozenset(years))
+        set_attribute("observed", observed)
+        set_attribute("categories", frozenset(categories))
+        set_attribute("country", country)
+        set_attribute("market", market)
+        set_attribute("subdiv", subdiv)
+        set_attribute("language", language)
+        set_attribute("_hash", None)
+
+        if len(self._ordinals) != len(self.names):
+            raise ValueError("The numbers of holiday dates and names must match.")
+
+        # Business days preceding each day of the week (from Monday).
+        set_attribute("_week_workdays", _get_week_workdays(self.weekend))
+
+        # Years with another weekend: their first day ordinals, their last
+        # day ordinals (exclusive) along with their week workdays, and the
+        # differences of workdays of the years preceding each one.
+        weekend_starts = []
+        weekend_workdays = []
+        weekend_deltas = [0]
+        for year, year_weekend in self.year_weekends:
+            start = date(year, 1, 1).toordinal()
+            end = date(year + 1, 1, 1).toordinal() if year < MAXYEAR else date.max.toordinal() + 1
+            week_workdays = _get_week_workdays(year_weekend)
+            weekend_starts.append(start)
+            weekend_workdays.append((end, week_workdays))
+            weekend_deltas.append(
+                weekend_deltas[-1]
+                + _count_workdays(week_workdays, end)
+                - _count_workdays(week_workdays, start)
+                - _count_workdays(self._week_workdays, end)
+                + _count_workdays(self._week_workdays, start)
+            )
+        set_attribute("_weekend_starts", tuple(weekend_starts))
+        set_attribute("_weekend_workdays", tuple(weekend_workdays))
+        set_attribute("_weekend_deltas", tuple(weekend_deltas))
+
+        # Holidays not on weekends preceding each holiday.
+        year_weekends = dict(self.year_weekends)
+        workday_holidays = array("i", [0])
+        for ordinal in self._ordinals:
+            holiday_weekend = year_weekends.get(date.fromordinal(ordinal).year, self.weekend)
+            workday_holidays.append(
+                workday_holidays[-1] + ((ordinal - 1) % 7 not in holiday_weekend)
+            )
+        set_attribute("_workday_holidays", workday_holidays)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        return self._get_index(_get_date(key)) is not None
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError("FrozenHolidays object is immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenHolidays):
+            return NotImplemented
+
+        return self._get_state() == other._get_state()
+
+    def __getitem__(self, key: DateLike) -> str:
+        idx = self._get_index(_get_date(key))
+        if idx is None:
+            raise KeyError(key)
+
+        return self.names[idx]
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            super().__setattr__("_hash", hash(self._get_state()))
+
+        return cast(int, self._hash)
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            FrozenHolidays,
+            (
+                self._ordinals,
+                self.names,
+                self.weekend,
+                self.years,
+                self.observed,
+                self.categories,
+                self.country,
+                self.market,
+                self.subdiv,
+                self.language,
+                dict(self.year_weekends),
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"FrozenHolidays({dict(self.items())!r})"
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("FrozenHolidays object is immutable.")
+
+    def _count_business_days(self, ordinal: int) -> int:
+        """Return the number of business days preceding the date ordinal
+        (since the ordinal 1, a Monday)."""
+        count = (
+            _count_workdays(self._week_workdays, ordinal)
+            - self._workday_holidays[bisect_left(self._ordinals, ordinal)]
+        )
+
+        # Correct the count for the years with another weekend preceding the
+        # date: all of them but the last one are whole years.
+        idx = bisect_left(self._weekend_starts, ordinal)
+        if idx:
+            start = self._weekend_starts[idx - 1]
+            end, week_workdays = self._weekend_workdays[idx - 1]
+            end = min(end, ordinal)
+            count += (
+                self._weekend_deltas[idx - 1]
+                + _count_workdays(week_workdays, end)
+                - _count_workdays(week_workdays, start)
+                - _count_workdays(self._week_workdays, end)
+                + _count_workdays(self._week_workdays, start)
+            )
+
+        return count
+
+    def _get_index(self, dt: date) -> Optional[int]:
+        ordinal = dt.toordinal()
+        idx = bisect_left(self._ordinals, ordinal)
+        if idx < len(self._ordinals) and self._ordinals[idx] == ordinal:
+            return idx
+
+        return None
+
+    def _get_state(self) -> Tuple[Any, ...]:
+        return (
+            self._ordinals.tobytes(),
+            self.names,
+            self.weekend,
+            self.years,
+            self.observed,
+            self.categories,
+            self.country,
+            self.market,
+            self.subdiv,
+            self.language,
+            self.year_weekends,
+        )
+
+    def add_business_days(self, key: DateLike, n: int) -> date:
+        """Return the date shifted by a number of business days. See
+        :meth:`HolidayBase.add_business_days`."""
+        dt = _get_date(key)
+        if n == 0:
+            return dt
+
+        ordinal = dt.toordinal()
+        # Each week of a year has a business day unless taken by a holiday,
+        # so does each two weeks even if the weekend changes in between.
+        span = (abs(n) + len(self._ordinals) + 1) * 14
+        if n > 0:
+            # The first day with n business days since the next day up to it.
+            target = self._count_business_days(ordinal + 1) + n
+            low, high = ordinal + 1, ordinal + span
+            while low < high:
+                middle = (low + high) // 2
+                if self._count_business_days(middle + 1) >= target:
+                    high = middle
+                else:
+                    low = middle + 1
+        else:
+            # The last day with -n business days since it up to the day.
+            target = self._count_business_days(ordinal) + n
+            low, high = ordinal - span, ordinal - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self._count_business_days(middle) <= target:
+                    low = middle
+                else:
+                    high = middle - 1
+
+        return date.fromordinal(low)
+
+    def business_days_between(self, start: DateLike, end: DateLike) -> int:
+        """Return the number of business days from the start date (inclusive)
+        up to the end date (exclusive). See
+        :meth:`HolidayBase.business_days_between`."""
+        return self._count_business_days(_get_date(end).toordinal()) - self._count_business_days(
+            _get_date(start).toordinal()
+        )
+
+    def get(self, key: DateLike, default: Union[str, Any] = None) -> Union[str, Any]:
+        """Return the holiday name for a date if date is a holiday, else
+        default."""
+        idx = self._get_index(_get_date(key))
+        return default if idx is None else self.names[idx]
+
+    def get_list(self, key: DateLike) -> List[str]:
+        """Return a list of all holiday names for a date if date is a holiday,
+        else empty list."""
+        return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
+
+    def iter_range(self, start: DateLike, end: DateLike) -> Iterator[Tuple[date, str]]:
+        """Iterate over the holidays from the start date (inclusive) to the end
+        date (exclusive) in date order."""
+        ordinals = self._ordinals
+        for idx in range(
+            bisect_left(ordinals, _get_date(start).toordinal()),
+            bisect_left(ordinals, _get_date(end).toordinal()),
+        ):
+            yield date.fromordinal(ordinals[idx]), self.names[idx]
+
+    def next_business_day(self, key: DateLike) -> date:
+        """Return the first business day after the date."""
+        return self.add_business_days(key, 1)
+
+    def previous_business_day(self, key: DateLike) -> date:
+        """Return the last business day before the date."""
+        return self.add_business_days(key, -1)
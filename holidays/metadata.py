@@ -0,0 +1,1409 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""Entities metadata index, it allows listing supported entities without
+importing them. This file is generated by `scripts/generate_metadata.py`,
+don't edit it manually."""
+
+from typing import Any, Dict
+
+COUNTRIES: Dict[str, Dict[str, Any]] = {
+    "albania": {
+        "code": "AL",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "algeria": {
+        "code": "DZ",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "american_samoa": {
+        "code": "AS",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "andorra": {
+        "code": "AD",
+        "default_language": None,
+        "subdivisions": ("02", "03", "04", "05", "06", "07", "08"),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "angola": {
+        "code": "AO",
+        "default_language": "pt_AO",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "pt_AO", "uk"),
+    },
+    "argentina": {
+        "code": "AR",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "armenia": {
+        "code": "AM",
+        "default_language": "hy",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "hy"),
+    },
+    "aruba": {
+        "code": "AW",
+        "default_language": "pap",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "nl", "pap", "uk"),
+    },
+    "australia": {
+        "code": "AU",
+        "default_language": None,
+        "subdivisions": ("ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA"),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "austria": {
+        "code": "AT",
+        "default_language": "de",
+        "subdivisions": ("1", "2", "3", "4", "5", "6", "7", "8", "9"),
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("de", "en_US", "uk"),
+    },
+    "azerbaijan": {
+        "code": "AZ",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "bahrain": {
+        "code": "BH",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "bangladesh": {
+        "code": "BD",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "barbados": {
+        "code": "BB",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "belarus": {
+        "code": "BY",
+        "default_language": "be",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("be", "en_US"),
+    },
+    "belgium": {
+        "code": "BE",
+        "default_language": "nl",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("de", "en_US", "fr", "nl", "uk"),
+    },
+    "belize": {
+        "code": "BZ",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "bolivia": {
+        "code": "BO",
+        "default_language": "es",
+        "subdivisions": ("B", "C", "H", "L", "N", "O", "P", "S", "T"),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "bosnia_and_herzegovina": {
+        "code": "BA",
+        "default_language": "bs",
+        "subdivisions": ("BIH", "BRC", "SRP"),
+        "supported_categories": (),
+        "supported_languages": ("bs", "en_US", "sr", "uk"),
+    },
+    "botswana": {
+        "code": "BW",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "brazil": {
+        "code": "BR",
+        "default_language": None,
+        "subdivisions": (
+            "AC",
+            "AL",
+            "AM",
+            "AP",
+            "BA",
+            "CE",
+            "DF",
+            "ES",
+            "GO",
+            "MA",
+            "MG",
+            "MS",
+            "MT",
+            "PA",
+            "PB",
+            "PE",
+            "PI",
+            "PR",
+            "RJ",
+            "RN",
+            "RO",
+            "RR",
+            "RS",
+            "SC",
+            "SE",
+            "SP",
+            "TO",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "brunei": {
+        "code": "BN",
+        "default_language": "ms",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "ms", "th"),
+    },
+    "bulgaria": {
+        "code": "BG",
+        "default_language": "bg",
+        "subdivisions": (),
+        "supported_categories": ("public", "school"),
+        "supported_languages": ("bg", "en_US", "uk"),
+    },
+    "burkina_faso": {
+        "code": "BF",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "burundi": {
+        "code": "BI",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "cambodia": {
+        "code": "KH",
+        "default_language": "km",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "km", "th"),
+    },
+    "cameroon": {
+        "code": "CM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "canada": {
+        "code": "CA",
+        "default_language": "en",
+        "subdivisions": (
+            "AB",
+            "BC",
+            "MB",
+            "NB",
+            "NL",
+            "NS",
+            "NT",
+            "NU",
+            "ON",
+            "PE",
+            "QC",
+            "SK",
+            "YT",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en", "fr", "th"),
+    },
+    "chad": {
+        "code": "TD",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "chile": {
+        "code": "CL",
+        "default_language": "es",
+        "subdivisions": (
+            "AI",
+            "AN",
+            "AP",
+            "AR",
+            "AT",
+            "BI",
+            "CO",
+            "LI",
+            "LL",
+            "LR",
+            "MA",
+            "ML",
+            "NB",
+            "RM",
+            "TA",
+            "VS",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "china": {
+        "code": "CN",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "colombia": {
+        "code": "CO",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "costa_rica": {
+        "code": "CR",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "croatia": {
+        "code": "HR",
+        "default_language": "hr",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "hr", "uk"),
+    },
+    "cuba": {
+        "code": "CU",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "curacao": {
+        "code": "CW",
+        "default_language": "pap",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "nl", "pap", "uk"),
+    },
+    "cyprus": {
+        "code": "CY",
+        "default_language": "el",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("el", "en_US"),
+    },
+    "czechia": {
+        "code": "CZ",
+        "default_language": "cs",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("cs", "en_US", "uk"),
+    },
+    "denmark": {
+        "code": "DK",
+        "default_language": "da",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("da", "en_US", "uk"),
+    },
+    "djibouti": {
+        "code": "DJ",
+        "default_language": "fr",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US", "fr"),
+    },
+    "dominican_republic": {
+        "code": "DO",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "ecuador": {
+        "code": "EC",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "egypt": {
+        "code": "EG",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "el_salvador": {
+        "code": "SV",
+        "default_language": None,
+        "subdivisions": (
+            "AH",
+            "CA",
+            "CH",
+            "CU",
+            "LI",
+            "MO",
+            "PA",
+            "SA",
+            "SM",
+            "SO",
+            "SS",
+            "SV",
+            "UN",
+            "US",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "estonia": {
+        "code": "EE",
+        "default_language": "et",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "et", "uk"),
+    },
+    "eswatini": {
+        "code": "SZ",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "ethiopia": {
+        "code": "ET",
+        "default_language": "am",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("am", "ar", "en_US"),
+    },
+    "finland": {
+        "code": "FI",
+        "default_language": "fi",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "fi", "sv", "uk"),
+    },
+    "france": {
+        "code": "FR",
+        "default_language": "fr",
+        "subdivisions": ("BL", "GES", "GP", "GY", "MF", "MQ", "NC", "PF", "RE", "WF", "YT"),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "fr", "uk"),
+    },
+    "gabon": {
+        "code": "GA",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "georgia": {
+        "code": "GE",
+        "default_language": "ka",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "ka", "uk"),
+    },
+    "germany": {
+        "code": "DE",
+        "default_language": "de",
+        "subdivisions": (
+            "BB",
+            "BE",
+            "BW",
+            "BY",
+            "BYP",
+            "HB",
+            "HE",
+            "HH",
+            "MV",
+            "NI",
+            "NW",
+            "RP",
+            "SH",
+            "SL",
+            "SN",
+            "ST",
+            "TH",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("de", "en_US", "uk"),
+    },
+    "greece": {
+        "code": "GR",
+        "default_language": "el",
+        "subdivisions": (),
+        "supported_categories": ("half_day", "public"),
+        "supported_languages": ("el", "en_US", "uk"),
+    },
+    "guam": {
+        "code": "GU",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "guatemala": {
+        "code": "GT",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es"),
+    },
+    "honduras": {
+        "code": "HN",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "hongkong": {
+        "code": "HK",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "hungary": {
+        "code": "HU",
+        "default_language": "hu",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "hu", "uk"),
+    },
+    "iceland": {
+        "code": "IS",
+        "default_language": "is",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "is", "uk"),
+    },
+    "india": {
+        "code": "IN",
+        "default_language": None,
+        "subdivisions": (
+            "AN",
+            "AP",
+            "AR",
+            "AS",
+            "BR",
+            "CG",
+            "CH",
+            "DD",
+            "DH",
+            "DL",
+            "GA",
+            "GJ",
+            "HP",
+            "HR",
+            "JH",
+            "JK",
+            "KA",
+            "KL",
+            "LA",
+            "LD",
+            "MH",
+            "ML",
+            "MN",
+            "MP",
+            "MZ",
+            "NL",
+            "OR",
+            "PB",
+            "PY",
+            "RJ",
+            "SK",
+            "TN",
+            "TR",
+            "TS",
+            "UK",
+            "UP",
+            "WB",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "indonesia": {
+        "code": "ID",
+        "default_language": "id",
+        "subdivisions": (),
+        "supported_categories": ("government", "public"),
+        "supported_languages": ("en_US", "id", "uk"),
+    },
+    "iran": {
+        "code": "IR",
+        "default_language": "fa",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "fa"),
+    },
+    "ireland": {
+        "code": "IE",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "isle_of_man": {
+        "code": "IM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "israel": {
+        "code": "IL",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "italy": {
+        "code": "IT",
+        "default_language": None,
+        "subdivisions": (
+            "AG",
+            "AL",
+            "AN",
+            "AO",
+            "AP",
+            "AQ",
+            "AR",
+            "AT",
+            "AV",
+            "BA",
+            "BG",
+            "BI",
+            "BL",
+            "BN",
+            "BO",
+            "BR",
+            "BS",
+            "BT",
+            "BZ",
+            "CA",
+            "CB",
+            "CE",
+            "CH",
+            "CL",
+            "CN",
+            "CO",
+            "CR",
+            "CS",
+            "CT",
+            "CZ",
+            "EN",
+            "FC",
+            "FE",
+            "FG",
+            "FI",
+            "FM",
+            "FR",
+            "GE",
+            "GO",
+            "GR",
+            "IM",
+            "IS",
+            "KR",
+            "LC",
+            "LE",
+            "LI",
+            "LO",
+            "LT",
+            "LU",
+            "MB",
+            "MC",
+            "ME",
+            "MI",
+            "MN",
+            "MO",
+            "MS",
+            "MT",
+            "NA",
+            "NO",
+            "NU",
+            "OR",
+            "PA",
+            "PC",
+            "PD",
+            "PE",
+            "PG",
+            "PI",
+            "PN",
+            "PO",
+            "PR",
+            "PT",
+            "PU",
+            "PV",
+            "PZ",
+            "RA",
+            "RC",
+            "RE",
+            "RG",
+            "RI",
+            "RM",
+            "RN",
+            "RO",
+            "SA",
+            "SI",
+            "SO",
+            "SP",
+            "SR",
+            "SS",
+            "SU",
+            "SV",
+            "TA",
+            "TE",
+            "TN",
+            "TO",
+            "TP",
+            "TR",
+            "TS",
+            "TV",
+            "UD",
+            "VA",
+            "VB",
+            "VC",
+            "VE",
+            "VI",
+            "VR",
+            "VT",
+            "VV",
+            "Andria",
+            "Barletta",
+            "Cesena",
+            "Forli",
+            "Pesaro",
+            "Trani",
+            "Urbino",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "jamaica": {
+        "code": "JM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "japan": {
+        "code": "JP",
+        "default_language": "ja",
+        "subdivisions": (),
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "ja"),
+    },
+    "kazakhstan": {
+        "code": "KZ",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "kenya": {
+        "code": "KE",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "kyrgyzstan": {
+        "code": "KG",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "latvia": {
+        "code": "LV",
+        "default_language": "lv",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "lv", "uk"),
+    },
+    "lesotho": {
+        "code": "LS",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "liechtenstein": {
+        "code": "LI",
+        "default_language": "de",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("de", "en_US", "uk"),
+    },
+    "lithuania": {
+        "code": "LT",
+        "default_language": "lt",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "lt", "uk"),
+    },
+    "luxembourg": {
+        "code": "LU",
+        "default_language": "lb",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("de", "en_US", "fr", "lb", "uk"),
+    },
+    "madagascar": {
+        "code": "MG",
+        "default_language": "mg",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "mg", "uk"),
+    },
+    "malawi": {
+        "code": "MW",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "malaysia": {
+        "code": "MY",
+        "default_language": None,
+        "subdivisions": (
+            "JHR",
+            "KDH",
+            "KTN",
+            "KUL",
+            "LBN",
+            "MLK",
+            "NSN",
+            "PHG",
+            "PJY",
+            "PLS",
+            "PNG",
+            "PRK",
+            "SBH",
+            "SGR",
+            "SWK",
+            "TRG",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "malta": {
+        "code": "MT",
+        "default_language": "mt",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_MT", "mt"),
+    },
+    "marshall_islands": {
+        "code": "MH",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "mexico": {
+        "code": "MX",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "moldova": {
+        "code": "MD",
+        "default_language": "ro",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "ro", "uk"),
+    },
+    "monaco": {
+        "code": "MC",
+        "default_language": "fr",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "fr", "uk"),
+    },
+    "montenegro": {
+        "code": "ME",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "morocco": {
+        "code": "MA",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US", "fr"),
+    },
+    "mozambique": {
+        "code": "MZ",
+        "default_language": "pt_MZ",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "pt_MZ", "uk"),
+    },
+    "namibia": {
+        "code": "NA",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "netherlands": {
+        "code": "NL",
+        "default_language": "nl",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "nl", "uk"),
+    },
+    "new_zealand": {
+        "code": "NZ",
+        "default_language": None,
+        "subdivisions": (
+            "AUK",
+            "BOP",
+            "CAN",
+            "CIT",
+            "GIS",
+            "HKB",
+            "MBH",
+            "MWT",
+            "NSN",
+            "NTL",
+            "OTA",
+            "STL",
+            "TAS",
+            "TKI",
+            "WGN",
+            "WKO",
+            "WTC",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "nicaragua": {
+        "code": "NI",
+        "default_language": "es",
+        "subdivisions": (
+            "AN",
+            "AS",
+            "BO",
+            "CA",
+            "CI",
+            "CO",
+            "ES",
+            "GR",
+            "JI",
+            "LE",
+            "MD",
+            "MN",
+            "MS",
+            "MT",
+            "NS",
+            "RI",
+            "SJ",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "nigeria": {
+        "code": "NG",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "north_macedonia": {
+        "code": "MK",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "northern_mariana_islands": {
+        "code": "MP",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "norway": {
+        "code": "NO",
+        "default_language": "no",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "no", "uk"),
+    },
+    "pakistan": {
+        "code": "PK",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "panama": {
+        "code": "PA",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "paraguay": {
+        "code": "PY",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "peru": {
+        "code": "PE",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "philippines": {
+        "code": "PH",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "poland": {
+        "code": "PL",
+        "default_language": "pl",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "pl", "uk"),
+    },
+    "portugal": {
+        "code": "PT",
+        "default_language": "pt_PT",
+        "subdivisions": (
+            "01",
+            "02",
+            "03",
+            "04",
+            "05",
+            "06",
+            "07",
+            "08",
+            "09",
+            "10",
+            "11",
+            "12",
+            "13",
+            "14",
+            "15",
+            "16",
+            "17",
+            "18",
+            "20",
+            "30",
+            "Ext",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "pt_PT"),
+    },
+    "puerto_rico": {
+        "code": "PR",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "romania": {
+        "code": "RO",
+        "default_language": "ro",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "ro", "uk"),
+    },
+    "russia": {
+        "code": "RU",
+        "default_language": "ru",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "ru"),
+    },
+    "san_marino": {
+        "code": "SM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "saudi_arabia": {
+        "code": "SA",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "serbia": {
+        "code": "RS",
+        "default_language": "sr",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "sr"),
+    },
+    "singapore": {
+        "code": "SG",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "slovakia": {
+        "code": "SK",
+        "default_language": "sk",
+        "subdivisions": (),
+        "supported_categories": ("public", "workday"),
+        "supported_languages": ("en_US", "sk", "uk"),
+    },
+    "slovenia": {
+        "code": "SI",
+        "default_language": "sl",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "sl", "uk"),
+    },
+    "south_africa": {
+        "code": "ZA",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "south_korea": {
+        "code": "KR",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": ("bank", "public"),
+        "supported_languages": (),
+    },
+    "spain": {
+        "code": "ES",
+        "default_language": None,
+        "subdivisions": (
+            "AN",
+            "AR",
+            "AS",
+            "CB",
+            "CE",
+            "CL",
+            "CM",
+            "CN",
+            "CT",
+            "EX",
+            "GA",
+            "IB",
+            "MC",
+            "MD",
+            "ML",
+            "NC",
+            "PV",
+            "RI",
+            "VC",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "sweden": {
+        "code": "SE",
+        "default_language": "sv",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "sv", "uk"),
+    },
+    "switzerland": {
+        "code": "CH",
+        "default_language": "de",
+        "subdivisions": (
+            "AG",
+            "AR",
+            "AI",
+            "BL",
+            "BS",
+            "BE",
+            "FR",
+            "GE",
+            "GL",
+            "GR",
+            "JU",
+            "LU",
+            "NE",
+            "NW",
+            "OW",
+            "SG",
+            "SH",
+            "SZ",
+            "SO",
+            "TG",
+            "TI",
+            "UR",
+            "VD",
+            "VS",
+            "ZG",
+            "ZH",
+        ),
+        "supported_categories": (),
+        "supported_languages": ("de", "en_US", "fr", "it", "uk"),
+    },
+    "taiwan": {
+        "code": "TW",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "thailand": {
+        "code": "TH",
+        "default_language": "th",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "th"),
+    },
+    "tunisia": {
+        "code": "TN",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "turkey": {
+        "code": "TR",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "ukraine": {
+        "code": "UA",
+        "default_language": "uk",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US", "uk"),
+    },
+    "united_arab_emirates": {
+        "code": "AE",
+        "default_language": "ar",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("ar", "en_US"),
+    },
+    "united_kingdom": {
+        "code": "GB",
+        "default_language": None,
+        "subdivisions": ("ENG", "NIR", "SCT", "WLS"),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "united_states_minor_outlying_islands": {
+        "code": "UM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "united_states_virgin_islands": {
+        "code": "VI",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "united_states": {
+        "code": "US",
+        "default_language": None,
+        "subdivisions": (
+            "AK",
+            "AL",
+            "AR",
+            "AS",
+            "AZ",
+            "CA",
+            "CO",
+            "CT",
+            "DC",
+            "DE",
+            "FL",
+            "FM",
+            "GA",
+            "GU",
+            "HI",
+            "IA",
+            "ID",
+            "IL",
+            "IN",
+            "KS",
+            "KY",
+            "LA",
+            "MA",
+            "MD",
+            "ME",
+            "MH",
+            "MI",
+            "MN",
+            "MO",
+            "MP",
+            "MS",
+            "MT",
+            "NC",
+            "ND",
+            "NE",
+            "NH",
+            "NJ",
+            "NM",
+            "NV",
+            "NY",
+            "OH",
+            "OK",
+            "OR",
+            "PA",
+            "PR",
+            "PW",
+            "RI",
+            "SC",
+            "SD",
+            "TN",
+            "TX",
+            "UM",
+            "UT",
+            "VA",
+            "VI",
+            "VT",
+            "WA",
+            "WI",
+            "WV",
+            "WY",
+        ),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "uruguay": {
+        "code": "UY",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": ("bank", "public"),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "uzbekistan": {
+        "code": "UZ",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "vanuatu": {
+        "code": "VU",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "vatican_city": {
+        "code": "VA",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "venezuela": {
+        "code": "VE",
+        "default_language": "es",
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": ("en_US", "es", "uk"),
+    },
+    "vietnam": {
+        "code": "VN",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "zambia": {
+        "code": "ZM",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "zimbabwe": {
+        "code": "ZW",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+}
+
+FINANCIAL: Dict[str, Dict[str, Any]] = {
+    "european_central_bank": {
+        "code": "ECB",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "ny_stock_exchange": {
+        "code": "NYSE",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+    "federal_reserve": {
+        "code": "FEDRESERVE",
+        "default_language": None,
+        "subdivisions": (),
+        "supported_categories": (),
+        "supported_languages": (),
+    },
+}
@@ -11,18 +11,26 @@
 
 from datetime import date
 from datetime import timedelta as td
-from typing import Dict, Optional, Tuple, Set
+from typing import Collection, Dict, List, Optional, Set, Tuple
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN
 from holidays.holiday_base import DateArg, HolidayBase
 
 
 class ObservedRule(Dict[int, int]):
-    __slots__ = ()
+    __slots__ = ("deltas",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # The rule compiled into day shifts indexed by week day.
+        self.deltas = tuple(self.get(weekday, 0) for weekday in range(7))
 
     def __add__(self, other):
         return ObservedRule({**self, **other})
 
+    def __reduce__(self):
+        return ObservedRule, (dict(self),)
+
 
 # Observance calculation rules: +7 - next workday, -7 - previous workday.
 # Single days.
@@ -100,18 +108,30 @@ class ObservedHolidayBase(HolidayBase):
     def _is_observed(self, *args, **kwargs) -> bool:
         return self._observed_since is None or self._year >= self._observed_since
 
-    def _get_observed_date(self, dt: date, rule: ObservedRule) -> date:
-        delta = rule.get(dt.weekday(), 0)
-        if delta != 0:
-            if abs(delta) == 7:
-                delta //= 7
-                dt += td(days=delta)
-                while dt.year == self._year and (
-                    dt in self or self._is_weekend(dt)  # type: ignore[operator]
-                ):
-                    dt += td(days=delta)
-            else:
-                dt += td(days=delta)
+    def _get_observed_date(
+        self, dt: date, rule: ObservedRule, dts_pending: Collection[date] = ()
+    ) -> date:
+        """Return the observed date of the holiday date. Dates in
+        `dts_pending` are regarded as holidays when looking for a workday."""
+        delta = rule.deltas[dt.weekday()]
+        if delta == 0:
+            return dt
+
+        if abs(delta) != 7:
+            return dt + td(days=delta)
+
+        # Look for the previous/next workday within the year: the holidays of
+        # the year being populated are checked directly in the storage (no key
+        # transformation, the year is calculated already) and weekend days
+        # against a week days bitmask.
+        step = td(days=delta // 7)
+        weekend_mask = sum(1 << weekday for weekday in self.weekend)
+        holidays = self._storage if self._storage is not None else dict.keys(self)
+        dt += step
+        while dt.year == self._year and (
+            weekend_mask >> dt.weekday() & 1 or dt in holidays or dt in dts_pending
+        ):
+            dt += step
         return dt
 
     def _add_observed(
@@ -126,15 +146,24 @@ class ObservedHolidayBase(HolidayBase):
         if dt_observed == dt:
             return False, dt
 
-        observed_label = getattr(
-            self,
-            "observed_label_before" if dt_observed < dt else "observed_label",
-            self.observed_label,
-        )
+        observed_label = self._get_observed_label(dt, dt_observed)
         for name in (name,) if name else self.get_list(dt):
-            super()._add_holiday(self.tr(observed_label) % self.tr(name), dt_observed)
+            super()._add_holiday(
+                observed_label % self._name_table.translate(name, self.tr), dt_observed
+            )
         return True, dt_observed
 
+    def _get_observed_label(self, dt: date, dt_observed: date) -> str:
+        """Return the translated label of holidays observed on another date."""
+        return self._name_table.translate(
+            getattr(
+                self,
+                "observed_label_before" if dt_observed < dt else "observed_label",
+                self.observed_label,
+            ),
+            self.tr,
+        )
+
     def _move_holiday(self, dt: date, rule: Optional[ObservedRule] = None) -> Tuple[bool, date]:
         is_observed, dt_observed = self._add_observed(dt, rule=rule)
         if is_observed:
@@ -144,12 +173,47 @@ class ObservedHolidayBase(HolidayBase):
     def _populate_observed(self, dts: Set[date], multiple: bool = False) -> None:
         """
         When multiple is True, each holiday from a given date has its own observed date.
+
+        Observed holidays are calculated in two phases: the holidays of the
+        dates are collected first, then their observed dates are resolved in
+        date order and added at once. Observed holidays added during the pass
+        are regarded as holidays when looking for a workday, yet they are not
+        observed themselves.
         """
+        if not self.observed:
+            return None
+
+        # Phase 1: collect (date, holiday name ids) records.
+        name_table = self._name_table
+        records: List[Tuple[date, Tuple[int, ...]]] = []
         for dt in sorted(dts):
-            if not self._is_observed(dt):
+            name = self._get_holiday_name(dt)
+            if not name or not self._is_observed(dt):
                 continue
+            name_ids = name_table._get_name_ids(name_table.get_id(name))
             if multiple:
-                for name in self.get_list(dt):
-                    self._add_observed(dt, name)
+                records.extend((dt, (name_id,)) for name_id in name_ids)
             else:
-                self._add_observed(dt)
+                records.append((dt, name_ids))
+
+        # Phase 2: resolve the observed dates.
+        dts_observed: Dict[date, str] = {}
+        for dt, name_ids in records:
+            dt_observed = self._get_observed_date(dt, self._observed_rule, dts_observed)
+            if dt_observed == dt or dt_observed.year != self._year:
+                continue
+
+            observed_label = self._get_observed_label(dt, dt_observed)
+            for name_id in name_ids:
+                observed_name = name_table.translate(
+                    observed_label % name_table.translate(name_table.names[name_id], self.tr),
+                    self.tr,
+                )
+                dts_observed[dt_observed] = (
+                    name_table.add_name(dts_observed[dt_observed], observed_name)
+                    if dt_observed in dts_observed
+                    else observed_name
+                )
+
+        for dt, name in dts_observed.items():
+            self._add_holiday_name(dt, name)
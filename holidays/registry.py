@@ -10,9 +10,10 @@
 #  License: MIT (see LICENSE file)
 
 import importlib
-from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Type, Union
 
-from holidays.holiday_base import HolidayBase
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
 
 RegistryDict = Dict[str, Tuple[str, ...]]
 
@@ -170,6 +171,11 @@ class EntityLoader:
 
     __slots__ = ("entity", "entity_name", "module_name")
 
+    # Entity code to class path mappings by entity prefix (None for all).
+    _entity_paths: Dict[Optional[str], Dict[str, str]] = {}
+    # Entity classes by class path, shared by all loaders.
+    _entity_classes: Dict[str, Type["HolidayBase"]] = {}
+
     def __init__(self, path: str, *args, **kwargs) -> None:
         """Set up a lazy loader."""
         if args:
@@ -189,16 +195,21 @@ class EntityLoader:
 
         super().__init__(*args, **kwargs)
 
-    def __call__(self, *args, **kwargs) -> HolidayBase:
+    def __call__(self, *args, **kwargs) -> "HolidayBase":
         """Create a new instance of a lazy-loaded entity."""
-        cls = self.get_entity()
+        cls = self.entity or self.get_entity()
         return cls(*args, **kwargs)  # type: ignore[misc, operator]
 
     def __getattr__(self, name: str) -> Optional[Any]:
         """Return attribute of a lazy-loaded entity."""
-        cls = self.get_entity()
+        cls = self.entity or self.get_entity()
         return getattr(cls, name)
 
+    def __mro_entries__(self, bases: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Substitute the lazy-loaded entity when the loader is used as a base
+        class, e.g. `class MyHolidays(holidays.US)`."""
+        return (self.get_entity(),)
+
     def __str__(self) -> str:
         """Return lazy loader object string representation."""
         return (
@@ -206,13 +217,26 @@ class EntityLoader:
             f"use the '{self.module_name}.{self.entity_name}' class directly."
         )
 
-    def get_entity(self) -> Optional[HolidayBase]:
+    def get_entity(self) -> Optional["HolidayBase"]:
         """Return lazy-loaded entity."""
         if self.entity is None:
-            self.entity = getattr(importlib.import_module(self.module_name), self.entity_name)
+            self.entity = EntityLoader._import_entity(  # type: ignore[assignment]
+                f"{self.module_name}.{self.entity_name}"
+            )
 
         return self.entity
 
+    @staticmethod
+    def _import_entity(path: str) -> Type["HolidayBase"]:
+        """Return entity class by its path."""
+        cls = EntityLoader._entity_classes.get(path)
+        if cls is None:
+            module_name, _, entity_name = path.rpartition(".")
+            cls = getattr(importlib.import_module(module_name), entity_name)
+            EntityLoader._entity_classes[path] = cls  # type: ignore[assignment]
+
+        return cls  # type: ignore[return-value]
+
     @staticmethod
     def _get_entity_codes(
         container: RegistryDict,
@@ -237,6 +261,69 @@ class EntityLoader:
         """
         return EntityLoader._get_entity_codes(COUNTRIES, 2, include_aliases)
 
+    @staticmethod
+    def get_entity_class(code: str, prefix: Optional[str] = None) -> Optional[Type["HolidayBase"]]:
+        """Get entity class by its code without importing other entities.
+
+        :param code:
+            Entity code: alpha-2, alpha-3 code, alias or class name.
+
+        :param prefix:
+            Entity kind to look up: "countries" or "financial" (all by default).
+
+        :return:
+            The entity class or None if there is no such entity.
+        """
+        path = EntityLoader.get_entity_paths(prefix).get(code)
+        return None if path is None else EntityLoader._import_entity(path)
+
+    @staticmethod
+    def get_entity_metadata(code: str, prefix: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get entity metadata (code, default language, subdivisions, supported
+        categories and languages) by its code without importing the entity.
+
+        :param code:
+            Entity code: alpha-2, alpha-3 code, alias or class name.
+
+        :param prefix:
+            Entity kind to look up: "countries" or "financial" (all by default).
+
+        :return:
+            The entity metadata or None if there is no such entity.
+        """
+        path = EntityLoader.get_entity_paths(prefix).get(code)
+        if path is None:
+            return None
+
+        from holidays import metadata
+
+        _, entity_prefix, module_name, _ = path.split(".")
+        return (metadata.COUNTRIES if entity_prefix == "countries" else metadata.FINANCIAL)[
+            module_name
+        ]
+
+    @staticmethod
+    def get_entity_paths(prefix: Optional[str] = None) -> Dict[str, str]:
+        """Get entity code to entity class path mapping.
+
+        :param prefix:
+            Entity kind to include: "countries" or "financial" (all by default).
+        """
+        entity_paths = EntityLoader._entity_paths.get(prefix)
+        if entity_paths is None:
+            entity_paths = EntityLoader._entity_paths[prefix] = {
+                entity: f"holidays.{entity_prefix}.{module}.{entity}"
+                for entity_prefix, entity_mapping in (
+                    ("countries", COUNTRIES),
+                    ("financial", FINANCIAL),
+                )
+                if prefix in {None, entity_prefix}
+                for module, entities in entity_mapping.items()
+                for entity in entities
+            }
+
+        return entity_paths
+
     @staticmethod
     def get_financial_codes(include_aliases: bool = True) -> Iterable[str]:
         """Get supported financial codes.
@@ -249,11 +336,9 @@ class EntityLoader:
     @staticmethod
     def load(prefix: str, scope: Dict) -> None:
         """Load country or financial entities."""
-        entity_mapping = COUNTRIES if prefix == "countries" else FINANCIAL
-        for module, entities in entity_mapping.items():
-            scope.update(
-                {
-                    entity: EntityLoader(f"holidays.{prefix}.{module}.{entity}")
-                    for entity in entities
-                }
-            )
+        scope.update(
+            {
+                entity: EntityLoader(path)
+                for entity, path in EntityLoader.get_entity_paths(prefix).items()
+            }
+        )
@@ -0,0 +1,459 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""Pre-calculated holidays snapshots.
+
+A snapshot is a single binary file containing holidays calculated in advance
+for a range of years. It's memory-mapped when opened, so no entity code is
+imported or executed to serve holidays within the snapshot range.
+
+The file layout (all integers are 4 bytes, little-endian)::
+
+    header:     magic, version, start year, end year,
+                names count, calendars count, entries count
+    names:      names count + 1 offsets into the names blob
+    calendars:  (key name id, weekend mask) items
+    years:      calendars count * years count + 1 offsets into the entries,
+                one per calendar year
+    weekends:   calendars count * years count weekend masks, one per
+                calendar year (the weekend may change over the years)
+    ordinals:   holiday date ordinals, sorted within a calendar year
+    name ids:   holiday name ids, parallel to ordinals
+    names blob: UTF-8 encoded names (calendar keys and holiday names)
+
+Holidays are stored by the year they were populated for, so a calendar year
+may contain dates of adjacent years (e.g. observed holidays).
+"""
+
+__all__ = ("HolidaysSnapshot", "SnapshotHolidays", "build_snapshot")
+
+import mmap
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from holidays.constants import PUBLIC
+from holidays.holiday_base import HolidayBase
+from holidays.registry import COUNTRIES, FINANCIAL, EntityLoader
+
+SNAPSHOT_MAGIC = b"HOLSNAP\0"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<8s6I")
+_KEY_DELIMITER = "|"
+
+
+def _get_calendar_key(
+    code: str,
+    subdiv: Optional[str],
+    categories: Iterable[str],
+    observed: bool,
+    language: Optional[str],
+) -> str:
+    return _KEY_DELIMITER.join(
+        (
+            code,
+            subdiv or "",
+            ",".join(sorted(categories)),
+            str(int(observed)),
+            language.lower() if language else "",
+        )
+    )
+
+
+def _get_main_code(code: str) -> str:
+    """Return the main code of the entity (alpha-2 for countries) calendars
+    are stored under, the code may be any one the entity is available by.
+    Unknown codes are returned as is."""
+    path = EntityLoader.get_entity_paths().get(code)
+    if path is None:
+        return code
+
+    _, prefix, module, _ = path.split(".")
+    return (COUNTRIES if prefix == "countries" else FINANCIAL)[module][1]
+
+
+def _get_weekend(mask: int) -> Set[int]:
+    """Return the weekend days of the weekend mask."""
+    return {weekday for weekday in range(7) if mask & (1 << weekday)}
+
+
+def _get_weekend_mask(weekend: Iterable[int]) -> int:
+    return sum(1 << weekday for weekday in weekend)
+
+
+def _get_entity_codes() -> List[str]:
+    """Return main codes of all supported entities."""
+    return [entities[1] for entities in COUNTRIES.values()] + [
+        entities[1] for entities in FINANCIAL.values()
+    ]
+
+
+def _to_little_endian(data: array) -> bytes:
+    if sys.byteorder != "little":
+        data = array(data.typecode, data)
+        data.byteswap()
+
+    return data.tobytes()
+
+
+def build_snapshot(
+    path: str,
+    years: Iterable[int],
+    entities: Optional[Iterable[str]] = None,
+    observed: Iterable[bool] = (True, False),
+) -> None:
+    """Calculate holidays and write them into a snapshot file.
+
+    Holidays are calculated for each entity, subdivision, supported category
+    (one at a time), observed value and language (both the default ``None``
+    and each supported one).
+
+    Note that holidays for ``language=None`` are translated according to the
+    locale of the environment the snapshot is built in.
+
+    :param path:
+        The snapshot file path.
+
+    :param years:
+        A contiguous range of years to calculate holidays for.
+
+    :param entities:
+        Country and financial market codes to include (all supported ones by
+        default).
+
+    :param observed:
+        The observed parameter values to calculate holidays for.
+    """
+    years = sorted(set(years))
+    if not years or years[-1] - years[0] + 1 != len(years):
+        raise ValueError("Years must be a non-empty contiguous range.")
+
+    names: Dict[str, int] = {}
+
+    def get_name_id(name: str) -> int:
+        return names.setdefault(name, len(names))
+
+    calendars = array("I")
+    years_offsets = array("I", [0])
+    weekends = array("I")
+    ordinals = array("i")
+    name_ids = array("I")
+    for code in entities or _get_entity_codes():
+        entity = EntityLoader.get_entity_class(code)
+        if entity is None:
+            raise NotImplementedError(f"Entity {code} not available")
+        code = _get_main_code(code)
+        for subdiv in (None, *entity.subdivisions):
+            for category in sorted(entity.supported_categories or {PUBLIC}):
+                for is_observed in observed:
+                    for language in (None, *entity.supported_languages):
+                        holidays_obj = entity(
+                            years=years[-1],
+                            expand=False,
+                            observed=is_observed,
+                            subdiv=subdiv,
+                            language=language,
+                            categories=(category,),
+                        )
+                        key = _get_calendar_key(code, subdiv, (category,), is_observed, language)
+                        calendars.extend(
+                            (get_name_id(key), _get_weekend_mask(holidays_obj.weekend))
+                        )
+                        for year in years:
+                            year_holidays, attributes = holidays_obj._populate_detached_year(year)
+                            for dt, name in sorted(year_holidays):
+                                ordinals.append(dt.toordinal())
+                                name_ids.append(get_name_id(name))
+                            years_offsets.append(len(ordinals))
+                            weekends.append(
+                                _get_weekend_mask(
+                                    dict(attributes).get("weekend", holidays_obj.weekend)
+                                )
+                            )
+
+    names_offsets = array("I", [0])
+    names_blob = bytearray()
+    for name in names:  # Dicts keep insertion order, i.e. name ids order.
+        names_blob += name.encode("utf-8")
+        names_offsets.append(len(names_blob))
+
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(
+            _HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                years[0],
+                years[-1],
+                len(names),
+                len(calendars) // 2,
+                len(ordinals),
+            )
+        )
+        for data in (names_offsets, calendars, years_offsets, weekends, ordinals, name_ids):
+            snapshot_file.write(_to_little_endian(data))
+        snapshot_file.write(names_blob)
+
+
+class HolidaysSnapshot:
+    """A memory-mapped holidays snapshot created by :func:`build_snapshot`.
+
+    Example usage:
+
+    >>> from holidays.snapshot import HolidaysSnapshot
+    >>> snapshot = HolidaysSnapshot('holidays.snapshot')
+    >>> us_holidays = snapshot.country_holidays('US', subdiv='CA')
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path:
+            The snapshot file path.
+        """
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+
+        (
+            magic,
+            version,
+            self.start_year,
+            self.end_year,
+            names_count,
+            calendars_count,
+            entries_count,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot file: {path}")
+
+        years_count = self.end_year - self.start_year + 1
+        offset = _HEADER.size
+        self._names_offsets = self._get_array("I", offset, names_count + 1)
+        offset += (names_count + 1) * 4
+        calendars = self._get_array("I", offset, calendars_count * 2)
+        offset += calendars_count * 8
+        self._years_offsets = self._get_array("I", offset, calendars_count * years_count + 1)
+        offset += (calendars_count * years_count + 1) * 4
+        self._weekends = self._get_array("I", offset, calendars_count * years_count)
+        offset += calendars_count * years_count * 4
+        self._ordinals = self._get_array("i", offset, entries_count)
+        offset += entries_count * 4
+        self._name_ids = self._get_array("I", offset, entries_count)
+        self._names_start = offset + entries_count * 4
+        self._names: Dict[int, str] = {}
+
+        self._calendars: Dict[str, Tuple[int, int]] = {
+            self._get_name(calendars[idx * 2]): (calendars[idx * 2 + 1], idx * years_count)
+            for idx in range(calendars_count)
+        }
+
+    def _get_array(self, typecode: str, offset: int, length: int) -> Any:
+        data = memoryview(self._mmap)[offset : offset + length * 4]
+        if sys.byteorder == "little":
+            values = data.cast(typecode)  # type: ignore[call-overload]
+            self._views.extend((data, values))
+            return values
+
+        values = array(typecode, data)
+        values.byteswap()
+        data.release()
+        return values
+
+    def _get_name(self, name_id: int) -> str:
+        name = self._names.get(name_id)
+        if name is None:
+            name = self._names[name_id] = str(
+                self._mmap[
+                    self._names_start
+                    + self._names_offsets[name_id] : self._names_start
+                    + self._names_offsets[name_id + 1]
+                ],
+                "utf-8",
+            )
+
+        return name
+
+    def _get_calendar(self, key: str) -> Optional[Tuple[int, int]]:
+        """Return the calendar weekend mask and years offsets index."""
+        return self._calendars.get(key)
+
+    def _get_year_weekend(self, calendar: Tuple[int, int], year: int) -> Set[int]:
+        return _get_weekend(self._weekends[calendar[1] + year - self.start_year])
+
+    def _get_year_holidays(
+        self, calendar: Tuple[int, int], year: int
+    ) -> Iterable[Tuple[date, str]]:
+        idx = calendar[1] + year - self.start_year
+        for entry in range(self._years_offsets[idx], self._years_offsets[idx + 1]):
+            yield date.fromordinal(self._ordinals[entry]), self._get_name(self._name_ids[entry])
+
+    def close(self) -> None:
+        """Close the snapshot file. Objects created from the snapshot must not
+        be used afterwards."""
+        self._calendars = {}
+        # The mapped memory can't be released while exported.
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+    def country_holidays(
+        self,
+        country: str,
+        subdiv: Optional[str] = None,
+        years: Optional[Union[int, Iterable[int]]] = None,
+        expand: bool = True,
+        observed: bool = True,
+        language: Optional[str] = None,
+        categories: Optional[Tuple[str]] = None,
+    ) -> "SnapshotHolidays":
+        """Return a snapshot based holidays object for the country. See
+        :func:`holidays.utils.country_holidays` for parameters description.
+        """
+        holidays_obj = SnapshotHolidays(
+            self,
+            country,
+            years=years,
+            expand=expand,
+            observed=observed,
+            subdiv=subdiv,
+            language=language,
+            categories=categories,
+        )
+        holidays_obj.country = country
+        return holidays_obj
+
+    def financial_holidays(
+        self,
+        market: str,
+        subdiv: Optional[str] = None,
+        years: Optional[Union[int, Iterable[int]]] = None,
+        expand: bool = True,
+        observed: bool = True,
+        language: Optional[str] = None,
+    ) -> "SnapshotHolidays":
+        """Return a snapshot based holidays object for the financial market.
+        See :func:`holidays.utils.financial_holidays` for parameters
+        description.
+        """
+        holidays_obj = SnapshotHolidays(
+            self,
+            market,
+            years=years,
+            expand=expand,
+            observed=observed,
+            subdiv=subdiv,
+            language=language,
+        )
+        holidays_obj.market = market
+        return holidays_obj
+
+
+class SnapshotHolidays(HolidayBase):
+    """Holidays served from a :class:`HolidaysSnapshot`.
+
+    Years within the snapshot range are served from the snapshot, the
+    entity itself is only loaded to calculate holidays for other years (or
+    parameters combinations not included into the snapshot).
+    """
+
+    def __init__(
+        self,
+        snapshot: HolidaysSnapshot,
+        code: str,
+        years: Optional[Union[int, Iterable[int]]] = None,
+        expand: bool = True,
+        observed: bool = True,
+        subdiv: Optional[str] = None,
+        language: Optional[str] = None,
+        categories: Optional[Tuple[str]] = None,
+    ) -> None:
+        """
+        :param snapshot:
+            The snapshot to serve holidays from.
+
+        :param code:
+            The entity (country or financial market) code, alpha-3 codes,
+            aliases and class names included.
+
+        See :class:`HolidayBase` for other parameters description.
+        """
+        self._code = _get_main_code(code)
+        self._entities: Dict[str, HolidayBase] = {}
+        self._language = language
+        self._snapshot = snapshot
+        self.subdivisions = (subdiv,) if subdiv else ()
+
+        categories = categories or (PUBLIC,)
+        calendar = snapshot._get_calendar(
+            _get_calendar_key(self._code, subdiv, categories, observed, language)
+        )
+        if calendar is None:
+            # The entity validates parameters as well.
+            self.weekend = self._get_entity(subdiv, categories, observed).weekend
+        else:
+            self.weekend = _get_weekend(calendar[0])
+
+        super().__init__(
+            years=years,
+            expand=expand,
+            observed=observed,
+            subdiv=subdiv,
+            language=language,
+            categories=categories,
+        )
+
+    def _get_entity(
+        self, subdiv: Optional[str], categories: Iterable[str], observed: bool
+    ) -> HolidayBase:
+        """Return an entity object for holidays calculation."""
+        key = _get_calendar_key(self._code, subdiv, categories, observed, self._language)
+        if key not in self._entities:
+            entity_cls = EntityLoader.get_entity_class(self._code)
+            if entity_cls is None:
+                raise NotImplementedError(f"Entity {self._code} not available")
+
+            self._entities[key] = entity_cls(
+                expand=False,
+                observed=observed,
+                subdiv=subdiv,
+                language=self._language,
+                categories=tuple(categories),  # type: ignore[arg-type]
+            )
+
+        return self._entities[key]
+
+    def _get_population_cache_key(self, year: int) -> Optional[Tuple[Any, ...]]:
+        return None
+
+    def _populate(self, year: int) -> None:
+        calendar = self._snapshot._get_calendar(
+            _get_calendar_key(
+                self._code, self.subdiv, self.categories or (), self.observed, self.language
+            )
+        )
+        if calendar is not None and self._snapshot.start_year <= year <= self._snapshot.end_year:
+            year_holidays: Iterable[Tuple[date, str]] = self._snapshot._get_year_holidays(
+                calendar, year
+            )
+            weekend: Iterable[int] = self._snapshot._get_year_weekend(calendar, year)
+        else:
+            entity = self._get_entity(self.subdiv, self.categories or (), self.observed)
+            year_holidays, attributes = entity._populate_detached_year(year)
+            weekend = dict(attributes).get("weekend", entity.weekend)
+
+        self._add_populated_holidays(year, year_holidays)
+        # The weekend of the year is kept if it differs from the object's one.
+        weekend = frozenset(weekend)
+        if weekend != frozenset(self.weekend):
+            self._year_weekends = {**self._year_weekends, year: weekend}
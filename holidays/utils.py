@@ -17,13 +17,16 @@ __all__ = (
     "list_localized_financial",
     "list_supported_countries",
     "list_supported_financial",
+    "preload_translations",
+    "warmup",
 )
 
 import warnings
+from datetime import MAXYEAR, MINYEAR
 from functools import lru_cache
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
 
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import HolidayBase, _get_translation
 from holidays.registry import EntityLoader
 
 
@@ -37,6 +40,11 @@ def country_holidays(
     state: Optional[str] = None,
     language: Optional[str] = None,
     categories: Optional[Tuple[str]] = None,
+    lazy: bool = False,
+    max_years: Optional[int] = None,
+    min_year: int = MINYEAR,
+    max_year: int = MAXYEAR,
+    compact: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -76,6 +84,24 @@ def country_holidays(
     :param categories:
         Requested holiday categories.
 
+    :param lazy:
+        Whether holidays of the **years** are calculated on demand instead of
+        at instantiation.
+
+    :param max_years:
+        The maximum number of years kept calculated. Holidays of the least
+        recently used years are removed when exceeded.
+
+    :param min_year:
+        The first year calculated (expanded) automatically.
+
+    :param max_year:
+        The last year calculated (expanded) automatically.
+
+    :param compact:
+        Whether holidays are stored as arrays of date ordinals and interned
+        name ids instead of a dictionary to reduce memory usage.
+
     :return:
         A :py:class:`HolidayBase` object matching the **country**.
 
@@ -181,22 +207,26 @@ def country_holidays(
     :class:`HolidayBase` class and define your own :meth:`_populate` method.
     See documentation for examples.
     """
-    import holidays
-
-    try:
-        return getattr(holidays, country)(
-            years=years,
-            subdiv=subdiv,
-            expand=expand,
-            observed=observed,
-            prov=prov,
-            state=state,
-            language=language,
-            categories=categories,
-        )
-    except AttributeError:
+    entity_cls = EntityLoader.get_entity_class(country)
+    if entity_cls is None:
         raise NotImplementedError(f"Country {country} not available")
 
+    return entity_cls(
+        years=years,
+        subdiv=subdiv,
+        expand=expand,
+        observed=observed,
+        prov=prov,
+        state=state,
+        language=language,
+        categories=categories,
+        lazy=lazy,
+        max_years=max_years,
+        min_year=min_year,
+        max_year=max_year,
+        compact=compact,
+    )
+
 
 def financial_holidays(
     market: str,
@@ -205,6 +235,11 @@ def financial_holidays(
     expand: bool = True,
     observed: bool = True,
     language: Optional[str] = None,
+    lazy: bool = False,
+    max_years: Optional[int] = None,
+    min_year: int = MINYEAR,
+    max_year: int = MAXYEAR,
+    compact: bool = False,
 ) -> HolidayBase:
     """
     Returns a new dictionary-like :py:class:`HolidayBase` object for the public
@@ -235,6 +270,24 @@ def financial_holidays(
         language translation is not supported the original holiday names
         will be used.
 
+    :param lazy:
+        Whether holidays of the **years** are calculated on demand instead of
+        at instantiation.
+
+    :param max_years:
+        The maximum number of years kept calculated. Holidays of the least
+        recently used years are removed when exceeded.
+
+    :param min_year:
+        The first year calculated (expanded) automatically.
+
+    :param max_year:
+        The last year calculated (expanded) automatically.
+
+    :param compact:
+        Whether holidays are stored as arrays of date ordinals and interned
+        name ids instead of a dictionary to reduce memory usage.
+
     :return:
         A :py:class:`HolidayBase` object matching the **market**.
 
@@ -246,19 +299,23 @@ def financial_holidays(
     See :py:func:`country_holidays` documentation for further details and
     examples.
     """
-    import holidays
-
-    try:
-        return getattr(holidays, market)(
-            years=years,
-            subdiv=subdiv,
-            expand=expand,
-            observed=observed,
-            language=language,
-        )
-    except AttributeError:
+    entity_cls = EntityLoader.get_entity_class(market)
+    if entity_cls is None:
         raise NotImplementedError(f"Financial market {market} not available")
 
+    return entity_cls(
+        years=years,
+        subdiv=subdiv,
+        expand=expand,
+        observed=observed,
+        language=language,
+        lazy=lazy,
+        max_years=max_years,
+        min_year=min_year,
+        max_year=max_year,
+        compact=compact,
+    )
+
 
 def CountryHoliday(
     country: str,
@@ -281,6 +338,23 @@ def CountryHoliday(
     return country_holidays(country, subdiv, years, expand, observed, prov, state)
 
 
+def _get_entity_metadata(entity_code: str) -> Dict[str, Any]:
+    """
+    Get entity metadata from the metadata index.
+
+    :param entity_code:
+        An entity code.
+
+    :return:
+        The entity metadata, see :py:meth:`EntityLoader.get_entity_metadata`.
+    """
+    metadata = EntityLoader.get_entity_metadata(entity_code)
+    if metadata is None:
+        raise NotImplementedError(f"Entity {entity_code} not available")
+
+    return metadata
+
+
 def _list_localized_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]]:
     """
     Get all localized entities and languages they support.
@@ -293,11 +367,9 @@ def _list_localized_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]
         value is a list of supported languages (either ISO 639-1 or a
         combination of ISO 639-1 and ISO 3166-1 codes joined with "_").
     """
-    import holidays
-
     localized_countries = {}
     for entity_code in entity_codes:
-        languages = getattr(holidays, entity_code).supported_languages
+        languages = _get_entity_metadata(entity_code)["supported_languages"]
         if len(languages) == 0:
             continue
         localized_countries[entity_code] = sorted(languages)
@@ -349,11 +421,9 @@ def _list_supported_entities(entity_codes: Iterable[str]) -> Dict[str, List[str]
         A dictionary where key is an entity code and value is a list
         of supported subdivision codes.
     """
-    import holidays
-
     return {
-        country_code: list(getattr(holidays, country_code).subdivisions)
-        for country_code in entity_codes
+        entity_code: list(_get_entity_metadata(entity_code)["subdivisions"])
+        for entity_code in entity_codes
     }
 
 
@@ -385,3 +455,106 @@ def list_supported_financial(include_aliases=True) -> Dict[str, List[str]]:
         supported subdivision codes.
     """
     return _list_supported_entities(EntityLoader.get_financial_codes(include_aliases))
+
+
+def preload_translations(
+    entities: Optional[Iterable[str]] = None, languages: Optional[Iterable[str]] = None
+) -> None:
+    """
+    Load holiday names translations in advance, so that creating holiday
+    objects later doesn't look up and parse translation files.
+
+    :param entities:
+        Country (ISO 3166-1 alpha-2) or financial market codes. All supported
+        entities are loaded by default.
+
+    :param languages:
+        Languages to load (ones not supported by an entity are skipped). All
+        languages supported by each entity are loaded by default. The
+        translation chosen by the environment (used when no language is
+        requested) is always loaded.
+    """
+    if entities is None:
+        entities = (
+            *EntityLoader.get_country_codes(include_aliases=False),
+            *EntityLoader.get_financial_codes(include_aliases=False),
+        )
+
+    for entity_code in entities:
+        metadata = _get_entity_metadata(entity_code)
+        domain = metadata["code"]
+        supported_languages = metadata["supported_languages"]
+        for language in supported_languages if languages is None else languages:
+            if language in supported_languages:
+                _get_translation(domain, language)
+        _get_translation(domain)
+
+
+def warmup(
+    entities: Optional[Iterable[str]] = None,
+    years: Optional[Union[int, Iterable[int]]] = None,
+    subdivs: Optional[Union[str, Iterable[str]]] = None,
+    languages: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Import entities, load their translations and calculate their holidays
+    in advance (e.g. before forking worker processes), so that the first
+    holiday objects created later don't pay for it.
+
+    :param entities:
+        Country (ISO 3166-1 alpha-2) or financial market codes. All supported
+        entities are warmed up by default.
+
+    :param years:
+        The year(s) to calculate holidays for. The holidays are stored in the
+        process-wide population cache (see :py:meth:`HolidayBase.set_cache_size`),
+        which is enlarged to fit them if necessary. No holidays are
+        calculated by default.
+
+    :param subdivs:
+        Subdivisions to calculate holidays for in addition to the entity-wide
+        ones, ``"all"`` for all subdivisions of each entity. Subdivisions not
+        supported by an entity are skipped.
+
+    :param languages:
+        Languages to load translations and calculate holidays for in
+        addition to the default one. Languages not supported by an entity are
+        skipped.
+    """
+    if entities is None:
+        entities = (
+            *EntityLoader.get_country_codes(include_aliases=False),
+            *EntityLoader.get_financial_codes(include_aliases=False),
+        )
+    entities = tuple(entities)
+    languages = tuple(languages or ())
+    preload_translations(entities, languages)
+
+    if years is None:
+        return None
+    years = {years} if isinstance(years, int) else set(years)
+    if isinstance(subdivs, str) and subdivs != "all":
+        subdivs = (subdivs,)
+
+    parameters = []
+    for entity_code in entities:
+        entity = cast(Type[HolidayBase], EntityLoader.get_entity_class(entity_code))
+        entity_subdivs: List[Optional[str]] = [None]
+        if subdivs == "all":
+            entity_subdivs.extend(entity.subdivisions)
+        elif subdivs is not None:
+            entity_subdivs.extend(subdiv for subdiv in subdivs if subdiv in entity.subdivisions)
+        entity_languages: List[Optional[str]] = [None]
+        entity_languages.extend(
+            language for language in languages if language in entity.supported_languages
+        )
+        for subdiv in entity_subdivs:
+            for language in entity_languages:
+                parameters.append((entity, subdiv, language))
+
+    cache_info = HolidayBase.cache_info()
+    if cache_info.maxsize < cache_info.currsize + len(parameters) * len(years):
+        HolidayBase.set_cache_size(cache_info.currsize + len(parameters) * len(years))
+
+    for entity, subdiv, language in parameters:
+        entity(years=years, subdiv=subdiv, language=language)
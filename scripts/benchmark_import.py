@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportBenchmark:
+    """Measures the package import cost using `python -X importtime`."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-c",
+            "--code",
+            default="import holidays",
+            help="Code to measure the import cost of",
+        )
+        arg_parser.add_argument(
+            "-n",
+            "--runs",
+            default=10,
+            help="Number of interpreter runs",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-t",
+            "--top",
+            default=10,
+            help="Number of the most expensive modules to show",
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+
+    def measure(self) -> Tuple[int, Dict[str, int]]:
+        """Runs the code in a fresh interpreter and returns the total import
+        time and the self import time per module (in microseconds)."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            (f"{os.path.dirname(os.path.realpath(__file__))}/../", env.get("PYTHONPATH", ""))
+        )
+        stderr = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", self.args.code),
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        ).stderr
+
+        modules: Dict[str, int] = {}
+        for line in stderr.splitlines():
+            match = IMPORT_TIME_RE.match(line)
+            if match:
+                modules[match.group(4)] = int(match.group(1))
+
+        return sum(modules.values()), modules
+
+    def run(self) -> None:
+        """Runs the benchmark and prints the results."""
+        self.measure()  # Warm up the bytecode cache.
+
+        totals: List[int] = []
+        modules: Dict[str, List[int]] = {}
+        for _ in range(self.args.runs):
+            total, run_modules = self.measure()
+            totals.append(total)
+            for module, self_time in run_modules.items():
+                modules.setdefault(module, []).append(self_time)
+
+        print(f"`{self.args.code}`: {statistics.median(totals) / 1000:.1f} ms (median)")
+        top_modules = sorted(
+            ((statistics.median(times), module) for module, times in modules.items()),
+            reverse=True,
+        )[: self.args.top]
+        for self_time, module in top_modules:
+            print(f"{self_time / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    ImportBenchmark().run()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import importlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.append(f"{os.path.dirname(os.path.realpath(__file__))}/../")
+
+from holidays.registry import COUNTRIES, FINANCIAL, RegistryDict  # noqa: E402
+
+MAX_LINE_LENGTH = 99
+QUOTE = '"'
+
+HEADER = '''#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""Entities metadata index, it allows listing supported entities without
+importing them. This file is generated by `scripts/generate_metadata.py`,
+don't edit it manually."""
+
+from typing import Any, Dict
+'''
+
+
+class MetadataGenerator:
+    """Creates the entities metadata index module."""
+
+    @staticmethod
+    def get_metadata(prefix: str, registry: RegistryDict) -> Dict[str, Dict[str, Any]]:
+        """Returns metadata of the entities of the registry by module name."""
+        metadata = {}
+        for module_name, entities in registry.items():
+            module = importlib.import_module(f"holidays.{prefix}.{module_name}")
+            entities_metadata = {
+                repr(get_entity_metadata(getattr(module, entity))) for entity in entities
+            }
+            if len(entities_metadata) != 1:
+                raise ValueError(f"Entities of {module_name} have different metadata.")
+            metadata[module_name] = get_entity_metadata(getattr(module, entities[0]))
+
+        return metadata
+
+    def run(self) -> None:
+        """Runs the metadata index generation process."""
+        lines = [HEADER]
+        for name, prefix, registry in (
+            ("COUNTRIES", "countries", COUNTRIES),
+            ("FINANCIAL", "financial", FINANCIAL),
+        ):
+            lines.append(f"{name}: Dict[str, Dict[str, Any]] = {{")
+            for module_name, metadata in self.get_metadata(prefix, registry).items():
+                lines.append(f'    "{module_name}": {{')
+                for key, value in metadata.items():
+                    lines.extend(format_item(key, value))
+                lines.append("    },")
+            lines.append("}\n")
+
+        Path("holidays/metadata.py").write_text("\n".join(lines), encoding="UTF-8")
+
+
+def format_item(key: str, value: Any) -> List[str]:
+    """Returns metadata item source code lines (black code style compatible)."""
+    if not isinstance(value, tuple):
+        return [f'        "{key}": {"None" if value is None else f"{QUOTE}{value}{QUOTE}"},']
+
+    items = [f"{QUOTE}{item}{QUOTE}" for item in value]
+    line = f'        "{key}": ({", ".join(items)}{"," if len(items) == 1 else ""}),'
+    if len(line) <= MAX_LINE_LENGTH:
+        return [line]
+
+    return [f'        "{key}": (', *(f"            {item}," for item in items), "        ),"]
+
+
+def get_entity_metadata(cls: Any) -> Dict[str, Any]:
+    """Returns the entity class metadata."""
+    return {
+        "code": getattr(cls, "country", None) or getattr(cls, "market"),
+        "default_language": cls.default_language,
+        "subdivisions": tuple(cls.subdivisions),
+        "supported_categories": tuple(sorted(cls.supported_categories)),
+        "supported_languages": tuple(cls.supported_languages),
+    }
+
+
+if __name__ == "__main__":
+    MetadataGenerator().run()
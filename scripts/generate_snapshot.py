@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import os
+import sys
+
+sys.path.append(f"{os.path.dirname(os.path.realpath(__file__))}/../")
+
+from holidays.snapshot import build_snapshot  # noqa: E402
+
+
+class SnapshotGenerator:
+    """Creates a pre-calculated holidays snapshot file."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        arg_parser.add_argument(
+            "-e",
+            "--entity",
+            action="extend",
+            default=[],
+            help="Country or financial market code (all supported ones by default)",
+            nargs="+",
+        )
+        arg_parser.add_argument(
+            "-f",
+            "--from-year",
+            default=1970,
+            help="First year to calculate holidays for",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-o",
+            "--output",
+            default="holidays.snapshot",
+            help="Snapshot file path",
+        )
+        arg_parser.add_argument(
+            "-t",
+            "--to-year",
+            default=2050,
+            help="Last year to calculate holidays for",
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+
+    def run(self) -> None:
+        """Runs the snapshot generation process."""
+        build_snapshot(
+            self.args.output,
+            range(self.args.from_year, self.args.to_year + 1),
+            entities=self.args.entity or None,
+        )
+
+
+if __name__ == "__main__":
+    SnapshotGenerator().run()
@@ -75,6 +75,15 @@ class TestNorway(SundayHolidays):
     def test_sundays(self):
         self.assertSundays(Norway)  # Sundays are considered holidays in Norway.
 
+    def test_population_cache(self):
+        Norway.set_cache_size(8)
+        try:
+            self.assertIn("2023-02-05", Norway(years=2023, include_sundays=True))
+            self.assertNotIn("2023-02-05", Norway(years=2023, include_sundays=False))
+        finally:
+            Norway.set_cache_size(0)
+            Norway.cache_clear()
+
     def test_not_holiday(self):
         # TODO: Add more dates that are often confused for being a holiday.
 
@@ -139,6 +139,15 @@ class TestSweden(SundayHolidays):
     def test_sundays(self):
         self.assertSundays(Sweden)  # Sundays are considered holidays in Sweden.
 
+    def test_population_cache(self):
+        Sweden.set_cache_size(8)
+        try:
+            self.assertIn("2023-02-05", Sweden(years=2023, include_sundays=True))
+            self.assertNotIn("2023-02-05", Sweden(years=2023, include_sundays=False))
+        finally:
+            Sweden.set_cache_size(0)
+            Sweden.cache_clear()
+
     def test_not_holiday(self):
         # Sundays in Sweden are considered holidays,
         # so make sure none of these are actually Sundays.
@@ -0,0 +1,138 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date, timedelta
+
+import holidays
+from holidays.bitsets import DateBitset
+
+
+def iter_days(start_year, end_year):
+    dt = date(start_year, 1, 1)
+    while dt.year <= end_year:
+        yield dt
+        dt += timedelta(days=1)
+
+
+class TestDateBitset(unittest.TestCase):
+    def setUp(self):
+        self.calendars = [holidays.country_holidays(code) for code in ("AE", "DE", "GB", "US")]
+
+    def test_business_days(self):
+        bitset = DateBitset.intersection(
+            *(DateBitset.business_days(h, 2019, 2025) for h in self.calendars)
+        )
+        self.assertEqual(
+            set(bitset),
+            {
+                dt
+                for dt in iter_days(2019, 2025)
+                if all(dt not in h and dt.weekday() not in h.weekend for h in self.calendars)
+            },
+        )
+
+    def test_business_days_year_weekends(self):
+        # Saudi Arabia's weekend changed in 2013.
+        sa = holidays.SA(years=(2010, 2020))
+        self.assertEqual(
+            set(DateBitset.business_days(sa, 2011, 2014)),
+            {
+                dt
+                for dt in iter_days(2011, 2014)
+                if dt not in sa and dt.weekday() not in ({3, 4} if dt.year <= 2012 else {4, 5})
+            },
+        )
+
+    def test_cache(self):
+        us = holidays.US()
+        bitset = DateBitset.from_holidays(us, 2020, 2020)
+        self.assertIs(us._get_year_bits(2020), us._get_year_bits(2020))
+        self.assertNotIn("2020-03-03", bitset)
+
+        us["2020-03-03"] = "Test"
+        bitset = DateBitset.from_holidays(us, 2020, 2020)
+        self.assertIn("2020-03-03", bitset)
+        self.assertEqual(len(bitset), len(us))
+
+    def test_count(self):
+        us = holidays.US()
+        bitset = DateBitset.business_days(us, 2019, 2025)
+        for start, end in (
+            ("2019-01-01", "2025-12-31"),
+            ("2020-02-29", "2020-03-01"),
+            ("2021-07-04", "2024-02-29"),
+            ("2022-12-25", "2022-12-25"),
+        ):
+            self.assertEqual(
+                bitset.count(start, end),
+                sum(
+                    1
+                    for dt in iter_days(2019, 2025)
+                    if start <= str(dt) <= end and dt not in us and dt.weekday() not in us.weekend
+                ),
+            )
+
+        self.assertEqual(bitset.count("2010-01-01", "2030-12-31"), len(bitset))
+        self.assertEqual(bitset.count("2025-12-31", "2019-01-01"), 0)
+        self.assertEqual(bitset.count("2030-01-01", "2030-12-31"), 0)
+
+    def test_count_by_year(self):
+        bitset = DateBitset.from_holidays(holidays.US(), 2019, 2025)
+        self.assertEqual(
+            bitset.count_by_year(),
+            {year: len(holidays.US(years=year)) for year in range(2019, 2026)},
+        )
+
+    def test_from_dates(self):
+        dates = {date(2020, 1, 1), date(2020, 12, 31), date(2021, 12, 31)}
+        bitset = DateBitset.from_dates((*dates, "2022-01-01", "2019-12-31"), 2020, 2021)
+        self.assertEqual(list(bitset), sorted(dates))
+        self.assertEqual(len(bitset), 3)
+        self.assertIn("2020-12-31", bitset)
+        self.assertNotIn("2019-12-31", bitset)
+        self.assertNotIn("2020-12-30", bitset)
+        self.assertRaises(TypeError, lambda: [] in bitset)
+
+    def test_from_holidays(self):
+        bitset = DateBitset.from_holidays(self.calendars[0], 2019, 2025)
+        self.assertEqual(
+            list(bitset), sorted(dt for dt in self.calendars[0] if 2019 <= dt.year <= 2025)
+        )
+
+    def test_from_weekend(self):
+        for weekend in ((), (4,), (4, 5), (5, 6), range(7)):
+            self.assertEqual(
+                set(DateBitset.from_weekend(weekend, 2019, 2025)),
+                {dt for dt in iter_days(2019, 2025) if dt.weekday() in weekend},
+            )
+
+    def test_operators(self):
+        de, gb = (DateBitset.from_holidays(h, 2019, 2025) for h in self.calendars[1:3])
+        de_dates, gb_dates = set(de), set(gb)
+        self.assertEqual(set(de | gb), de_dates | gb_dates)
+        self.assertEqual(set(de & gb), de_dates & gb_dates)
+        self.assertEqual(set(de - gb), de_dates - gb_dates)
+        self.assertEqual(set(de ^ gb), de_dates ^ gb_dates)
+        self.assertEqual(set(~de), set(iter_days(2019, 2025)) - de_dates)
+        self.assertEqual(~~de, de)
+        self.assertEqual(len(~DateBitset(2019, 2025)), len(list(iter_days(2019, 2025))))
+        self.assertEqual(DateBitset.union(de, gb), de | gb)
+        self.assertEqual(DateBitset.intersection(de, gb), de & gb)
+        self.assertFalse(DateBitset(2019, 2025))
+        self.assertTrue(de)
+        self.assertEqual(hash(de), hash(DateBitset(2019, 2025, de.bits)))
+        self.assertNotEqual(de, DateBitset(2019, 2026, de.bits))
+        self.assertEqual(repr(de), f"DateBitset(2019, 2025, {len(de_dates)} dates)")
+
+        self.assertRaises(ValueError, lambda: de | DateBitset(2019, 2026))
+        self.assertRaises(TypeError, lambda: de | set())
+        self.assertRaises(ValueError, lambda: DateBitset(2025, 2019))
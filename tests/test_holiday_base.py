@@ -9,14 +9,40 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import copy
 import pickle
+import random
+import sys
+import threading
 import unittest
+import warnings
 from datetime import date, datetime
 from datetime import timedelta as td
-
-from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, SAT, SUN
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from holidays.calendars.gregorian import (
+    JAN,
+    FEB,
+    JUL,
+    AUG,
+    OCT,
+    DEC,
+    MON,
+    TUE,
+    THU,
+    FRI,
+    SAT,
+    SUN,
+)
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC
-from holidays.holiday_base import HolidayBase
+from holidays.countries.germany import Germany
+from holidays.holiday_base import FrozenHolidays, HolidayBase, HolidaySum
+from holidays.utils import country_holidays, list_supported_countries
 
 
 class EntityStub(HolidayBase):
@@ -89,6 +115,21 @@ class CountryStub3(HolidayBase):
         self._add_holiday_may_2("Custom May 2nd Holiday")
 
 
+class CountryStub4(HolidayBase):
+    country = "CS4"
+
+    def _populate(self, year: int) -> None:
+        super()._populate(year)
+        # The weekend changes over the years.
+        self.weekend = {THU, FRI} if year <= 2012 else {FRI, SAT}
+        self._add_holiday_jun_1("Custom June 1st Holiday")
+
+
+def is_business_day(holidays, dt):
+    """Reference implementation using the weekend of the date's year."""
+    return dt not in holidays and dt.weekday() not in holidays._get_weekend(dt.year)
+
+
 class MarketStub1(EntityStub):
     market = "MS1"
 
@@ -154,6 +195,390 @@ class TestArgs(unittest.TestCase):
         self.assertSetEqual(HolidayBase(years=2015).years, {2015})
 
 
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBusdayOffset(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1()
+
+    def test_busday_offset(self):
+        self.assertListEqual(
+            self.hb.busday_offset(["2014-07-03", "2014-12-24", "2013-12-31"], [1, 1, 1]).tolist(),
+            [date(2014, 7, 7), date(2014, 12, 26), date(2014, 1, 2)],
+        )
+        self.assertSetEqual(self.hb.years, {2012, 2013, 2014, 2015})
+
+        self.assertRaises(ValueError, lambda: self.hb.busday_offset(["2014-07-04"], 1))
+        self.assertEqual(
+            self.hb.busday_offset("2014-07-04", 1, roll="backward"),
+            np.datetime64("2014-07-07"),
+        )
+        self.assertTrue(np.isnat(self.hb.busday_offset("NaT", 1, roll="nat")))
+
+    def test_busday_offset_consistency(self):
+        dts = np.arange("2019-01-01", "2021-01-01", dtype="datetime64[D]")
+        result = self.hb.busday_offset(dts, 600, roll="backward")
+        self.assertTrue(self.hb.years.issuperset(range(2019, 2023)))
+        for dt, dt_result in zip(dts[::17].astype(date), result[::17].astype(date)):
+            self.assertEqual(self.hb.add_business_days(dt, 600), dt_result)
+
+    def test_holiday_sum(self):
+        class WeekendStub(CountryStub3):
+            weekend = {FRI, SAT}
+
+        hb = CountryStub1() + WeekendStub()
+        self.assertSetEqual(hb.weekend, {FRI, SAT, SUN})
+        # 2014-05-01 is Thursday.
+        self.assertEqual(hb.busday_offset("2014-04-30", 1), np.datetime64("2014-05-05"))
+        self.assertEqual(hb.busday_offset("2014-07-03", 1), np.datetime64("2014-07-07"))
+
+    def test_to_busdaycalendar(self):
+        calendar = self.hb.to_busdaycalendar(2014, 2015)
+        self.assertListEqual(calendar.weekmask.tolist(), [1, 1, 1, 1, 1, 0, 0])
+        self.assertListEqual(
+            calendar.holidays.astype(date).tolist(),
+            [dt for dt in self.hb["2014-01-01":"2016-01-01"] if not self.hb._is_weekend(dt)],
+        )
+        self.assertSetEqual(self.hb.years, {2014, 2015, 2016})
+
+        hb = CountryStub1(years=2014, expand=False)
+        self.assertEqual(len(hb.to_busdaycalendar(2013, 2015).holidays), 5)
+        self.assertSetEqual(hb.years, {2014})
+
+    def test_year_weekends(self):
+        hb = CountryStub4()
+        calendar = hb.to_busdaycalendar(2011, 2014)
+        self.assertListEqual(calendar.weekmask.tolist(), [1, 1, 1, 1, 0, 1, 1])
+        self.assertListEqual(
+            calendar.holidays.astype(date).tolist(),
+            [
+                dt
+                for dt in (date(2011, 1, 1) + td(days=days) for days in range(1461))
+                if not is_business_day(hb, dt) and dt.weekday() != FRI
+            ],
+        )
+
+        dts = [
+            dt
+            for dt in (date(2011, 6, 1) + td(days=days) for days in range(0, 1100, 13))
+            if is_business_day(hb, dt)
+        ]
+        for n in (-300, -1, 1, 300):
+            for dt, dt_result in zip(dts, hb.busday_offset(dts, n).astype(date)):
+                self.assertEqual(hb.add_business_days(dt, n), dt_result)
+
+
+class TestBusinessDays(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1()
+
+    def test_add_business_days(self):
+        # 2014-07-04 is Friday.
+        self.assertEqual(self.hb.add_business_days("2014-07-03", 1), date(2014, 7, 7))
+        self.assertEqual(self.hb.add_business_days("2014-07-03", 2), date(2014, 7, 8))
+        self.assertEqual(self.hb.add_business_days("2014-07-07", -1), date(2014, 7, 3))
+        self.assertEqual(self.hb.add_business_days("2014-07-05", -1), date(2014, 7, 3))
+        self.assertEqual(self.hb.add_business_days("2014-07-05", 0), date(2014, 7, 5))
+
+        # Year boundaries.
+        self.assertEqual(self.hb.add_business_days("2013-12-31", 1), date(2014, 1, 2))
+        self.assertEqual(self.hb.add_business_days("2014-01-02", -1), date(2013, 12, 31))
+        self.assertEqual(self.hb.add_business_days("2014-01-02", -2), date(2013, 12, 30))
+        self.assertEqual(self.hb.add_business_days("2013-01-02", 500), date(2014, 12, 15))
+        self.assertEqual(self.hb.add_business_days("2014-12-15", -500), date(2013, 1, 2))
+        self.assertSetEqual(self.hb.years, {2013, 2014})
+
+    def test_brute_force(self):
+        def is_business_day(dt):
+            return not self.hb._is_weekend(dt) and dt not in self.hb
+
+        start = date(2019, 12, 20)
+        for days in range(0, 800, 7):
+            dt = start + td(days=days)
+            for n in (-260, -13, -1, +1, +5, +260):
+                expected = dt
+                for _ in range(abs(n)):
+                    expected += td(days=+1 if n > 0 else -1)
+                    while not is_business_day(expected):
+                        expected += td(days=+1 if n > 0 else -1)
+                self.assertEqual(self.hb.add_business_days(dt, n), expected)
+
+            count = sum(is_business_day(start + td(days=d)) for d in range(days))
+            self.assertEqual(self.hb.business_days_between(start, dt), count)
+            self.assertEqual(self.hb.business_days_between(dt, start), -count)
+
+    def test_business_days_between(self):
+        self.assertEqual(self.hb.business_days_between("2014-07-03", "2014-07-03"), 0)
+        self.assertEqual(self.hb.business_days_between("2014-07-03", "2014-07-04"), 1)
+        self.assertEqual(self.hb.business_days_between("2014-07-03", "2014-07-08"), 2)
+        self.assertEqual(self.hb.business_days_between("2014-07-08", "2014-07-03"), -2)
+        self.assertEqual(self.hb.business_days_between("2014-01-01", "2015-01-01"), 256)
+
+    def test_modification(self):
+        self.assertEqual(self.hb.next_business_day("2014-07-03"), date(2014, 7, 7))
+        self.hb["2014-07-07"] = "Custom Holiday"
+        self.assertEqual(self.hb.next_business_day("2014-07-03"), date(2014, 7, 8))
+        self.hb.pop("2014-07-04")
+        self.assertEqual(self.hb.next_business_day("2014-07-03"), date(2014, 7, 4))
+
+        self.hb.observed = False
+        self.assertEqual(self.hb.next_business_day("2015-07-02"), date(2015, 7, 3))
+        self.hb.observed = True
+        self.assertEqual(self.hb.next_business_day("2015-07-02"), date(2015, 7, 6))
+
+    def test_no_expand(self):
+        hb = CountryStub1(years=2014, expand=False)
+        self.assertEqual(hb.next_business_day("2014-12-31"), date(2015, 1, 1))
+        self.assertSetEqual(hb.years, {2014})
+
+    def test_previous_and_next_business_day(self):
+        self.assertEqual(self.hb.next_business_day("2014-12-24"), date(2014, 12, 26))
+        self.assertEqual(self.hb.previous_business_day("2014-12-26"), date(2014, 12, 24))
+        self.assertEqual(self.hb.previous_business_day("2014-01-06"), date(2014, 1, 3))
+
+    def test_weekend(self):
+        class WeekendStub(CountryStub1):
+            weekend = {FRI, SAT}
+
+        hb = WeekendStub()
+        # 2014-07-04 is Friday.
+        self.assertEqual(hb.next_business_day("2014-07-03"), date(2014, 7, 6))
+        self.assertEqual(hb.business_days_between("2014-06-30", "2014-07-07"), 5)
+
+    def test_year_weekends(self):
+        hb = CountryStub4(years=(2010, 2020))
+        # 2010-06-03 is Thursday.
+        self.assertEqual(hb.next_business_day("2010-06-02"), date(2010, 6, 5))
+        self.assertEqual(hb.next_business_day("2020-06-03"), date(2020, 6, 4))
+        self.assertEqual(hb._get_weekend(2010), {THU, FRI})
+        self.assertEqual(hb._get_weekend(2020), {FRI, SAT})
+
+        start = date(2012, 12, 20)
+        count = 0
+        for days in range(30):
+            dt = start + td(days=days)
+            self.assertEqual(hb.business_days_between(start, dt), count)
+            count += is_business_day(hb, dt)
+
+        sa = country_holidays("SA", years=(2010, 2020))
+        self.assertEqual(sa.next_business_day("2010-06-02"), date(2010, 6, 5))
+        self.assertEqual(sa.next_business_day("2020-06-03"), date(2020, 6, 4))
+
+
+class TestCompactStorage(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(years=range(2012, 2017))
+        self.compact = CountryStub1(years=range(2012, 2017), compact=True)
+
+    def test_business_days(self):
+        self.assertEqual(
+            self.compact.add_business_days("2014-07-03", 10),
+            self.hb.add_business_days("2014-07-03", 10),
+        )
+        self.assertEqual(
+            self.compact.business_days_between("2013-01-01", "2016-01-01"),
+            self.hb.business_days_between("2013-01-01", "2016-01-01"),
+        )
+
+    def test_copy(self):
+        for hb in (copy.copy(self.compact), self.compact.copy(), copy.deepcopy(self.compact)):
+            self.assertEqual(hb, self.hb)
+            hb["2014-01-02"] = "Custom Holiday"
+            self.assertIn("2014-01-02", hb)
+            self.assertNotIn("2014-01-02", self.compact)
+
+    def test_dict_api(self):
+        self.assertEqual(self.compact, self.hb)
+        self.assertEqual(self.hb, self.compact)
+        self.assertEqual(dict(self.compact), dict(self.hb))
+        self.assertEqual(len(self.compact), len(self.hb))
+        self.assertEqual(dict.__len__(self.compact), 0)
+        self.assertEqual(list(self.compact), sorted(self.hb))
+        self.assertEqual(list(self.compact.keys()), sorted(self.hb.keys()))
+        self.assertEqual(list(self.compact.items()), sorted(self.hb.items()))
+        self.assertEqual(list(self.compact.values()), [self.hb[dt] for dt in sorted(self.hb)])
+        self.assertIn((date(2014, 7, 4), "Independence Day"), self.compact.items())
+        self.assertIn("Independence Day", self.compact.values())
+
+        self.assertIn("2014-07-04", self.compact)
+        self.assertNotIn("2014-07-05", self.compact)
+        self.assertEqual(self.compact["2014-07-04"], "Independence Day")
+        self.assertEqual(self.compact.get("2014-07-04"), "Independence Day")
+        self.assertIsNone(self.compact.get("2014-07-05"))
+        self.assertRaises(KeyError, lambda: self.compact["2014-07-05"])
+        self.assertEqual(self.compact.contains_many(["2014-07-04", "2014-07-05"]), [True, False])
+        self.assertEqual(
+            self.compact["2014-01-01":"2015-01-01"], self.hb["2014-01-01":"2015-01-01"]
+        )
+        self.assertEqual(
+            list(self.compact.iter_range("2014-01-01", "2015-01-01")),
+            list(self.hb.iter_range("2014-01-01", "2015-01-01")),
+        )
+        self.assertEqual(repr(self.compact), repr(dict(sorted(self.hb.items()))))
+
+    def test_expand(self):
+        self.assertIn("2020-07-04", self.compact)
+        self.assertIn(2020, self.compact.years)
+
+        hb = CountryStub1(compact=True, max_years=2)
+        for year in range(2010, 2020):
+            self.assertIn(date(year, 7, 4), hb)
+        self.assertEqual(hb.years, {2018, 2019})
+        self.assertEqual(len(hb), len(CountryStub1(years=(2018, 2019))))
+
+        hb = CountryStub1(years=range(2012, 2017), compact=True, lazy=True)
+        self.assertEqual(hb, self.hb)
+
+    def test_modification(self):
+        self.compact["2014-07-04"] = "Custom Holiday"
+        self.assertEqual(
+            self.compact["2014-07-04"],
+            HOLIDAY_NAME_DELIMITER.join(("Custom Holiday", "Independence Day")),
+        )
+        self.compact.update({"2014-07-05": "Custom Holiday"})
+        self.assertEqual(self.compact["2014-07-05"], "Custom Holiday")
+
+        self.assertEqual(self.compact.pop("2014-07-05"), "Custom Holiday")
+        self.assertEqual(self.compact.pop("2014-07-05", "Default"), "Default")
+        self.assertRaises(KeyError, lambda: self.compact.pop("2014-07-05"))
+        self.assertEqual(self.compact.pop_named("Custom Holiday"), [date(2014, 7, 4)])
+        self.assertEqual(self.compact, self.hb)
+
+        del self.compact[date(2014, 7, 4)]
+        self.assertNotIn("2014-07-04", self.compact)
+
+        self.compact.observed = False
+        self.hb.observed = False
+        self.assertEqual(self.compact, self.hb)
+
+        self.compact.clear()
+        self.assertEqual(len(self.compact), 0)
+
+    def test_pickle(self):
+        hb = pickle.loads(pickle.dumps(self.compact))
+        self.assertEqual(hb, self.hb)
+        self.assertEqual(dict.__len__(hb), 0)
+
+
+class TestConcurrentExpansion(unittest.TestCase):
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_expansion(self):
+        hb = CountryStub1()
+        expected = dict(CountryStub1(years=range(1950, 2050)))
+        mismatches = []
+
+        def lookup(seed):
+            rnd = random.Random(seed)
+            for _ in range(1000):
+                dt = date(
+                    rnd.randint(1950, 2049), rnd.choice((JAN, JUL, AUG, DEC)), rnd.randint(1, 31)
+                )
+                if hb.get(dt) != expected.get(dt):
+                    mismatches.append(dt)
+
+        threads = [threading.Thread(target=lookup, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mismatches, [])
+        self.assertEqual(hb, CountryStub1(years=hb.years))
+
+    def test_concurrent_business_days(self):
+        for _ in range(5):
+            hb = CountryStub1()
+            expected = CountryStub1(years=range(1950, 2050))
+            mismatches = []
+
+            def count(seed):
+                rnd = random.Random(seed)
+                for _ in range(100):
+                    start = date(rnd.randint(1950, 2049), rnd.randint(1, 12), 1)
+                    end = min(start + td(days=rnd.randint(0, 1000)), date(2049, 12, 31))
+                    if hb.business_days_between(start, end) != expected.business_days_between(
+                        start, end
+                    ):
+                        mismatches.append((start, end))
+
+            threads = [threading.Thread(target=count, args=(seed,)) for seed in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(mismatches, [])
+
+    def test_copy(self):
+        hb = CountryStub1(years=2020)
+        self.assertIsNot(copy.copy(hb)._expansion_lock, hb._expansion_lock)
+        self.assertIsNot(pickle.loads(pickle.dumps(hb))._expansion_lock, hb._expansion_lock)
+
+
+class TestContainsMany(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1()
+
+    def test_list(self):
+        self.assertListEqual(
+            self.hb.contains_many(
+                [date(2014, 1, 1), "2014-01-02", datetime(2015, 7, 4, 10), "2016-12-25"]
+            ),
+            [True, False, True, True],
+        )
+        self.assertSetEqual(self.hb.years, {2014, 2015, 2016})
+        self.assertListEqual(self.hb.contains_many([]), [])
+        self.assertRaises(TypeError, lambda: self.hb.contains_many([(2014, 1, 1)]))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy(self):
+        dts = np.array(
+            ["2014-01-01", "2014-01-02", "2015-07-04", "NaT", "2016-12-25"],
+            dtype="datetime64[D]",
+        )
+        mask = self.hb.contains_many(dts)
+        self.assertIsInstance(mask, np.ndarray)
+        self.assertListEqual(mask.tolist(), [True, False, True, False, True])
+        self.assertSetEqual(self.hb.years, {2014, 2015, 2016})
+
+        dts = np.arange("2014-01-01", "2017-01-01", dtype="datetime64[D]")
+        self.assertListEqual(
+            dts[self.hb.contains_many(dts)].astype(date).tolist(),
+            self.hb["2014-01-01":"2017-01-01"],
+        )
+
+        dts = np.array(["2014-12-25T10:30", "2014-12-26T00:00"], dtype="datetime64[m]")
+        self.assertListEqual(self.hb.contains_many(dts).tolist(), [True, False])
+
+        self.hb.pop("2014-12-25")
+        self.assertListEqual(self.hb.contains_many(dts).tolist(), [False, False])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_timestamps(self):
+        # 2014-01-01T17:30:45 and 2014-01-02T17:30:45 UTC.
+        timestamps = [1388597445, 1388683845]
+        self.assertListEqual([timestamp in self.hb for timestamp in timestamps], [True, False])
+        for dtype in (np.int64, np.uint32, np.float64):
+            self.assertListEqual(
+                self.hb.contains_many(np.array(timestamps, dtype=dtype)).tolist(), [True, False]
+            )
+        self.assertListEqual(
+            self.hb.contains_many(np.array([1388597445.5, np.nan])).tolist(), [True, False]
+        )
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_no_expand(self):
+        hb = CountryStub1(years=2014, expand=False)
+        dts = np.array(["2014-01-01", "2015-01-01"], dtype="datetime64[D]")
+        self.assertListEqual(hb.contains_many(dts).tolist(), [True, False])
+        self.assertSetEqual(hb.years, {2014})
+
+
 class TestDeprecationWarnings(unittest.TestCase):
     def test_prov_deprecation(self):
         with self.assertWarns(Warning):
@@ -240,6 +665,104 @@ class TestEqualityInequality(unittest.TestCase):
         self.assertFalse(hb_3 != hb_3)
 
 
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(years=range(2012, 2017))
+        self.hb._add_holiday_dec_20("Custom Holiday")
+        self.frozen = self.hb.freeze()
+
+    def test_attributes(self):
+        self.assertIsInstance(self.frozen, FrozenHolidays)
+        self.assertEqual(self.frozen.country, "CS1")
+        self.assertEqual(self.frozen.weekend, {SAT, SUN})
+        self.assertEqual(self.frozen.years, set(range(2012, 2017)))
+        self.assertTrue(self.frozen.observed)
+
+    def test_business_days(self):
+        hb = CountryStub1(years=range(2012, 2017), expand=False)
+        hb._add_holiday_dec_20("Custom Holiday")
+        start = date(2013, 12, 20)
+        for days in range(0, 600, 11):
+            dt = start + td(days=days)
+            for n in (-260, -13, -1, 0, +1, +5, +260):
+                self.assertEqual(self.frozen.add_business_days(dt, n), hb.add_business_days(dt, n))
+            self.assertEqual(
+                self.frozen.business_days_between(start, dt), hb.business_days_between(start, dt)
+            )
+            self.assertEqual(
+                self.frozen.business_days_between(dt, start), hb.business_days_between(dt, start)
+            )
+        self.assertEqual(self.frozen.next_business_day("2014-07-03"), date(2014, 7, 7))
+        self.assertEqual(self.frozen.previous_business_day("2014-07-07"), date(2014, 7, 3))
+
+    def test_year_weekends(self):
+        hb = CountryStub4(years=range(2010, 2016), expand=False)
+        frozen = hb.freeze()
+        self.assertEqual(frozen.weekend, {FRI, SAT})
+        self.assertEqual(
+            frozen.year_weekends, ((2010, {THU, FRI}), (2011, {THU, FRI}), (2012, {THU, FRI}))
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+        start = date(2011, 12, 20)
+        for days in range(0, 500, 7):
+            dt = start + td(days=days)
+            for n in (-260, -13, -1, 0, +1, +5, +260):
+                self.assertEqual(frozen.add_business_days(dt, n), hb.add_business_days(dt, n))
+            self.assertEqual(
+                frozen.business_days_between(start, dt), hb.business_days_between(start, dt)
+            )
+
+    def test_hash(self):
+        self.assertEqual(self.frozen, self.hb.freeze())
+        self.assertEqual(hash(self.frozen), hash(self.hb.freeze()))
+        self.assertNotEqual(self.frozen, CountryStub1(years=range(2012, 2017)).freeze())
+        self.assertNotEqual(self.frozen, dict(self.frozen))
+        self.assertEqual(len({self.frozen, self.hb.freeze()}), 1)
+
+    def test_immutable(self):
+        def set_observed():
+            self.frozen.observed = False
+
+        def del_years():
+            del self.frozen.years
+
+        def set_holiday():
+            self.frozen["2014-01-02"] = "Holiday"
+
+        self.assertRaises(AttributeError, set_observed)
+        self.assertRaises(AttributeError, del_years)
+        self.assertRaises(TypeError, set_holiday)
+
+    def test_invalid_parameters(self):
+        self.assertRaises(ValueError, lambda: FrozenHolidays((1, 2), ("Holiday",), (), ()))
+        self.assertRaises(ValueError, lambda: FrozenHolidays((), (), range(7), ()))
+
+    def test_iter_range(self):
+        self.assertEqual(
+            list(self.frozen.iter_range("2014-07-01", "2015-01-01")),
+            list(self.hb.iter_range("2014-07-01", "2015-01-01")),
+        )
+
+    def test_lookup(self):
+        self.assertEqual(dict(self.frozen), dict(self.hb))
+        self.assertEqual(list(self.frozen), sorted(self.hb))
+        self.assertEqual(len(self.frozen), len(self.hb))
+        self.assertIn("2015-12-20", self.frozen)
+        self.assertEqual(self.frozen["2015-12-20"], "Custom Holiday")
+        self.assertEqual(self.frozen.get(date(2015, 12, 20)), "Custom Holiday")
+        self.assertEqual(self.frozen.get_list("2015-12-20"), ["Custom Holiday"])
+        self.assertEqual(self.frozen.get_list("2015-12-21"), [])
+        self.assertIsNone(self.frozen.get("2015-12-21"))
+        # Years not calculated before freezing are never expanded.
+        self.assertNotIn("2020-12-20", self.frozen)
+        self.assertRaises(KeyError, lambda: self.frozen["2020-12-20"])
+        self.assertRaises(TypeError, lambda: {} in self.frozen)
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.frozen)), self.frozen)
+        self.assertEqual(copy.deepcopy(self.frozen), self.frozen)
+
+
 class TestGetList(unittest.TestCase):
     def test_get_list_multiple_countries(self):
         hb_country_1 = CountryStub1(years=2021)
@@ -530,6 +1053,114 @@ class TestHolidaySum(unittest.TestCase):
         self.assertEqual(self.hb_combined.country, CountryStub1.country)
         self.assertEqual(self.hb_combined.subdiv, list(CountryStub1.subdivisions))
 
+    def test_copy(self):
+        for years in (2014, range(2000, 2030)):
+            hb_copy = HolidaySum(CountryStub1(years=years), CountryStub2(years=years))
+            hb_no_copy = HolidaySum(
+                CountryStub1(years=years), CountryStub2(years=years), copy=False
+            )
+            self.assertEqual(dict(hb_copy.items()), dict(hb_no_copy.items()))
+            self.assertEqual(hb_copy, hb_no_copy)
+            self.assertEqual(hb_copy.get_list("2014-08-10"), hb_no_copy.get_list("2014-08-10"))
+
+        hb_1 = CountryStub1(subdiv="Subdiv1")
+        hb_2 = CountryStub1(subdiv="Subdiv2")
+        hb_combined = HolidaySum(hb_1, hb_2, copy=False)
+        self.assertEqual(
+            hb_combined["2014-08-10"], "Subdiv1 Custom Holiday; Subdiv2 Custom Holiday"
+        )
+        # Nothing is copied into the sum object, only the year requested is
+        # calculated in the operands.
+        self.assertEqual(dict.__len__(hb_combined), 0)
+        self.assertEqual(hb_1.years, {2014})
+        self.assertEqual(hb_2.years, {2014})
+        self.assertEqual(len(hb_combined), len(set(hb_1).union(hb_2)))
+        self.assertEqual(list(hb_combined), sorted(set(hb_1).union(hb_2)))
+
+        # The mode is kept when adding more operands.
+        hb_combined += CountryStub3()
+        self.assertEqual(dict.__len__(hb_combined), 0)
+        self.assertIn("2014-05-01", hb_combined)
+        self.assertEqual(len(hb_combined.holidays), 3)
+        self.assertNotEqual(dict.__len__(hb_1 + hb_2), 0)
+
+    def test_get_sources(self):
+        for copy_holidays in (True, False):
+            hb_1 = CountryStub1(subdiv="Subdiv1")
+            hb_2 = CountryStub1(subdiv="Subdiv2")
+            hb_combined = HolidaySum(hb_1, hb_2, copy=copy_holidays) + self.hb_3
+            self.assertListEqual(
+                hb_combined.get_sources("2014-08-10"),
+                [(0, "Subdiv1 Custom Holiday"), (1, "Subdiv2 Custom Holiday")],
+            )
+            self.assertListEqual(
+                hb_combined.get_sources("2014-07-04"),
+                [(0, "Independence Day"), (1, "Independence Day")],
+            )
+            self.assertListEqual(
+                hb_combined.get_sources(date(2014, 5, 1)), [(2, "Custom May 1st Holiday")]
+            )
+            self.assertListEqual(hb_combined.get_sources("2014-01-02"), [])
+
+            # Only the names the sum object has are returned.
+            hb_combined["2014-08-10"] = "Custom Holiday"
+            hb_combined.pop_named("Subdiv2 Custom Holiday")
+            self.assertListEqual(
+                hb_combined.get_sources("2014-08-10"), [(0, "Subdiv1 Custom Holiday")]
+            )
+            del hb_combined[date(2014, 7, 4)]
+            self.assertListEqual(hb_combined.get_sources("2014-07-04"), [])
+
+    def test_get_sources_interned_names(self):
+        hb_1 = CountryStub1(subdiv="Subdiv1", years=2014)
+        hb_2 = CountryStub1(subdiv="Subdiv2", years=2014)
+        hb_combined = HolidaySum(hb_1, hb_2, copy=False)
+        sources = [(0, "Subdiv1 Custom Holiday"), (1, "Subdiv2 Custom Holiday")]
+        self.assertListEqual(hb_combined.get_sources("2014-08-10"), sources)
+
+        # The names produced by the entities are split by the name tables only
+        # once, only the values set by users are split on each call.
+        with mock.patch("holidays.holiday_base.HOLIDAY_NAME_DELIMITER", "|"):
+            self.assertListEqual(hb_combined.get_sources("2014-08-10"), sources)
+            del hb_combined[date(2014, 8, 10)]
+            hb_combined["2014-08-10"] = "Subdiv1 Custom Holiday|User Holiday"
+            self.assertListEqual(hb_combined.get_sources("2014-08-10"), sources[:1])
+
+    def test_no_copy_changes(self):
+        hb_1 = CountryStub1(years=2014)
+        hb_2 = CountryStub2(years=2014)
+        hb_combined = HolidaySum(hb_1, hb_2, copy=False)
+
+        hb_combined["2014-01-02"] = "Custom Holiday"
+        hb_combined["2014-07-04"] = "Custom Holiday"
+        del hb_combined[date(2014, 1, 1)]
+        self.assertEqual(hb_combined.pop("2014-03-01"), "Custom March 1st Holiday")
+        self.assertEqual(hb_combined["2014-01-02"], "Custom Holiday")
+        self.assertEqual(hb_combined["2014-07-04"], "Custom Holiday; Independence Day")
+        self.assertNotIn("2014-01-01", hb_combined)
+        self.assertNotIn("2014-03-01", hb_combined)
+        self.assertRaises(KeyError, lambda: hb_combined.pop("2014-01-01"))
+        self.assertEqual(
+            list(hb_combined),
+            sorted(
+                (set(hb_1) | set(hb_2) | {date(2014, 1, 2)}) - {date(2014, 1, 1), date(2014, 3, 1)}
+            ),
+        )
+
+        # The operands aren't changed.
+        self.assertNotIn("2014-01-02", hb_1)
+        self.assertIn("2014-01-01", hb_1)
+        self.assertEqual(hb_1["2014-07-04"], "Independence Day")
+
+        hb_copy = pickle.loads(pickle.dumps(hb_combined))
+        self.assertEqual(dict(hb_copy.items()), dict(hb_combined.items()))
+        self.assertIsNot(hb_copy.holidays[0], hb_1)
+
+        hb_combined.clear()
+        self.assertEqual(len(hb_combined), 0)
+        self.assertNotIn("2014-07-04", hb_combined)
+        self.assertIn("2014-07-04", hb_1)
+
 
 class TestInheritance(unittest.TestCase):
     def setUp(self):
@@ -560,6 +1191,71 @@ class TestInheritance(unittest.TestCase):
         self.assertIn("2020-07-13", hb)
 
 
+class TestIterRange(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1()
+
+    def test_empty_range(self):
+        self.assertListEqual(list(self.hb.iter_range("2014-01-01", "2014-01-01")), [])
+        self.assertListEqual(list(self.hb.iter_range("2015-01-01", "2014-01-01")), [])
+
+    def test_evict(self):
+        hb = CountryStub1(years=2015)
+        holidays_2015 = dict(hb)
+        self.assertListEqual(
+            list(hb.iter_range("2010-01-01", "2020-01-01", evict=True)),
+            list(self.hb.iter_range("2010-01-01", "2020-01-01")),
+        )
+        self.assertEqual(hb.years, {2015})
+        self.assertEqual(dict(hb), holidays_2015)
+
+        hb = CountryStub1(years=range(2010, 2020), lazy=True)
+        for _ in hb.iter_range("2010-01-01", "2020-01-01", evict=True):
+            # The end date year and at most two iterated years.
+            self.assertLessEqual(len(hb.years - hb._pending_years), 3)
+        self.assertEqual(hb.years, set(range(2010, 2020)))
+        self.assertEqual(hb._pending_years, set(range(2010, 2020)))
+        self.assertEqual(dict.__len__(hb), 0)
+
+        hb = CountryStub1()
+        iterator = hb.iter_range("2010-01-01", "2020-01-01", evict=True)
+        next(iterator)
+        iterator.close()
+        self.assertEqual(hb.years, set())
+        self.assertEqual(dict.__len__(hb), 0)
+
+    def test_expand(self):
+        hb = CountryStub1(years=2015, expand=False)
+        self.assertListEqual(
+            list(hb.iter_range("2010-01-01", "2020-01-01")),
+            sorted(CountryStub1(years=2015).items()),
+        )
+        self.assertEqual(hb.years, {2015})
+
+    def test_iter_range(self):
+        self.assertListEqual(
+            list(self.hb.iter_range("2010-12-31", "2012-01-02")),
+            [
+                (date(2010, 12, 31), "New Year's Day (Observed)"),
+                (date(2011, 1, 1), "New Year's Day"),
+                (date(2011, 6, 19), "Juneteenth National Independence Day"),
+                (date(2011, 6, 20), "Juneteenth National Independence Day (Observed)"),
+                (date(2011, 7, 4), "Independence Day"),
+                (date(2011, 11, 24), "Thanksgiving"),
+                (date(2011, 12, 25), "Christmas Day"),
+                (date(2011, 12, 26), "Christmas Day (Observed)"),
+                (date(2012, 1, 1), "New Year's Day"),
+            ],
+        )
+        self.assertEqual(self.hb.years, {2010, 2011, 2012})
+
+        for start, end in ((date(1900, 1, 1), date(2100, 1, 1)), ("2014-05-05", "2016-02-29")):
+            self.assertListEqual(
+                list(self.hb.iter_range(start, end)),
+                [(dt, self.hb[dt]) for dt in self.hb[start:end]],
+            )
+
+
 class TestKeyTransforms(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub1()
@@ -612,7 +1308,32 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertNotIn("2014-03-01", self.hb)
         self.assertEqual(self.hb.pop("01/03/2014"), "Fake Holiday")
 
+    def test_string_fast_path(self):
+        for key in (
+            "2014-01-01",
+            "20140101",
+            "2014-01-01T10:00:00Z",
+            "2014-01-01T23:59:59.123456-05:00",
+            "2014-01-01 10:00",
+        ):
+            self.assertIn(key, self.hb)
+        self.assertNotIn("2014-01-02T00:00:00+14:00", self.hb)
+
+        slow_parses = HolidayBase.parse_info().slow_parses
+        for key in ("2014-01-01", "20140101", "2014-01-01T10:00:00Z"):
+            self.assertIn(key, self.hb)
+        self.assertEqual(HolidayBase.parse_info().slow_parses, slow_parses)
+
+        for key in ("Jan 1, 2014", "2014/01/01"):
+            self.assertIn(key, self.hb)
+        self.assertEqual(HolidayBase.parse_info().slow_parses, slow_parses + 2)
+
+        for key in ("2014-02-30", "20140230", "2014-01-01T25:00"):
+            self.assertRaises(ValueError, self.hb.get, key)
+
     def test_timestamp(self):
+        self.assertEqual(self.hb.__keytransform__(-1), date(1969, 12, 31))
+        self.assertEqual(self.hb.__keytransform__(0), date(1970, 1, 1))
         self.assertIn(1388552400, self.hb)
         self.assertEqual(self.hb[1388552400], "New Year's Day")
         self.assertIn(1388552400.01, self.hb)
@@ -624,6 +1345,156 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertNotIn(1388725201, self.hb)
 
 
+class TestLazyPopulation(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub1(years=range(2010, 2030), lazy=True)
+
+    def test_equality(self):
+        self.assertEqual(self.hb, CountryStub1(years=range(2010, 2030)))
+        self.assertNotEqual(
+            CountryStub1(years=range(2010, 2030), lazy=True),
+            CountryStub1(years=range(2010, 2031)),
+        )
+
+    def test_expand(self):
+        self.assertEqual(dict.__len__(self.hb), 0)
+        self.assertIn("2021-12-31", self.hb)
+        self.assertEqual(self.hb._pending_years, set(range(2010, 2030)) - {2021})
+        self.assertIn("2035-01-01", self.hb)
+        self.assertEqual(self.hb.years, set(range(2010, 2030)) | {2035})
+
+        hb = CountryStub1(years=range(2010, 2030), expand=False, lazy=True)
+        self.assertIn("2021-01-01", hb)
+        self.assertNotIn("2035-01-01", hb)
+        self.assertEqual(hb.years, set(range(2010, 2030)))
+        self.assertEqual(
+            hb[date(2014, 1, 1) : date(2016, 1, 1)],
+            CountryStub1(years=range(2014, 2016))[date(2014, 1, 1) : date(2016, 1, 1)],
+        )
+
+    def test_iteration(self):
+        self.assertEqual(len(self.hb._pending_years), 20)
+        self.assertEqual(len(self.hb), len(CountryStub1(years=range(2010, 2030))))
+        self.assertEqual(len(self.hb._pending_years), 0)
+
+        for method in ("items", "keys", "values", "__iter__"):
+            hb = CountryStub1(years=range(2010, 2030), lazy=True)
+            self.assertEqual(
+                list(getattr(hb, method)()),
+                list(getattr(CountryStub1(years=range(2010, 2030)), method)()),
+            )
+
+    def test_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.hb)), CountryStub1(years=range(2010, 2030))
+        )
+
+    def test_setattr(self):
+        self.assertIn("2021-07-04", self.hb)
+        self.assertIn("2021-07-05", self.hb)
+
+        self.hb.observed = False
+        self.assertEqual(len(self.hb._pending_years), 19)
+        self.assertIn("2021-07-04", self.hb)
+        self.assertNotIn("2021-07-05", self.hb)
+        self.assertEqual(self.hb, CountryStub1(years=range(2010, 2030), observed=False))
+
+
+class TestMaxYears(unittest.TestCase):
+    def test_invalid_max_years(self):
+        self.assertRaises(ValueError, lambda: CountryStub1(max_years=0))
+
+    def test_max_years(self):
+        hb = CountryStub1(max_years=3)
+        for year in (2010, 2011, 2012):
+            self.assertIn(f"{year}-01-01", hb)
+        self.assertIn("2010-07-04", hb)  # 2010 is the most recently used now.
+        self.assertIn("2013-01-01", hb)
+        self.assertEqual(hb.years, {2010, 2012, 2013})
+        self.assertEqual({dt.year for dt in hb}, {2010, 2012, 2013})
+
+        # Evicted years are calculated again.
+        self.assertIn("2011-01-01", hb)
+        self.assertEqual(hb.years, {2010, 2011, 2013})
+
+        # Years required by a single request are kept calculated.
+        self.assertEqual(
+            hb[date(2005, 1, 1) : date(2014, 1, 1)],
+            CountryStub1()[date(2005, 1, 1) : date(2014, 1, 1)],
+        )
+        self.assertEqual(len(hb.years), 3)
+
+        hb = CountryStub1(years=range(2010, 2020), max_years=3)
+        self.assertEqual(hb.years, {2017, 2018, 2019})
+        self.assertEqual(hb, CountryStub1(years=range(2017, 2020)))
+
+    def test_min_max_year(self):
+        hb = CountryStub1(years=1900, min_year=2000, max_year=2100)
+        self.assertIn("1900-01-01", hb)
+        self.assertIn("2000-01-01", hb)
+        self.assertIn("2100-01-01", hb)
+        self.assertNotIn("1999-01-01", hb)
+        self.assertNotIn("2101-01-01", hb)
+        self.assertNotIn(32503680000, hb)
+        self.assertEqual(hb.years, {1900, 2000, 2100})
+
+
+class TestNameInterning(unittest.TestCase):
+    def test_merge_names(self):
+        hb = CountryStub1()
+        hb["2014-01-02"] = "Holiday B"
+        hb["2014-01-02"] = "Holiday A"
+        hb["2014-01-02"] = "Holiday B"
+        self.assertEqual(hb["2014-01-02"], HOLIDAY_NAME_DELIMITER.join(("Holiday A", "Holiday B")))
+
+        # Names containing the delimiter are split.
+        hb["2014-01-03"] = "C"
+        hb["2014-01-03"] = HOLIDAY_NAME_DELIMITER.join(("B", "Z"))
+        self.assertEqual(hb["2014-01-03"], HOLIDAY_NAME_DELIMITER.join(("B", "C", "Z")))
+        hb["2014-01-03"] = HOLIDAY_NAME_DELIMITER.join(("A", "C"))
+        self.assertEqual(hb["2014-01-03"], HOLIDAY_NAME_DELIMITER.join(("A", "B", "C", "Z")))
+        hb["2014-01-03"] = "D"
+        self.assertEqual(hb["2014-01-03"], HOLIDAY_NAME_DELIMITER.join(("A", "B", "C", "D", "Z")))
+
+    def test_shared_names(self):
+        hb_1 = CountryStub1(years=2014)
+        hb_2 = CountryStub1(years=2015, compact=True)
+        self.assertIs(hb_1["2014-07-04"], hb_2["2015-07-04"])
+
+    def test_user_names(self):
+        name_table = CountryStub1(years=(2014, 2015))._name_table
+        names_count = len(name_table.names)
+        for compact in (False, True):
+            hb = CountryStub1(years=2014, compact=compact)
+            hb["2014-07-04"] = "User Holiday"
+            hb["2014-07-05"] = "User Holiday"
+            hb.update({"2014-07-06": "Other User Holiday"})
+            self.assertEqual(
+                hb["2014-07-04"], HOLIDAY_NAME_DELIMITER.join(("Independence Day", "User Holiday"))
+            )
+            self.assertEqual(hb["2014-07-05"], "User Holiday")
+            self.assertEqual(hb["2014-07-06"], "Other User Holiday")
+            self.assertEqual(pickle.loads(pickle.dumps(hb)), hb)
+
+            # Names produced by the entity are merged with user names.
+            hb["2015-01-01"] = "User Holiday"
+            self.assertEqual(
+                hb["2015-01-01"], HOLIDAY_NAME_DELIMITER.join(("New Year's Day", "User Holiday"))
+            )
+            self.assertEqual(hb.pop("2014-07-05"), "User Holiday")
+
+        self.assertEqual(len(name_table.names), names_count)
+        self.assertNotIn("User Holiday", name_table.ids)
+
+    def test_translations(self):
+        de_holidays = Germany(years=2022, language="de")
+        de_en_holidays = Germany(years=2022, language="en_US")
+        self.assertEqual(de_holidays["2022-12-25"], "Erster Weihnachtstag")
+        self.assertEqual(de_en_holidays["2022-12-25"], "Christmas Day")
+        self.assertIsNot(de_holidays._name_table, de_en_holidays._name_table)
+        self.assertIs(de_en_holidays._name_table, Germany(language="en_US")._name_table)
+
+
 class TestPop(unittest.TestCase):
     def setUp(self):
         self.hb = CountryStub1()
@@ -704,6 +1575,99 @@ class TestPopNamed(unittest.TestCase):
         self.assertRaises(KeyError, lambda: self.hb.pop_named("New Year"))
 
 
+class TestPopulationCache(unittest.TestCase):
+    def setUp(self):
+        HolidayBase.set_cache_size(16)
+        HolidayBase.cache_clear()
+
+    def tearDown(self):
+        HolidayBase.set_cache_size(0)
+        HolidayBase.cache_clear()
+
+    def test_cache(self):
+        hb_1 = CountryStub1(years=2014)
+        self.assertEqual(HolidayBase.cache_info(), (0, 1, 16, 1))
+        hb_2 = CountryStub1(years=2014)
+        self.assertEqual(HolidayBase.cache_info(), (1, 1, 16, 1))
+        self.assertEqual(hb_1, hb_2)
+
+        self.assertIn("2015-01-01", hb_2)
+        CountryStub1(years=(2014, 2015))
+        self.assertEqual(HolidayBase.cache_info(), (3, 2, 16, 2))
+
+        HolidayBase.cache_clear()
+        self.assertEqual(HolidayBase.cache_info(), (0, 0, 16, 0))
+
+    def test_cache_disabled(self):
+        HolidayBase.set_cache_size(0)
+        CountryStub1(years=2014)
+        CountryStub1(years=2014)
+        self.assertEqual(HolidayBase.cache_info(), (0, 0, 0, 0))
+        self.assertRaises(ValueError, lambda: HolidayBase.set_cache_size(-1))
+
+    def test_cache_key(self):
+        CountryStub1(years=2014)
+        CountryStub1(years=2014, observed=False)
+        CountryStub1(years=2014, subdiv="Subdiv1")
+        CountryStub1(years=2014, language="fr")
+        CountryStub2(years=2014)
+        self.assertEqual(HolidayBase.cache_info(), (0, 5, 16, 5))
+
+        self.assertEqual(
+            CountryStub1(years=2014, subdiv="Subdiv1"), CountryStub1(years=2014, subdiv="Subdiv1")
+        )
+        self.assertEqual(HolidayBase.cache_info().hits, 2)
+
+    def test_cache_size(self):
+        CountryStub1(years=range(2000, 2020))
+        self.assertEqual(HolidayBase.cache_info().currsize, 16)
+
+        HolidayBase.set_cache_size(4)
+        self.assertEqual(HolidayBase.cache_info(), (0, 20, 4, 4))
+        CountryStub1(years=range(2016, 2020))
+        self.assertEqual(HolidayBase.cache_info().hits, 4)
+
+    def test_populated_attributes(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for code, subdivs in list_supported_countries().items():
+                for subdiv in (None, *subdivs):
+                    for years in (2010, 2020, (2010, 2020)):
+                        HolidayBase.set_cache_size(0)
+                        uncached = country_holidays(code, subdiv=subdiv, years=years)
+                        HolidayBase.set_cache_size(16)
+                        # The second object is populated from the cache.
+                        for _ in range(2):
+                            cached = country_holidays(code, subdiv=subdiv, years=years)
+                            self.assertEqual(cached, uncached)
+                            self.assertEqual(cached.weekend, uncached.weekend, code)
+                            self.assertEqual(cached.subdiv, uncached.subdiv, code)
+
+        self.assertEqual(country_holidays("MY", subdiv="JHR", years=2020).weekend, {FRI, SAT})
+        self.assertEqual(country_holidays("GU", years=2020).subdiv, "GU")
+
+    def test_holiday_sum(self):
+        hb = CountryStub1(years=2014) + CountryStub2(years=2014)
+        self.assertEqual(HolidayBase.cache_info().currsize, 2)
+        self.assertEqual(hb["2014-03-01"], "Custom March 1st Holiday")
+
+    def test_modification(self):
+        hb_1 = CountryStub1(years=2014)
+        hb_1.pop("2014-01-01")
+        hb_1.update({"2014-07-04": "Custom Holiday"})
+        hb_1.observed = False
+
+        hb_2 = CountryStub1(years=2014)
+        self.assertEqual(hb_2["2014-01-01"], "New Year's Day")
+        self.assertEqual(hb_2["2014-07-04"], "Independence Day")
+        self.assertEqual(hb_1["2014-07-04"], "Independence Day")
+
+        hb_3 = CountryStub1(years=2014)
+        hb_3.update({"2014-07-04": "Custom Holiday"})
+        self.assertIn("2015-07-04", hb_3)
+        self.assertEqual(hb_3["2014-07-04"], "Custom Holiday; Independence Day")
+
+
 class TestRepr(unittest.TestCase):
     def test_country(self):
         hb = CountryStub1()
@@ -728,6 +1692,17 @@ class TestSerialization(unittest.TestCase):
         self.assertEqual(loaded_holidays, self.hb)
         self.assertIn(dt, self.hb)
 
+    def test_pickle_without_name_table_key(self):
+        state = self.hb.__getstate__()
+        del state["_name_table_key"]
+        hb = CountryStub1.__new__(CountryStub1)
+        dict.update(hb, self.hb)
+        hb.__setstate__(state)
+
+        self.assertEqual(hb._name_table_key, (CountryStub1, ()))
+        self.assertEqual(hb, self.hb)
+        self.assertEqual(hb["2030-01-01"], "New Year's Day")
+
 
 class TestSpecialHolidays(unittest.TestCase):
     def setUp(self):
@@ -818,6 +1793,27 @@ class TestStandardMethods(unittest.TestCase):
         self.assertRaises(AttributeError, lambda: self.hb._add_holiday_1st_fri_before_nam_29(name))
         self.assertRaises(AttributeError, lambda: self.hb._add_holiday_1st_fri_random_jan_29(name))
 
+    def test_getattr_method_caching(self):
+        class EntityStubGetattr(HolidayBase):
+            pass
+
+        name = "_add_holiday_2nd_tue_of_oct"
+        self.assertNotIn(name, vars(EntityStubGetattr))
+
+        hb = EntityStubGetattr()
+        hb._populate(2023)
+        self.assertEqual(hb._add_holiday_2nd_tue_of_oct("Test"), date(2023, 10, 10))
+        self.assertIn(name, vars(EntityStubGetattr))
+        self.assertNotIn(name, vars(HolidayBase))
+
+        # The method is resolved regularly now and still uses the current year.
+        hb._populate(2024)
+        self.assertEqual(getattr(hb, name)("Test"), date(2024, 10, 8))
+        self.assertEqual(getattr(EntityStubGetattr(), name).__self__.__class__, EntityStubGetattr)
+
+        self.assertFalse(hasattr(hb, "_add_holiday_2nd_tue_of_nam"))
+        self.assertNotIn("_add_holiday_2nd_tue_of_nam", vars(EntityStubGetattr))
+
     def test_getitem(self):
         self.assertEqual(self.hb["2014-01-01"], "New Year's Day")
         self.assertEqual(self.hb.get("2014-01-01"), "New Year's Day")
@@ -855,6 +1851,48 @@ class TestStandardMethods(unittest.TestCase):
         self.assertRaises(TypeError, lambda: self.hb["2014-01-01":"2014-01-02":""])
         self.assertRaises(ValueError, lambda: self.hb["2014-01-01":"2014-01-02":0])
 
+    def test_getitem_slice_multiple_years(self):
+        hb = CountryStub1(years=range(2010, 2016))
+        dts = sorted(dt for dt in hb.keys() if dt.year < 2015)
+        self.assertListEqual(hb["2010-01-01":"2015-01-01"], dts)
+        self.assertListEqual(hb["2015-01-01":"2010-01-01"], [date(2015, 1, 1)] + dts[:0:-1])
+        self.assertSetEqual(hb.years, {2010, 2011, 2012, 2013, 2014, 2015})
+
+        hb = CountryStub1()
+        self.assertEqual(len(hb["2010-01-01":"2015-01-01"]), 32)
+        self.assertSetEqual(hb.years, {2010, 2011, 2012, 2013, 2014, 2015})
+
+        hb = CountryStub1(years=2014, expand=False)
+        self.assertListEqual(hb["2013-12-24":"2014-01-02"], [date(2014, 1, 1)])
+        self.assertSetEqual(hb.years, {2014})
+
+    def test_getitem_slice_after_modification(self):
+        self.assertListEqual(
+            self.hb["2014-12-24":"2015-01-02"], [date(2014, 12, 25), date(2015, 1, 1)]
+        )
+
+        self.hb.update({"2014-12-26": "Custom Holiday"})
+        self.assertListEqual(
+            self.hb["2014-12-24":"2015-01-02"],
+            [date(2014, 12, 25), date(2014, 12, 26), date(2015, 1, 1)],
+        )
+
+        self.hb.pop("2014-12-25")
+        self.assertListEqual(
+            self.hb["2014-12-24":"2015-01-02"], [date(2014, 12, 26), date(2015, 1, 1)]
+        )
+
+        self.hb.pop_named("Custom Holiday")
+        self.assertListEqual(self.hb["2014-12-24":"2015-01-02"], [date(2015, 1, 1)])
+
+        del self.hb[date(2015, 1, 1)]
+        self.assertListEqual(self.hb["2014-12-24":"2015-01-02"], [])
+
+        self.hb.observed = False
+        self.assertListEqual(
+            self.hb["2014-12-24":"2015-01-02"], [date(2014, 12, 25), date(2015, 1, 1)]
+        )
+
     def test_radd(self):
         self.assertRaises(TypeError, lambda: 1 + CountryStub1())
 
@@ -9,9 +9,12 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import subprocess
+import sys
 from unittest import TestCase
 
 import holidays
+from holidays.registry import EntityLoader
 
 
 class TestHolidaysImports(TestCase):
@@ -31,10 +34,43 @@ class TestHolidaysImports(TestCase):
         ):
             self.assertImport(name)
 
+    def test_entities(self):
+        for name in ("US", "USA", "UnitedStates", "ECB", "NYSE", "XNYS"):
+            self.assertImport(name)
+            self.assertIsInstance(getattr(holidays, name), EntityLoader)
+
+        self.assertIs(holidays.US, holidays.US)
+        self.assertIn("US", holidays.__all__)
+        self.assertIn("US", dir(holidays))
+
     def test_holidays_base(self):
         for name in ("DateLike", "HolidayBase", "HolidaySum"):
             self.assertImport(name)
 
+    def test_lazy_import(self):
+        modules = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import sys, holidays; print(' '.join(sorted(sys.modules)))",
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        for name in ("dateutil.parser", "holidays.holiday_base", "numpy"):
+            self.assertNotIn(name, modules)
+
+    def test_star_import(self):
+        scope = {}
+        exec("from holidays import *", scope)
+        for name in ("country_holidays", "EntityLoader", "HolidayBase", "MON", "US", "NYSE"):
+            self.assertIn(name, scope)
+
+    def test_unknown_name(self):
+        self.assertRaises(AttributeError, lambda: holidays.XX)
+        self.assertFalse(hasattr(holidays, "_unknown"))
+
     def test_utils(self):
         for name in (
             "country_holidays",
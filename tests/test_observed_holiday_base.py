@@ -0,0 +1,138 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import copy
+import pickle
+import random
+import unittest
+import warnings
+from datetime import date
+from datetime import timedelta as td
+
+from holidays import observed_holiday_base
+from holidays.constants import DEC, JAN
+from holidays.observed_holiday_base import (
+    SAT_SUN_TO_NEXT_WORKDAY,
+    SAT_TO_NEXT_MON,
+    SUN_TO_NEXT_TUE,
+    ObservedHolidayBase,
+    ObservedRule,
+)
+from holidays.utils import country_holidays, list_supported_countries
+
+RULES = [
+    value for value in vars(observed_holiday_base).values() if isinstance(value, ObservedRule)
+]
+
+
+def get_observed_date(holidays, dt, rule):
+    """Reference implementation looking up the observed date day by day."""
+    delta = rule.get(dt.weekday(), 0)
+    if abs(delta) == 7:
+        delta //= 7
+        dt += td(days=delta)
+        while dt.year == holidays._year and (dt in holidays or holidays._is_weekend(dt)):
+            dt += td(days=delta)
+    else:
+        dt += td(days=delta)
+    return dt
+
+
+class TestObservedRule(unittest.TestCase):
+    def test_add(self):
+        rule = SAT_TO_NEXT_MON + SUN_TO_NEXT_TUE
+        self.assertIsInstance(rule, ObservedRule)
+        self.assertEqual(rule, {5: 2, 6: 2})
+        self.assertEqual(rule.deltas, (0, 0, 0, 0, 0, 2, 2))
+
+    def test_deltas(self):
+        for rule in RULES:
+            self.assertEqual(rule.deltas, tuple(rule.get(weekday, 0) for weekday in range(7)))
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            rule = pickle.loads(pickle.dumps(SAT_SUN_TO_NEXT_WORKDAY, protocol=protocol))
+            self.assertIsInstance(rule, ObservedRule)
+            self.assertEqual(rule, SAT_SUN_TO_NEXT_WORKDAY)
+            self.assertEqual(rule.deltas, SAT_SUN_TO_NEXT_WORKDAY.deltas)
+        self.assertEqual(copy.deepcopy(SAT_TO_NEXT_MON).deltas, SAT_TO_NEXT_MON.deltas)
+
+
+class TestObservedDate(unittest.TestCase):
+    def test_all_countries(self):
+        rnd = random.Random(2023)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for code in list_supported_countries():
+                year = rnd.randint(1950, 2050)
+                for compact in (False, True):
+                    holidays = country_holidays(code, years=year, compact=compact)
+                    if not isinstance(holidays, ObservedHolidayBase):
+                        continue
+
+                    holidays._year = year
+                    holidays.weekend = set(rnd.sample(range(7), rnd.randint(0, 3)))
+                    dates = [dt for dt in holidays if dt.year == year]
+                    dates += [date(year, 1, 1) + td(days=rnd.randint(0, 364)) for _ in range(20)]
+                    for dt in dates:
+                        for rule in RULES:
+                            self.assertEqual(
+                                holidays._get_observed_date(dt, rule),
+                                get_observed_date(holidays, dt, rule),
+                                f"{code} {dt} {dict(rule)}",
+                            )
+
+
+class ObservedStub(ObservedHolidayBase):
+    country = "OS"
+    observed_label = "%s (Observed)"
+    multiple = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(observed_rule=SAT_SUN_TO_NEXT_WORKDAY, *args, **kwargs)
+
+    def _populate(self, year):
+        super()._populate(year)
+        dts_observed = {
+            self._add_holiday("Boxing Day", DEC, 26),
+            self._add_holiday("Day Off", DEC, 26),
+            self._add_holiday("New Year's Day", JAN, 1),
+            self._add_holiday("Christmas Day", DEC, 25),
+        }
+        if self.observed:
+            self._populate_observed(dts_observed, multiple=self.multiple)
+
+
+class MultipleObservedStub(ObservedStub):
+    multiple = True
+
+
+class TestPopulateObserved(unittest.TestCase):
+    def test_multiple(self):
+        holidays = MultipleObservedStub(years=2021)
+        self.assertEqual(holidays["2021-12-27"], "Christmas Day (Observed)")
+        self.assertEqual(holidays["2021-12-28"], "Boxing Day (Observed)")
+        self.assertEqual(holidays["2021-12-29"], "Day Off (Observed)")
+        self.assertNotIn("2021-12-30", holidays)
+
+    def test_not_observed(self):
+        holidays = ObservedStub(years=2021, observed=False)
+        self.assertEqual(len(holidays), 3)
+        self.assertNotIn("2021-12-27", holidays)
+
+    def test_single(self):
+        for compact in (False, True):
+            holidays = ObservedStub(years=2021, compact=compact)
+            self.assertEqual(holidays["2021-12-27"], "Christmas Day (Observed)")
+            self.assertEqual(holidays["2021-12-28"], "Boxing Day (Observed); Day Off (Observed)")
+            self.assertNotIn("2021-12-29", holidays)
+            # New Year's Day (Friday) is not moved.
+            self.assertEqual(len(holidays), 5)
@@ -99,6 +99,64 @@ class TestEntityLoader(TestCase):
             % financial_entities.difference(loader_entities),
         )
 
+    def test_entity_class(self):
+        for code in ("UnitedStates", "US", "USA"):
+            self.assertIs(
+                registry.EntityLoader.get_entity_class(code), getattr(holidays.countries, code)
+            )
+            self.assertIs(
+                registry.EntityLoader.get_entity_class(code, "countries"),
+                getattr(holidays.countries, code),
+            )
+            self.assertIsNone(registry.EntityLoader.get_entity_class(code, "financial"))
+
+        for code in ("NYSE", "XNYS"):
+            self.assertIs(
+                registry.EntityLoader.get_entity_class(code, "financial"),
+                getattr(holidays.financial, code),
+            )
+            self.assertIsNone(registry.EntityLoader.get_entity_class(code, "countries"))
+
+        for code in ("XX", "HolidayBase", "MON", "country_holidays"):
+            self.assertIsNone(registry.EntityLoader.get_entity_class(code))
+
+    def test_entity_metadata(self):
+        # Regenerate the index with `scripts/generate_metadata.py` if it fails.
+        for code, path in registry.EntityLoader.get_entity_paths().items():
+            cls = registry.EntityLoader.get_entity_class(code)
+            self.assertEqual(
+                registry.EntityLoader.get_entity_metadata(code),
+                {
+                    "code": getattr(cls, "country", None) or getattr(cls, "market"),
+                    "default_language": cls.default_language,
+                    "subdivisions": tuple(cls.subdivisions),
+                    "supported_categories": tuple(sorted(cls.supported_categories)),
+                    "supported_languages": tuple(cls.supported_languages),
+                },
+                path,
+            )
+
+        self.assertEqual(
+            registry.EntityLoader.get_entity_metadata("NYSE", "financial")["code"], "NYSE"
+        )
+        self.assertEqual(registry.EntityLoader.get_entity_metadata("UK")["code"], "GB")
+        self.assertIsNone(registry.EntityLoader.get_entity_metadata("NYSE", "countries"))
+        self.assertIsNone(registry.EntityLoader.get_entity_metadata("XX"))
+
+    def test_entity_paths(self):
+        countries_paths = registry.EntityLoader.get_entity_paths("countries")
+        financial_paths = registry.EntityLoader.get_entity_paths("financial")
+        self.assertEqual(countries_paths["GB"], "holidays.countries.united_kingdom.GB")
+        self.assertEqual(countries_paths["UK"], "holidays.countries.united_kingdom.UK")
+        self.assertEqual(financial_paths["TAR"], "holidays.financial.european_central_bank.TAR")
+        self.assertEqual(
+            registry.EntityLoader.get_entity_paths(), {**countries_paths, **financial_paths}
+        )
+        self.assertIs(
+            registry.EntityLoader.get_entity_paths("countries"),
+            registry.EntityLoader.get_entity_paths("countries"),
+        )
+
     def test_financial_str(self):
         self.assertEqual(
             str(registry.EntityLoader("holidays.financial.ny_stock_exchange.NYSE")),
@@ -117,8 +175,9 @@ class TestEntityLoader(TestCase):
 
         for cls in (holidays.UnitedStates, holidays.US, holidays.USA):
             self.assertTrue(isinstance(cls, holidays.registry.EntityLoader))
-            with self.assertRaises(TypeError):
-                create_instance(cls)
+            self.assertTrue(isinstance(create_instance(cls), holidays.countries.UnitedStates))
+
+        self.assertRaises(TypeError, lambda: registry.EntityLoader("holidays.US", object))
 
         for cls in (
             holidays.countries.UnitedStates,
@@ -0,0 +1,115 @@
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import os
+import tempfile
+import unittest
+from datetime import date
+
+import holidays
+from holidays.snapshot import HolidaysSnapshot, build_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp_dir.name, "holidays.snapshot")
+        build_snapshot(
+            cls.path, range(2005, 2026), entities=("AT", "DE", "MY", "NYSE", "SA", "US")
+        )
+        cls.snapshot = HolidaysSnapshot(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.snapshot.close()
+        cls.tmp_dir.cleanup()
+
+    def assertSnapshotEqual(self, code, **kwargs):  # noqa: N802
+        for years in (2010, 2025, range(2000, 2010), range(2005, 2021), range(2015, 2030)):
+            snapshot_holidays = self.snapshot.country_holidays(code, years=years, **kwargs)
+            live_holidays = holidays.country_holidays(code, years=years, **kwargs)
+            self.assertEqual(dict(snapshot_holidays), dict(live_holidays))
+            for year in live_holidays.years:
+                self.assertEqual(
+                    snapshot_holidays._get_weekend(year), live_holidays._get_weekend(year)
+                )
+            start, end = date(min(live_holidays.years), 1, 1), date(
+                max(live_holidays.years), 12, 31
+            )
+            self.assertEqual(
+                snapshot_holidays.freeze().business_days_between(start, end),
+                live_holidays.freeze().business_days_between(start, end),
+            )
+
+    def test_build_snapshot_years(self):
+        self.assertRaises(ValueError, lambda: build_snapshot(self.path, ()))
+        self.assertRaises(ValueError, lambda: build_snapshot(self.path, (2020, 2022)))
+
+    def test_country_holidays(self):
+        self.assertSnapshotEqual("US")
+        self.assertSnapshotEqual("US", observed=False)
+        self.assertSnapshotEqual("US", subdiv="CA")
+        self.assertSnapshotEqual("DE", subdiv="BY")
+        self.assertSnapshotEqual("MY", subdiv="JHR")
+
+    def test_categories(self):
+        self.assertSnapshotEqual("AT", categories=("bank",))
+        # Categories combinations are not included into the snapshot.
+        self.assertSnapshotEqual("AT", subdiv="9", categories=("bank", "public"))
+
+    def test_expand(self):
+        us_holidays = self.snapshot.country_holidays("US")
+        self.assertIn("2020-12-25", us_holidays)
+        self.assertIn("2040-12-25", us_holidays)
+        self.assertEqual(us_holidays.years, {2020, 2040})
+        self.assertEqual(us_holidays.country, "US")
+
+    def test_entity_codes(self):
+        for code in ("US", "USA", "UnitedStates"):
+            us_holidays = self.snapshot.country_holidays(code, years=2020)
+            self.assertEqual(dict(us_holidays), dict(holidays.US(years=2020)))
+            # Served from the snapshot, the entity isn't loaded.
+            self.assertEqual(us_holidays._entities, {})
+
+        xnys_holidays = self.snapshot.financial_holidays("XNYS", years=2021)
+        self.assertEqual(dict(xnys_holidays), dict(holidays.NYSE(years=2021)))
+        self.assertEqual(xnys_holidays._entities, {})
+
+    def test_financial_holidays(self):
+        nyse_holidays = self.snapshot.financial_holidays("NYSE", years=2021)
+        self.assertEqual(dict(nyse_holidays), dict(holidays.NYSE(years=2021)))
+        self.assertEqual(nyse_holidays.market, "NYSE")
+
+    def test_invalid_parameters(self):
+        self.assertRaises(
+            NotImplementedError, lambda: self.snapshot.country_holidays("US", subdiv="XX")
+        )
+        self.assertRaises(
+            NotImplementedError,
+            lambda: self.snapshot.country_holidays("US", categories=("unknown",)),
+        )
+
+    def test_invalid_snapshot(self):
+        path = os.path.join(self.tmp_dir.name, "invalid.snapshot")
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(b"\0" * 64)
+        self.assertRaises(ValueError, lambda: HolidaysSnapshot(path))
+
+    def test_language(self):
+        self.assertSnapshotEqual("SA")
+        # 2010-01-07 and 2010-01-08 were weekend days in Saudi Arabia.
+        self.assertEqual(
+            self.snapshot.country_holidays("SA").next_business_day("2010-01-06"),
+            date(2010, 1, 9),
+        )
+        self.assertSnapshotEqual("SA", language="en_US")
+        self.assertSnapshotEqual("DE", language="en_US")
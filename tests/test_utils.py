@@ -9,6 +9,7 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import subprocess
 import sys
 import unittest
 import warnings
@@ -27,6 +28,8 @@ from holidays.utils import (
     list_localized_financial,
     list_supported_countries,
     list_supported_financial,
+    preload_translations,
+    warmup,
 )
 from tests.common import PYTHON_VERSION
 
@@ -54,6 +57,11 @@ class TestCountryHolidays(unittest.TestCase):
         h = country_holidays("AU", subdiv="NT")
         self.assertEqual(h.subdiv, "NT")
 
+    def test_country_entity_codes(self):
+        self.assertEqual(country_holidays("USA").country, "US")
+        self.assertEqual(country_holidays("UnitedStates").country, "US")
+        self.assertEqual(country_holidays("NYSE").market, "NYSE")
+
     def test_exceptions(self):
         self.assertRaises(NotImplementedError, lambda: country_holidays("XXXX"))
         self.assertRaises(NotImplementedError, lambda: country_holidays("US", subdiv="XXXX"))
@@ -83,6 +91,11 @@ class TestFinancialHolidays(unittest.TestCase):
         h = financial_holidays("NYSE", years=(2015, 2016))
         self.assertEqual(h.years, {2015, 2016})
 
+    def test_market_entity_codes(self):
+        self.assertEqual(financial_holidays("XNYS").market, "NYSE")
+        self.assertEqual(financial_holidays("NewYorkStockExchange").market, "NYSE")
+        self.assertEqual(financial_holidays("US").country, "US")
+
     def test_exceptions(self):
         self.assertRaises(NotImplementedError, lambda: financial_holidays("XXXX"))
         self.assertRaises(NotImplementedError, lambda: financial_holidays("NYSE", subdiv="XXXX"))
@@ -203,6 +216,22 @@ class TestListLocalizedEntities(unittest.TestCase):
 
 
 class TestListSupportedEntities(unittest.TestCase):
+    def test_list_supported_entities_imports(self):
+        modules = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import sys, holidays; "
+                "holidays.list_supported_countries(); holidays.list_localized_financial(); "
+                "print(' '.join(sorted(sys.modules)))",
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        self.assertNotIn("holidays.countries", modules)
+        self.assertNotIn("holidays.financial", modules)
+
     def test_list_supported_countries(self):
         supported_countries = list_supported_countries(include_aliases=False)
 
@@ -239,3 +268,62 @@ class TestListSupportedEntities(unittest.TestCase):
             len(financial_files),
             len(supported_financial),
         )
+
+
+class TestPreloadTranslations(unittest.TestCase):
+    def test_invalid_entity(self):
+        self.assertRaises(NotImplementedError, lambda: preload_translations(("XXA",)))
+
+    def test_preload_translations(self):
+        preload_translations(("DE", "NYSE"), languages=("en_US", "xx"))
+        translations = holidays.holiday_base._translations
+        self.assertIn(("DE", "en_US", ()), translations)
+        self.assertNotIn(("DE", "xx", ()), translations)
+
+        with mock.patch("holidays.holiday_base.translation") as translation:
+            de_holidays = holidays.DE(years=2022, language="en_US")
+        translation.assert_not_called()
+        self.assertEqual(de_holidays["2022-12-25"], "Christmas Day")
+
+    def test_translations_environment(self):
+        with mock.patch.dict("os.environ", {"LANGUAGE": "uk"}):
+            self.assertEqual(holidays.DE(years=2022)["2022-12-25"], "Перший день Різдва")
+        with mock.patch.dict("os.environ", {"LANGUAGE": "en_US"}):
+            self.assertEqual(holidays.DE(years=2022)["2022-12-25"], "Christmas Day")
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self):
+        holidays.HolidayBase.cache_clear()
+        holidays.HolidayBase.set_cache_size(0)
+
+    def tearDown(self):
+        holidays.HolidayBase.cache_clear()
+        holidays.HolidayBase.set_cache_size(0)
+
+    def test_no_years(self):
+        warmup(("DE", "NYSE"))
+        self.assertEqual(holidays.HolidayBase.cache_info().currsize, 0)
+        self.assertTrue(
+            any(key[:2] == ("DE", None) for key in holidays.holiday_base._translations)
+        )
+
+    def test_warmup(self):
+        warmup(("DE", "NYSE"), years=(2021, 2022), subdivs="all", languages=("en_US", "xx"))
+        # DE: entity-wide and subdivisions in 2 languages, NYSE: entity-wide.
+        expected_size = ((1 + len(holidays.DE.subdivisions)) * 2 + 1) * 2
+        self.assertEqual(holidays.HolidayBase.cache_info().currsize, expected_size)
+        self.assertEqual(holidays.HolidayBase.cache_info().maxsize, expected_size)
+
+        with mock.patch("holidays.holiday_base.translation") as translation:
+            de_holidays = country_holidays("DE", subdiv="BY", years=2022, language="en_US")
+        translation.assert_not_called()
+        self.assertEqual(holidays.HolidayBase.cache_info().hits, 1)
+        self.assertEqual(de_holidays["2022-12-25"], "Christmas Day")
+
+    def test_warmup_subdiv(self):
+        warmup(("DE", "US"), years=2022, subdivs="BY")
+        self.assertEqual(holidays.HolidayBase.cache_info().currsize, 3)
+        holidays.DE(subdiv="BY", years=2022)
+        holidays.US(years=2022)
+        self.assertEqual(holidays.HolidayBase.cache_info().hits, 2)